@@ -27,7 +27,7 @@ from constants import (
 )
 from services import ConfigService, GlobalHotkeyService
 from views.main_view import MainView
-from utils import logger
+from utils import logger, prefetch_system_fonts
 
 
 def main(page: ft.Page) -> None:
@@ -152,6 +152,9 @@ def main(page: ft.Page) -> None:
     
     page.run_task(push_initial_route)
     
+    # 后台预取系统字体列表，打开设置页时无需再等待枚举
+    prefetch_system_fonts()
+    
     # 应用窗口透明度（在首次路由后应用）
     if hasattr(main_view, '_pending_opacity'):
         page.window.opacity = main_view._pending_opacity
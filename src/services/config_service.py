@@ -5,16 +5,104 @@
 配置以加密形式存储（Fernet / AES-128），密钥基于机器特征自动派生。
 """
 
+import atexit
 import getpass
 import hashlib
+import itertools
 import json
+import os
 import platform
 import re
+import threading
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from flet.security import encrypt, decrypt
 
+from utils import logger
+
+
+# 所有存活的后台写入器（弱引用，不阻止 ConfigService 实例被回收），退出时统一刷新
+_ACTIVE_WRITERS: "weakref.WeakSet[_ConfigWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_writers() -> None:
+    """进程退出前等待所有写入器写完已提交的快照。"""
+    for writer in list(_ACTIVE_WRITERS):
+        writer.flush()
+
+
+class _ConfigWriter:
+    """后台配置写入线程。
+    
+    多次提交之间只保留最新的配置快照，连续修改（如拖动滑块）只产生一次磁盘写入，
+    加密与 fsync 都不再占用 UI 线程。空闲一段时间后线程自动退出，不会长期持有写入器。
+    """
+    
+    # 写入线程空闲多久后退出（秒），下次提交时重新启动
+    _IDLE_TIMEOUT = 5.0
+    
+    def __init__(
+        self,
+        write_func: Callable[[int, str], None],
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """初始化写入线程。
+        
+        Args:
+            write_func: 实际写盘函数，参数为 (快照序号, 配置 JSON 字符串)
+            on_error: 写盘失败时的回调（在写入线程中调用）
+        """
+        self._write_func = write_func
+        self._on_error = on_error
+        self._cond = threading.Condition()
+        self._pending: Optional[Tuple[int, str]] = None
+        self._busy: bool = False
+        self._thread: Optional[threading.Thread] = None
+        _ACTIVE_WRITERS.add(self)
+    
+    def submit(self, seq: int, json_str: str) -> None:
+        """提交配置快照，覆盖尚未写入的旧快照。"""
+        with self._cond:
+            self._pending = (seq, json_str)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ConfigWriter", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+    
+    def flush(self, timeout: float = 3.0) -> None:
+        """等待所有已提交的快照写入完成。"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending is None and not self._busy, timeout)
+    
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._cond.wait_for(lambda: self._pending is not None, self._IDLE_TIMEOUT):
+                    # 空闲退出，释放对写入器（及其 ConfigService）的引用
+                    self._thread = None
+                    return
+                seq, json_str = self._pending
+                self._pending = None
+                self._busy = True
+            try:
+                self._write_func(seq, json_str)
+            except Exception as e:
+                # 后台写盘失败始终记录日志，界面层回调只是额外通知
+                logger.error(f"后台保存配置失败: {e}")
+                if self._on_error is not None:
+                    try:
+                        self._on_error(e)
+                    except Exception:
+                        pass
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
 
 class ConfigService:
     """配置服务类。
@@ -36,6 +124,14 @@ class ConfigService:
         self._config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file: Path = self._config_dir / self._CONFIG_FILENAME
         self.config: Dict[str, Any] = self._load_config()
+        
+        # 保存序号：保证较旧的快照不会覆盖已写入的较新配置
+        self._save_seq = itertools.count(1)
+        self._written_seq: int = 0
+        self._write_lock = threading.Lock()
+        self._writer = _ConfigWriter(self._write_snapshot_durable, self._on_background_write_error)
+        # 后台写盘失败时的通知回调（由界面层设置，在写入线程中调用）
+        self.write_error_callback: Optional[Callable[[Exception], None]] = None
     
     @staticmethod
     def _derive_secret_key() -> str:
@@ -46,8 +142,10 @@ class ConfigService:
         raw = f"MTools:{getpass.getuser()}@{platform.node()}"
         return hashlib.sha256(raw.encode()).hexdigest()
 
-    def _get_default_data_dir(self) -> Path:
-        """获取默认数据目录（遵循平台规范）。
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_default_data_dir() -> Path:
+        """获取默认数据目录（遵循平台规范，进程内不会变化，结果缓存）。
         
         Returns:
             默认数据目录路径
@@ -85,8 +183,56 @@ class ConfigService:
     def _encrypt_and_write(self, data: Dict[str, Any], path: Path) -> None:
         """将配置字典加密后写入文件。"""
         json_str = json.dumps(data, ensure_ascii=False, indent=2)
+        self._write_encrypted(json_str, path)
+
+    def _write_encrypted(self, json_str: str, path: Path) -> None:
+        """加密 JSON 字符串并原子写入文件（先写临时文件再替换，不做 fsync）。"""
+        tmp_path = path.with_name(path.name + ".tmp")
+        self._write_temp_file(json_str, tmp_path)
+        os.replace(tmp_path, path)
+
+    def _write_temp_file(self, json_str: str, tmp_path: Path, fsync: bool = False) -> None:
+        """加密 JSON 字符串并写入临时文件。
+
+        Args:
+            json_str: 配置 JSON 字符串
+            tmp_path: 临时文件路径
+            fsync: 是否在关闭前强制落盘（仅后台写入线程使用，避免拖慢界面线程）
+        """
         encrypted = encrypt(json_str, self._secret_key)
-        path.write_text(encrypted, encoding="utf-8")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(encrypted)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _write_snapshot(self, seq: int, json_str: str) -> None:
+        """同步写入指定序号的配置快照，已写入更新的快照时跳过。"""
+        with self._write_lock:
+            if seq < self._written_seq:
+                return
+            self._write_encrypted(json_str, self.config_file)
+            self._written_seq = seq
+
+    def _write_snapshot_durable(self, seq: int, json_str: str) -> None:
+        """后台线程写入配置快照：加密与 fsync 在锁外完成，仅替换文件时持锁。
+
+        同步保存因此不会等待后台线程的 fsync。
+        """
+        tmp_path = self.config_file.with_name(self.config_file.name + ".bg.tmp")
+        self._write_temp_file(json_str, tmp_path, fsync=True)
+        with self._write_lock:
+            if seq < self._written_seq:
+                tmp_path.unlink(missing_ok=True)
+                return
+            os.replace(tmp_path, self.config_file)
+            self._written_seq = seq
+
+    def _on_background_write_error(self, error: Exception) -> None:
+        """后台写盘失败时转发给界面层设置的回调。"""
+        callback = self.write_error_callback
+        if callback is not None:
+            callback(error)
 
     def _read_and_decrypt(self, path: Path) -> Dict[str, Any]:
         """从加密文件读取并解密为配置字典。
@@ -234,14 +380,24 @@ class ConfigService:
 
         return config
 
-    def save_config(self) -> bool:
+    def save_config(self, background: bool = False) -> bool:
         """保存配置到加密文件。
         
+        Args:
+            background: 是否交给后台线程写入（连续提交会被合并为一次写盘）
+        
         Returns:
-            是否保存成功
+            同步写入时表示是否已保存成功；后台写入时仅表示快照已提交，
+            尚未落盘，写盘失败会记录日志并通知 ``write_error_callback``
         """
         try:
-            self._encrypt_and_write(self.config, self.config_file)
+            # 在调用线程生成快照，避免后台写入期间配置被修改
+            json_str = json.dumps(self.config, ensure_ascii=False, indent=2)
+            seq = next(self._save_seq)
+            if background:
+                self._writer.submit(seq, json_str)
+            else:
+                self._write_snapshot(seq, json_str)
             return True
         except Exception:
             return False
@@ -422,18 +578,44 @@ class ConfigService:
         """
         return self.config.get(key, default)
     
-    def set_config_value(self, key: str, value: Any) -> bool:
+    def get_many(self, keys_with_defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """一次性批量获取多个配置值。
+        
+        Args:
+            keys_with_defaults: 配置键到默认值的映射
+        
+        Returns:
+            配置键到配置值的映射
+        """
+        config = self.config
+        return {key: config.get(key, default) for key, default in keys_with_defaults.items()}
+    
+    def set_config_value(self, key: str, value: Any, background: bool = False) -> bool:
         """设置配置值。
         
         Args:
             key: 配置键
             value: 配置值
+            background: 是否在后台线程写盘
         
         Returns:
-            是否设置成功
+            是否设置成功（后台写盘时仅表示已提交，见 ``save_config``）
         """
         self.config[key] = value
-        return self.save_config()
+        return self.save_config(background=background)
+    
+    def set_many(self, values: Dict[str, Any], background: bool = False) -> bool:
+        """批量设置多个配置值，只写盘一次。
+        
+        Args:
+            values: 配置键到配置值的映射
+            background: 是否在后台线程写盘
+        
+        Returns:
+            是否设置成功（后台写盘时仅表示已提交，见 ``save_config``）
+        """
+        self.config.update(values)
+        return self.save_config(background=background)
     
     def record_tool_usage(self, tool_name: str) -> None:
         """记录工具使用次数。
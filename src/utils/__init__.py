@@ -13,6 +13,7 @@ from .file_utils import (
     list_files_by_extension,
     move_file,
     pick_files,
+    prefetch_system_fonts,
     get_directory_path,
     save_file,
 )
@@ -86,6 +87,7 @@ __all__ = [
     "move_file",
     "get_file_extension",
     "get_system_fonts",
+    "prefetch_system_fonts",
     "get_unique_path",
     "list_files_by_extension",
     "pick_files",
@@ -11,6 +11,8 @@ import platform
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from utils import logger
@@ -286,6 +288,39 @@ def get_system_fonts() -> List[Tuple[str, str]]:
     return unique_fonts
 
 
+_system_fonts_future: Optional[Future] = None
+_system_fonts_lock = threading.Lock()
+
+
+def prefetch_system_fonts(refresh: bool = False) -> Future:
+    """在后台线程枚举系统字体，返回结果的 Future。
+    
+    枚举系统字体较慢，首次调用时启动后台线程，之后重复调用返回同一个 Future，
+    结果在进程内缓存。应用启动时调用一次，打开设置页时字体列表通常已就绪。
+    
+    Args:
+        refresh: 是否丢弃已缓存的结果并重新枚举
+    
+    Returns:
+        结果为字体元组 ((字体名称, 显示名称), ...) 的 Future
+    """
+    global _system_fonts_future
+    with _system_fonts_lock:
+        if _system_fonts_future is not None and not refresh:
+            return _system_fonts_future
+        future: Future = Future()
+        _system_fonts_future = future
+    
+    def _worker() -> None:
+        try:
+            future.set_result(tuple(get_system_fonts()))
+        except Exception as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=_worker, name="system-fonts", daemon=True).start()
+    return future
+
+
 def _get_windows_fonts() -> List[Tuple[str, str]]:
     """获取 Windows 系统字体。
     
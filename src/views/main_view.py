@@ -468,6 +468,8 @@ class MainView(ft.Column):
         self.settings_layer.content = self.settings_view
         self.settings_layer.visible = True
         self.dropzone_wrapper.visible = False
+        # 继续加载上次离开时尚未完成的设置分区
+        self.settings_view.start_startup_load()
     
     def _hide_settings_layer(self) -> None:
         """隐藏设置常驻层并显示主内容层。"""
@@ -475,6 +477,9 @@ class MainView(ft.Column):
         # 卸载设置层内容，避免后续任意 page.update 都遍历巨大设置组件树
         self.settings_layer.content = None
         self.dropzone_wrapper.visible = True
+        # 离开设置页时终止仍在进行的分区加载
+        if self.settings_view is not None:
+            self.settings_view.cancel_startup_load()
     
     def handle_route_change(self, route: str) -> None:
         """处理路由变更。
@@ -1266,7 +1271,12 @@ class MainView(ft.Column):
             )
             self.content_bg.bgcolor = None
 
-    def apply_background(self, image_path: Optional[str], fit_mode: Optional[str]) -> None:
+    def apply_background(
+        self,
+        image_path: Optional[str],
+        fit_mode: Optional[str],
+        defer_update: bool = False,
+    ) -> None:
         """应用背景图片到主界面。
 
         使用 Container + DecorationImage 作为背景层，覆盖整个窗口
@@ -1275,6 +1285,7 @@ class MainView(ft.Column):
         Args:
             image_path: 背景图片路径，None表示清除背景
             fit_mode: 图片适应模式 (cover, contain, fill, none)
+            defer_update: 为 True 时不调用 page.update()，由调用方统一刷新
         """
         if image_path:
             fit_map = {
@@ -1308,13 +1319,13 @@ class MainView(ft.Column):
 
                 self.controls = [self._bg_wrapper]
                 self._apply_bg_opacity_from_config()
-                if self._page:
+                if self._page and not defer_update:
                     self._page.update()
             else:
                 self._bg_decoration.src = image_path
                 self._bg_decoration.fit = fit
                 self._apply_bg_opacity_from_config()
-                if self._page:
+                if self._page and not defer_update:
                     self._page.update()
         else:
             if hasattr(self, '_bg_wrapper') and hasattr(self, '_original_controls'):
@@ -1325,5 +1336,5 @@ class MainView(ft.Column):
                 delattr(self, '_original_controls')
 
                 self._apply_bg_opacity_from_config()
-                if self._page:
+                if self._page and not defer_update:
                     self._page.update()
@@ -5,16 +5,26 @@
 等待后续优化...
 """
 
+import asyncio
+import atexit
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Optional, List, Dict
-import threading
+import hashlib
+import json
 import time
+from types import MappingProxyType
 import os
+import re
+import shutil
+import subprocess
 import sys
-import platform
 import webbrowser
+from urllib.parse import urljoin
 from utils import logger
-from utils.file_utils import get_system_fonts, pick_files, get_directory_path, save_file
+from utils.file_utils import create_desktop_shortcut, pick_files, prefetch_system_fonts, get_directory_path, save_file
 
 import flet as ft
 import httpx
@@ -23,14 +33,341 @@ from constants import (
     APP_VERSION,
     BUILD_CUDA_VARIANT,
     BORDER_RADIUS_MEDIUM,
+    DEFAULT_OCR_MODEL_KEY,
     PADDING_LARGE,
     PADDING_MEDIUM,
     PADDING_SMALL,
+    WINDOW_HEIGHT,
+    WINDOW_WIDTH,
 )
 from services import ConfigService, UpdateService, UpdateInfo, UpdateStatus
 from services.auto_updater import AutoUpdater
 from constants import APP_DESCRIPTION
 
+# 平台判断在进程生命周期内不会变化，模块加载时计算一次
+_IS_WINDOWS = sys.platform == 'win32'
+_IS_MACOS = sys.platform == 'darwin'
+_IS_HOTKEY_SUPPORTED = _IS_WINDOWS or _IS_MACOS  # 全局快捷键仅支持 Windows + macOS
+_IS_WINDOWS_EXE = _IS_WINDOWS and sys.argv[0].endswith('.exe')  # Windows 打包环境
+# 在系统文件管理器中打开目录的命令
+_OPEN_DIR_CMD = ("explorer",) if _IS_WINDOWS else ("open",) if _IS_MACOS else ("xdg-open",)
+
+if _IS_WINDOWS:
+    import winreg
+else:
+    winreg = None
+
+# JSON 解析：安装了 orjson 时使用更快的实现，否则回退到标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# 必应壁纸请求共用的 HTTP 客户端（复用 TLS 连接），首次使用时创建
+_HTTP_CLIENT: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """获取共享的 httpx.Client。"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(
+            timeout=10.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=10),
+            headers={"User-Agent": f"MTools/{APP_VERSION}"},
+        )
+        atexit.register(_HTTP_CLIENT.close)
+    return _HTTP_CLIENT
+
+
+# 必应壁纸接口共用的异步 HTTP 客户端，绑定首次使用时的事件循环
+_ASYNC_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_ASYNC_HTTP_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """获取共享的 httpx.AsyncClient（须在事件循环中调用）。"""
+    global _ASYNC_HTTP_CLIENT, _ASYNC_HTTP_LOOP
+    loop = asyncio.get_running_loop()
+    if _ASYNC_HTTP_CLIENT is None:
+        atexit.register(_close_async_http_client)
+    if _ASYNC_HTTP_CLIENT is None or _ASYNC_HTTP_LOOP is not loop:
+        # 连接池与事件循环绑定，事件循环变化时重新创建
+        _ASYNC_HTTP_CLIENT = httpx.AsyncClient(
+            timeout=10.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=4),
+            headers={"User-Agent": f"MTools/{APP_VERSION}"},
+        )
+        _ASYNC_HTTP_LOOP = loop
+    return _ASYNC_HTTP_CLIENT
+
+
+def _close_async_http_client() -> None:
+    """退出时关闭共享的 httpx.AsyncClient（所属事件循环仍可用时在其中执行 aclose）。"""
+    client, loop = _ASYNC_HTTP_CLIENT, _ASYNC_HTTP_LOOP
+    if client is None or loop is None or loop.is_closed():
+        return
+    try:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=2.0)
+        else:
+            loop.run_until_complete(client.aclose())
+    except Exception:
+        pass
+
+
+# 数据迁移 / 删除旧数据等磁盘 I/O 任务共用的线程池，首次使用时创建
+_IO_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """获取共享的磁盘 I/O 线程池。"""
+    global _IO_EXECUTOR
+    if _IO_EXECUTOR is None:
+        _IO_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mtools-io")
+        atexit.register(_IO_EXECUTOR.shutdown, wait=False)
+    return _IO_EXECUTOR
+
+
+async def _run_io(func, *args):
+    """在共享 I/O 线程池中执行阻塞函数并等待结果。
+    
+    Args:
+        func: 阻塞函数
+        *args: 位置参数
+    
+    Returns:
+        函数返回值
+    """
+    return await asyncio.get_running_loop().run_in_executor(_get_io_executor(), func, *args)
+
+
+@lru_cache(maxsize=1)
+def _cached_ort_providers() -> tuple:
+    """获取 onnxruntime 可用的 Provider 列表（进程内不会变化，只探测一次）。"""
+    try:
+        import onnxruntime as ort
+        return tuple(ort.get_available_providers())
+    except Exception:
+        return ()
+
+
+@lru_cache(maxsize=1)
+def _cached_primary_provider() -> str:
+    """获取主 Provider 类型（缓存）。"""
+    from utils import get_primary_provider
+    return get_primary_provider()
+
+
+@lru_cache(maxsize=1)
+def _cached_cuda_devices() -> tuple:
+    """获取 CUDA 设备列表（缓存，避免重复调用 nvidia-smi）。"""
+    from utils import get_cuda_devices
+    return tuple(get_cuda_devices())
+
+
+@lru_cache(maxsize=None)
+def _format_hotkey(ctrl: bool, alt: bool, shift: bool, key: str) -> str:
+    """格式化快捷键显示文本（macOS 使用符号），组合数量很少，结果全部缓存。"""
+    parts = []
+    if ctrl:
+        parts.append("⌃" if _IS_MACOS else "Ctrl")
+    if alt:
+        parts.append("⌥" if _IS_MACOS else "Alt")
+    if shift:
+        parts.append("⇧" if _IS_MACOS else "Shift")
+    parts.append(key)
+    return "+".join(parts) if parts else "未设置"
+
+
+# with_opacity 结果缓存：(不透明度百分比, 基础颜色) -> 颜色字符串
+_OPACITY_COLOR_CACHE: Dict[tuple, str] = {}
+
+
+def _with_opacity(opacity: float, color: str) -> str:
+    """带缓存的 ft.Colors.with_opacity，不透明度按百分比取整。"""
+    key = (round(opacity * 100), color)
+    cached = _OPACITY_COLOR_CACHE.get(key)
+    if cached is None:
+        cached = _OPACITY_COLOR_CACHE[key] = ft.Colors.with_opacity(key[0] / 100, color)
+    return cached
+
+
+# #RRGGBB 颜色代码格式
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+
+def _is_hex_color(value: str) -> bool:
+    """是否为合法的 #RRGGBB 颜色代码（长度不符时跳过正则匹配）。"""
+    return len(value) == 7 and value[0] == '#' and _HEX_COLOR_RE.match(value) is not None
+
+
+# 开关类设置的提示文案：开关值 -> 提示
+_MSG_RECOMMENDATIONS = MappingProxyType({True: "推荐工具页面已显示", False: "推荐工具页面已隐藏"})
+_MSG_SHOW_WEATHER = MappingProxyType({True: "天气信息已显示", False: "天气信息已隐藏"})
+_MSG_MINIMIZE_TO_TRAY = MappingProxyType({True: "最小化到系统托盘已启用", False: "最小化到系统托盘已禁用"})
+_MSG_AUTO_START = MappingProxyType({True: "开机自启动已启用", False: "开机自启动已禁用"})
+_MSG_GPU_ACCELERATION = MappingProxyType({
+    True: "GPU加速已启用，需重新加载模型生效",
+    False: "GPU加速已禁用，需重新加载模型生效",
+})
+_MSG_MEMORY_ARENA = MappingProxyType({
+    True: "内存池优化已启用，需重新加载模型生效",
+    False: "内存池优化已禁用，需重新加载模型生效",
+})
+_MSG_MODEL_CACHE = MappingProxyType({
+    True: "模型缓存优化已启用（首次加载会较慢，后续启动更快）",
+    False: "模型缓存优化已禁用",
+})
+_COLOR_SUCCESS = ft.Colors.GREEN
+
+
+# 颜色卡片 / 常用颜色文字的公共样式参数
+_CARD_NAME_TEXT_KWARGS = MappingProxyType({"size": 12, "text_align": ft.TextAlign.CENTER})
+_CARD_DESC_TEXT_KWARGS = MappingProxyType({
+    "size": 10,
+    "color": ft.Colors.ON_SURFACE_VARIANT,
+    "text_align": ft.TextAlign.CENTER,
+})
+_PRESET_NAME_TEXT_KWARGS = MappingProxyType({"size": 10, "text_align": ft.TextAlign.CENTER})
+
+# 字体 / 关于分区文字的公共样式参数
+_SECTION_TITLE_TEXT_KWARGS = MappingProxyType({"size": 20, "weight": ft.FontWeight.W_600})
+_LABEL_TEXT_KWARGS = MappingProxyType({"size": 14, "weight": ft.FontWeight.W_500})
+_SUBTLE_TEXT_KWARGS = MappingProxyType({"size": 14, "color": ft.Colors.ON_SURFACE_VARIANT})
+
+# 字体列表项按是否选中区分的样式参数（只含颜色等标量值，控件实例仍逐项创建）
+_FONT_TILE_STYLES = MappingProxyType({
+    False: MappingProxyType({
+        "weight": ft.FontWeight.NORMAL,
+        "color": ft.Colors.ON_SURFACE,
+        "border_color": ft.Colors.TRANSPARENT,
+        "bgcolor": ft.Colors.with_opacity(0.02, ft.Colors.ON_SURFACE),
+    }),
+    True: MappingProxyType({
+        "weight": ft.FontWeight.BOLD,
+        "color": ft.Colors.PRIMARY,
+        "border_color": ft.Colors.PRIMARY,
+        "bgcolor": ft.Colors.with_opacity(0.1, ft.Colors.PRIMARY),
+    }),
+})
+
+# 关于分区的固定文案与链接
+_ABOUT_STATIC_LINES = ("By：一铭", "QQ交流群：1029212047")
+_DOWNLOAD_PAGE_URL = "https://openlist.wer.plus/MTools"
+_GITHUB_URL = "https://github.com/HG-ha/MTools"
+
+# 更新对话框中更新说明的最大字符数
+_RELEASE_NOTES_MAX_CHARS = 500
+
+
+def _truncate_release_notes(notes: str) -> str:
+    """截断过长的更新说明，尽量在行尾截断，避免切断 Markdown 链接或列表项。
+    
+    Args:
+        notes: 原始更新说明
+    
+    Returns:
+        截断后的更新说明
+    """
+    if len(notes) <= _RELEASE_NOTES_MAX_CHARS:
+        return notes
+    cut = notes.rfind("\n", 0, _RELEASE_NOTES_MAX_CHARS)
+    if cut <= 0:
+        cut = _RELEASE_NOTES_MAX_CHARS
+    return notes[:cut].rstrip() + "\n\n..."
+
+
+# 更新下载进度文本模板
+_DL_PROGRESS_FMT = "下载中: %.1fMB / %.1fMB (%.0f%%)"
+
+
+@lru_cache(maxsize=512)
+def _hex_to_rgb_cached(hex_color: str) -> tuple:
+    """将 #RRGGBB 转换为 (r, g, b)，结果缓存。
+    
+    整体解析为一个 24 位整数后按位拆分，只调用一次 int()。
+    """
+    v = int(hex_color[1:] if hex_color[0] == '#' else hex_color, 16)
+    return ((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+
+
+# 主题色预设：(颜色值, 名称, 描述)，主题色卡片与调色盘常用颜色共用
+_THEME_PRESETS = (
+    ("#667EEA", "蓝紫色", "默认"),
+    ("#6366F1", "靛蓝色", "科技感"),
+    ("#8B5CF6", "紫色", "优雅"),
+    ("#EC4899", "粉红色", "活力"),
+    ("#F43F5E", "玫瑰红", "激情"),
+    ("#F97316", "橙色", "温暖"),
+    ("#F59E0B", "琥珀色", "明亮"),
+    ("#10B981", "绿色", "清新"),
+    ("#14B8A6", "青色", "自然"),
+    ("#06B6D4", "天蓝色", "清爽"),
+    ("#0EA5E9", "天空蓝", "开阔"),
+    ("#6B7280", "灰色", "稳重"),
+    ("#1F2937", "深灰", "专业"),
+    ("#000000", "黑色", "经典"),
+)
+
+# 主题色卡片：在公共预设中插入浅灰蓝
+_THEME_CARD_COLORS = _THEME_PRESETS[:5] + (("#D2D5E1", "浅灰蓝", "柔和"),) + _THEME_PRESETS[5:]
+
+# 调色盘常用颜色：(颜色值, 名称, 描述, r, g, b)，在公共预设中插入红色并追加白色
+_PRESET_COLORS_WITH_RGB = tuple(
+    (hex_color, name, desc, *_hex_to_rgb_cached(hex_color))
+    for hex_color, name, desc in (
+        _THEME_PRESETS[:5]
+        + (("#EF4444", "红色", "热烈"),)
+        + _THEME_PRESETS[5:]
+        + (("#FFFFFF", "白色", "纯净"),)
+    )
+)
+
+
+@dataclass(slots=True, frozen=True)
+class ThemeCardStyle:
+    """主题色卡片的样式对象，边框元组按 (未选中, 选中) 索引。"""
+    card_border: tuple  # 卡片边框
+    circle_border: tuple  # 颜色圆圈边框
+    shadow: ft.BoxShadow  # 选中时的圆圈阴影
+    bgcolor: str  # 选中时的卡片背景色
+
+
+@dataclass(slots=True)
+class ThemeCardWidgets:
+    """单张预设主题色卡片中需要随选中状态变化的控件。"""
+    card: ft.Container  # 卡片容器
+    color_circle: ft.Container  # 颜色圆圈
+    name_text: ft.Text  # 颜色名称
+    check_icon: ft.Icon  # 选中标记
+
+
+@dataclass(slots=True)
+class FontTileWidgets:
+    """字体选择对话框中可复用的字体列表项控件。"""
+    tile: ft.Container  # 列表项容器（data 为 (字体键名, 显示名)）
+    name_text: ft.Text  # 字体显示名
+    sample_text: ft.Text  # 字体示例文本
+    check_icon: ft.Icon  # 选中标记
+
+
+@dataclass(slots=True)
+class HotkeyWidgets:
+    """单个快捷功能卡片中的控件集合。"""
+    switch: ft.Switch  # 功能开关
+    ctrl_cb: ft.Checkbox  # Ctrl 修饰键
+    alt_cb: ft.Checkbox  # Alt 修饰键
+    shift_cb: ft.Checkbox  # Shift 修饰键
+    key_field: ft.TextField  # 主键输入框
+    label: ft.Text  # 快捷键显示文本
+    config_row: ft.Row  # 修饰键/主键配置行
+    controls: List[ft.Control]  # 随功能开关联动禁用的控件
+
 
 def get_full_version_string() -> str:
     """获取完整的版本字符串（包含 CUDA 变体信息）。
@@ -72,6 +409,13 @@ class SettingsView(ft.Container):
         self._saved_page: ft.Page = page  # 保存页面引用,防止在布局重建后丢失
         self.config_service: ConfigService = config_service
         self.expand: bool = True
+        
+        # 主视图及其子组件引用（一次解析后缓存，避免各处重复 hasattr 链）
+        self._main_view = None
+        self._title_bar = None
+        self._nav_container: Optional[ft.Container] = None
+        self._fab: Optional[ft.FloatingActionButton] = None
+        self._resolve_main_view_refs(page)
         # 左右边距使用 PADDING_LARGE
         self.padding: ft.padding = ft.Padding.only(
             left=PADDING_MEDIUM,
@@ -83,7 +427,52 @@ class SettingsView(ft.Container):
         # 必应壁纸相关变量
         self.bing_wallpapers: List[Dict] = []  # 存储8张壁纸信息
         self.current_wallpaper_index: int = 0  # 当前壁纸索引
-        self.auto_switch_timer: Optional[threading.Timer] = None  # 自动切换定时器
+        self._wallpaper_url_index: Dict[str, int] = {}  # 壁纸URL -> 索引
+        self._wallpaper_downloads: set = set()  # 正在后台缓存的壁纸URL
+        self.auto_switch_task: Optional[Future] = None  # 自动切换任务（page.run_task 返回的句柄）
+        
+        # 快捷键、输出选项等配置变更合并写入：配置键 -> 待保存的值
+        self._pending_config_flush: Dict[str, object] = {}
+        self._config_flush_task: Optional[Future] = None
+        self._font_search_task: Optional[Future] = None  # 字体搜索防抖任务
+        
+        # 快捷功能卡片控件：快捷键类型 -> HotkeyWidgets（构建快捷功能分区时填充）
+        self._hotkey_blocks: Dict[str, HotkeyWidgets] = {}
+        # 最近一次生效的快捷键配置签名，未变化时跳过热键服务重启
+        self._last_applied_hotkey_signature: Optional[tuple] = None
+        
+        # OCR 模型预加载：进行中标记与已加载的服务（开关反复切换时复用）
+        self._ocr_preload_inflight: bool = False
+        self._ocr_service = None
+        self._ocr_service_key: Optional[tuple] = None  # 已加载模型对应的 (模型键, 是否使用 GPU)
+        
+        # 后台写盘失败时在界面上提示（设置项改为后台写入，UI 回调不再等待磁盘）
+        self.config_service.write_error_callback = self._on_config_write_error
+        
+        # 滑块节流状态：名称 -> [上次执行时间, 待执行的尾随回调]
+        self._throttle_state: Dict[str, list] = {}
+        
+        # 最近一次应用的背景图片、适应模式与窗口不透明度，未变化时跳过重复应用
+        # 背景为 (图片路径, 适应模式)，初始为 None 保证首次调用一定会应用
+        self._last_background: Optional[tuple] = None
+        self._last_applied_opacity: Optional[float] = None
+        
+        # 已构建的界面设置 / 主题色分区（只构建一次，之后原地修改控件）
+        self._interface_section: Optional[ft.Container] = None
+        self._theme_color_section: Optional[ft.Container] = None
+        # 主题色卡片样式缓存：颜色值 -> ThemeCardStyle
+        self._card_style_cache: Dict[str, ThemeCardStyle] = {}
+        # 预设主题色卡片控件：颜色值 -> ThemeCardWidgets（构建主题色分区时填充）
+        self._theme_card_widgets: Dict[str, ThemeCardWidgets] = {}
+        # 调色盘对话框（首次打开时构建，之后复用）
+        self.color_picker_dialog: Optional[ft.AlertDialog] = None
+        self._last_preview_rgb: Optional[tuple] = None  # 调色盘预览当前显示的 RGB
+        # 更新说明 Markdown 控件：版本号 -> ft.Markdown（每个版本只解析渲染一次）
+        self._release_notes_cache: Dict[str, ft.Markdown] = {}
+        # 更新服务/自动更新器（首次使用时创建，之后复用，保留网络环境检测等缓存）
+        self._update_service: Optional[UpdateService] = None
+        self._auto_updater: Optional[AutoUpdater] = None
+        self._last_update_result_key: Optional[tuple] = None  # 上次检查更新结果（状态, 版本, 错误信息）
         
         # 恢复自定义字体（如果之前已设置）- 提前调用以验证字体有效性
         self._restore_custom_font()
@@ -91,27 +480,69 @@ class SettingsView(ft.Container):
         # 创建UI组件
         self._build_ui()
         
-        # 延迟构建重区块（GPU/字体），避免进入设置页时主线程长时间阻塞
-        self._schedule_deferred_sections_build()
-        
-        # 对可选重区块做低优先级自动加载（避免首屏卡顿）
+        # 延迟构建重区块（GPU/字体），随后低优先级自动加载可选区块
+        # 统一由一个异步任务顺序完成，避免进入设置页时主线程长时间阻塞
         self._optional_sections_loaded = set()
         self._optional_sections_building = set()
-        self._schedule_optional_sections_auto_load()
+        self._startup_task: Optional[Future] = None  # 分区加载任务（离开设置页时取消）
+        self.start_startup_load()
         
         # 恢复自动切换状态（如果之前已启用）
         self._restore_auto_switch_state()
+    
+    def _resolve_main_view_refs(self, page: ft.Page) -> None:
+        """解析并缓存主视图及其标题栏、导航栏、FAB 引用。
         
-        # 初始化文件选择器
-        self._init_file_picker()
-
-    def _init_file_picker(self) -> None:
-        """初始化文件选择器（由 MainView 统一挂载共享实例）。"""
-        pass
+        Args:
+            page: Flet页面对象
+        """
+        main_view = getattr(page, '_main_view', None) or getattr(page, '_main_view_instance', None)
+        self._main_view = main_view
+        self._title_bar = getattr(main_view, 'title_bar', None)
+        self._nav_container = getattr(main_view, 'navigation_container', None)
+        self._fab = getattr(main_view, 'fab_search', None)
+    
+    @property
+    def active_page(self) -> Optional[ft.Page]:
+        """当前可用的页面引用（优先使用 _saved_page，布局重建后 self._page 可能失效）。"""
+        return self._saved_page or self._page
+    
+    def _on_config_write_error(self, error: Exception) -> None:
+        """后台配置写盘失败回调（在写入线程中调用，切回事件循环显示提示）。
+        
+        错误日志已由配置写入线程记录，这里只负责界面提示。
+        
+        Args:
+            error: 写盘异常
+        """
+        page = self.active_page
+        if not page:
+            return
+        
+        async def notify():
+            self._show_snackbar("设置保存失败，请检查数据目录权限", ft.Colors.RED)
+        
+        try:
+            page.run_task(notify)
+        except Exception:
+            pass
+    
+    def _update_controls(self, *controls: Optional[ft.Control]) -> None:
+        """局部刷新指定控件，局部刷新失败时回退为整页刷新。"""
+        page = self.active_page
+        if not page:
+            return
+        try:
+            page.update(*[c for c in controls if c is not None])
+        except Exception:
+            try:
+                page.update()
+            except Exception:
+                pass
     
     def _safe_page_update(self) -> None:
         """安全更新页面，避免会话关闭时抛出异常。"""
-        page = getattr(self, "_saved_page", self._page)
+        page = self.active_page
         if not page:
             return
         # 设置页未显示时不触发全局刷新，避免拖慢其他界面交互
@@ -128,7 +559,6 @@ class SettingsView(ft.Container):
             custom_font_file = self.config_service.get_config_value("custom_font_file", None)
             
             if custom_font_file:
-                from pathlib import Path
                 font_path = Path(custom_font_file)
                 
                 # 获取字体名称
@@ -163,39 +593,118 @@ class SettingsView(ft.Container):
         except Exception as e:
             logger.error(f"恢复自定义字体失败: {e}")
     
+    # 壁纸列表磁盘缓存有效期（秒）
+    _WALLPAPER_CACHE_TTL = 6 * 3600
+    
     def _restore_auto_switch_state(self) -> None:
-        """恢复自动切换状态（在初始化时调用）。"""
-        auto_switch_enabled = self.config_service.get_config_value("wallpaper_auto_switch", False)
-        current_bg = self.config_service.get_config_value("background_image", None)
+        """恢复自动切换状态（在初始化时调用，缓存读取与网络请求都在异步任务中进行）。"""
+        cfg = self.config_service.get_many({
+            "wallpaper_auto_switch": False,
+            "background_image": None,
+            "wallpaper_switch_interval": 30,
+        })
+        auto_switch_enabled = cfg["wallpaper_auto_switch"]
+        current_bg = cfg["background_image"]
         
         # 检查当前背景是否是必应壁纸URL（包含bing.com）
         is_bing_wallpaper = current_bg and isinstance(current_bg, str) and "bing.com" in current_bg.lower()
         
-        if auto_switch_enabled or is_bing_wallpaper:
-            # 如果启用了自动切换，或者当前使用的是必应壁纸，则自动获取壁纸列表
-            # 使用异步任务获取，避免阻塞UI启动
-            async def async_fetch_wallpapers():
-                import asyncio
-                wallpapers = await asyncio.to_thread(self._fetch_bing_wallpaper)
-                if wallpapers:
-                    self.bing_wallpapers = wallpapers
-                    
-                    # 尝试找到当前壁纸在列表中的位置
-                    if is_bing_wallpaper:
-                        for i, wp in enumerate(wallpapers):
-                            if wp["url"] == current_bg:
-                                self.current_wallpaper_index = i
-                                break
-                    
-                    # 更新UI
-                    self._update_wallpaper_info_ui()
-                    
-                    # 如果启用了自动切换，启动定时器
-                    if auto_switch_enabled:
-                        interval = self.config_service.get_config_value("wallpaper_switch_interval", 30)
-                        self._start_auto_switch(interval)
+        if not (auto_switch_enabled or is_bing_wallpaper):
+            return
+        
+        def apply_wallpapers(wallpapers: List[Dict], cached_index: Optional[int] = None) -> None:
+            self.bing_wallpapers = wallpapers
+            self._wallpaper_url_index = {wp["url"]: i for i, wp in enumerate(wallpapers)}
+            
+            # 定位当前壁纸在列表中的位置
+            if cached_index is not None and 0 <= cached_index < len(wallpapers) \
+                    and wallpapers[cached_index]["url"] == current_bg:
+                self.current_wallpaper_index = cached_index
+            else:
+                self.current_wallpaper_index = self._wallpaper_url_index.get(current_bg, 0) if is_bing_wallpaper else 0
+            
+            # 更新UI
+            self._update_wallpaper_info_ui()
+        
+        # 如果启用了自动切换，或者当前使用的是必应壁纸，则自动获取壁纸列表
+        # 使用异步任务获取，避免阻塞UI启动
+        async def async_fetch_wallpapers():
+            # 磁盘缓存足够新时立即恢复（在 I/O 线程池中读取），网络刷新随后进行
+            cached, cached_index, age = await _run_io(self._load_wallpaper_cache)
+            restored = bool(cached) and age < self._WALLPAPER_CACHE_TTL
+            if restored:
+                apply_wallpapers(cached, cached_index)
+                if auto_switch_enabled:
+                    self._start_auto_switch(cfg["wallpaper_switch_interval"])
+            
+            wallpapers = await self._fetch_bing_wallpaper_async()
+            if not wallpapers:
+                return
+            
+            # 保留已缓存到本地的图片路径
+            for wp in wallpapers:
+                old_idx = self._wallpaper_url_index.get(wp["url"])
+                if old_idx is not None and self.bing_wallpapers[old_idx].get("local_path"):
+                    wp["local_path"] = self.bing_wallpapers[old_idx]["local_path"]
             
-            self._page.run_task(async_fetch_wallpapers)
+            apply_wallpapers(wallpapers)
+            await _run_io(self._save_wallpaper_cache, wallpapers)
+            
+            # 自动切换会轮换整个列表，提前在后台预取尚未缓存的壁纸
+            if auto_switch_enabled:
+                self._schedule_wallpaper_cache(*(wp for wp in wallpapers if not wp.get("local_path")))
+            
+            # 如果启用了自动切换，启动定时器（已从缓存恢复时定时器已在运行）
+            if auto_switch_enabled and not restored:
+                interval = self.config_service.get_config_value("wallpaper_switch_interval", 30)
+                self._start_auto_switch(interval)
+        
+        self._page.run_task(async_fetch_wallpapers)
+    
+    def _get_wallpaper_cache_file(self) -> Path:
+        """获取壁纸列表缓存文件路径。"""
+        cache_dir: Path = self.config_service.get_data_dir() / "cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir / "bing_wallpapers.json"
+    
+    def _load_wallpaper_cache(self) -> tuple:
+        """从磁盘读取上次获取的壁纸列表。
+        
+        Returns:
+            (壁纸列表, 当前壁纸索引, 缓存年龄秒数)，无缓存时返回 (None, None, inf)
+        """
+        try:
+            cache_file = self._get_wallpaper_cache_file()
+            if not cache_file.exists():
+                return None, None, float("inf")
+            with open(cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            wallpapers = data.get("wallpapers") or None
+            age = time.time() - float(data.get("timestamp", 0))
+            return wallpapers, data.get("current_index"), age
+        except Exception as e:
+            logger.warning(f"读取壁纸缓存失败: {e}")
+            return None, None, float("inf")
+    
+    def _save_wallpaper_cache(self, wallpapers: List[Dict]) -> None:
+        """将壁纸列表原子写入磁盘缓存。
+        
+        Args:
+            wallpapers: 壁纸信息列表
+        """
+        try:
+            cache_file = self._get_wallpaper_cache_file()
+            tmp_file = cache_file.with_suffix(".tmp")
+            data = {
+                "timestamp": time.time(),
+                "current_index": self.current_wallpaper_index,
+                "wallpapers": wallpapers,
+            }
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"保存壁纸缓存失败: {e}")
     
     def _build_ui(self) -> None:
         """构建用户界面。"""
@@ -216,8 +725,19 @@ class SettingsView(ft.Container):
         self.interface_section_container: ft.Container = self._build_deferred_section_placeholder("界面设置加载中...")
         self.gpu_acceleration_section_container: ft.Container = self._build_deferred_section_placeholder("GPU 加速设置加载中...")
         self.performance_section_container: ft.Container = self._build_deferred_section_placeholder("性能优化设置加载中...")
-        self.font_section_container: ft.Container = self._build_deferred_section_placeholder("字体设置加载中...")
-        self.about_section_container: ft.Container = self._build_deferred_section_placeholder("关于信息加载中...")
+        # 字体（需枚举系统字体）与关于（含 Markdown 渲染）较重，作为可选区块低优先级加载，也可手动立即加载
+        self.font_section_container: ft.Container = self._build_deferred_section_placeholder(
+            "字体设置加载中...",
+            with_load_button=True,
+            on_load_click=self._on_load_font_section_click,
+        )
+        self.about_section_container: ft.Container = self._build_deferred_section_placeholder(
+            "关于信息加载中...",
+            with_load_button=True,
+            on_load_click=lambda e: self._load_single_deferred_section(
+                self.about_section_container, self._build_about_section, section_key="about"
+            ),
+        )
         
         # 区块构建顺序（越靠前越先可用）
         self._deferred_section_plan = [
@@ -230,10 +750,11 @@ class SettingsView(ft.Container):
             (self.interface_section_container, self._build_interface_section),
             (self.gpu_acceleration_section_container, self._build_gpu_acceleration_section),
             (self.performance_section_container, self._build_performance_optimization_section),
-            (self.font_section_container, self._build_font_section),
-            (self.about_section_container, self._build_about_section),
         ]
-        self._optional_section_plan = []
+        self._optional_section_plan = [
+            ("font", self.font_section_container, self._build_font_section),
+            ("about", self.about_section_container, self._build_about_section),
+        ]
         
         # 组装视图
         self.content = ft.Column(
@@ -296,30 +817,61 @@ class SettingsView(ft.Container):
             padding=PADDING_MEDIUM,
         )
     
-    def _schedule_deferred_sections_build(self) -> None:
-        """异步构建重区块，先让页面可交互。"""
-        async def _build_later():
-            import asyncio
-            await asyncio.sleep(0.05)  # 先渲染首帧
-            
-            if not self._page:
-                return
-            if self._page.route != "/settings":
-                return
-            
-            # 分阶段构建，避免一次性长阻塞；切走设置页即停止
-            for placeholder, builder in self._deferred_section_plan:
-                if not self._page or self._page.route != "/settings":
-                    return
-                try:
-                    self._apply_section_to_placeholder(placeholder, builder())
-                except Exception as ex:
-                    logger.error(f"构建设置分区失败: {getattr(builder, '__name__', 'unknown')}, error={ex}")
-                    self._set_section_load_failed(placeholder, "该分区加载失败")
-                self._safe_page_update()
-                await asyncio.sleep(0.008)
+    def _is_settings_route_active(self) -> bool:
+        """设置页是否仍处于当前路由。"""
+        return bool(self._page) and self._page.route == "/settings"
+    
+    def start_startup_load(self) -> None:
+        """启动分区加载任务；返回设置页时继续加载尚未完成的分区。"""
+        if self._startup_task is not None and not self._startup_task.done():
+            return
+        if not self._deferred_section_plan and all(
+            key in self._optional_sections_loaded for key, _, _ in self._optional_section_plan
+        ):
+            return
+        if self._page:
+            self._startup_task = self._page.run_task(self._startup_load)
+    
+    def cancel_startup_load(self) -> None:
+        """取消进行中的分区加载任务（离开设置页时由主视图调用）。"""
+        task, self._startup_task = self._startup_task, None
+        if task is not None:
+            task.cancel()
+    
+    async def _startup_load(self) -> None:
+        """异步构建延迟区块，再低优先级加载可选区块，先让页面可交互。
+        
+        所有分区在同一个任务中顺序完成；切走设置页时任务被取消，
+        已构建的分区从计划中移除，再次进入时只加载剩余分区。
+        """
+        await asyncio.sleep(0.05)  # 先渲染首帧
+        
+        # 分阶段构建，避免一次性长阻塞
+        while self._deferred_section_plan:
+            placeholder, builder = self._deferred_section_plan.pop(0)
+            try:
+                self._apply_section_to_placeholder(placeholder, builder())
+            except Exception as ex:
+                logger.error(f"构建设置分区失败: {getattr(builder, '__name__', 'unknown')}, error={ex}")
+                self._set_section_load_failed(placeholder, "该分区加载失败")
+            self._safe_page_update()
+            await asyncio.sleep(0.008)
         
-        self._page.run_task(_build_later)
+        # 可选重区块：逐个延后加载，避免首屏卡顿
+        base_delay = 0.9
+        step_delay = 0.45
+        pending_optional = [
+            item for item in self._optional_section_plan
+            if item[0] not in self._optional_sections_loaded
+        ]
+        for idx, (section_key, placeholder, builder) in enumerate(pending_optional):
+            await asyncio.sleep(base_delay if idx == 0 else step_delay)
+            if section_key == "font":
+                # 等待后台字体枚举完成（期间保持占位），避免构建时阻塞事件循环；
+                # shield 保证本任务被取消时不会连带取消共享的字体枚举 Future
+                fonts = await asyncio.shield(asyncio.wrap_future(prefetch_system_fonts()))
+                builder = partial(builder, fonts)
+            self._load_single_deferred_section(placeholder, builder, section_key=section_key)
     
     def _apply_section_to_placeholder(self, target: ft.Container, section: ft.Container) -> None:
         """把实际分区样式与内容应用到占位容器。"""
@@ -356,29 +908,23 @@ class SettingsView(ft.Container):
                 self._optional_sections_loaded.add(section_key)
             self._safe_page_update()
         except Exception as ex:
-            logger.error(f"按需构建设置分区失败: {getattr(builder, '__name__', 'unknown')}, error={ex}")
+            logger.error(f"按需构建设置分区失败: {getattr(getattr(builder, 'func', builder), '__name__', 'unknown')}, error={ex}")
             self._set_section_load_failed(placeholder, "加载失败，请稍后重试")
             self._safe_page_update()
         finally:
             if section_key:
                 self._optional_sections_building.discard(section_key)
     
-    def _schedule_optional_sections_auto_load(self) -> None:
-        """低优先级自动加载可选重区块。"""
-        base_delay = 0.9
-        step_delay = 0.45
+    async def _on_load_font_section_click(self, e: ft.ControlEvent) -> None:
+        """字体分区“立即加载”按钮：等待后台字体枚举完成后再构建，避免阻塞事件循环。
         
-        for idx, (section_key, placeholder, builder) in enumerate(self._optional_section_plan):
-            delay = base_delay + idx * step_delay
-            
-            async def _load_one(_key=section_key, _placeholder=placeholder, _builder=builder, _delay=delay):
-                import asyncio
-                await asyncio.sleep(_delay)
-                if not self._page or self._page.route != "/settings":
-                    return
-                self._load_single_deferred_section(_placeholder, _builder, section_key=_key)
-            
-            self._page.run_task(_load_one)
+        Args:
+            e: 控件事件对象
+        """
+        fonts = await asyncio.wrap_future(prefetch_system_fonts())
+        self._load_single_deferred_section(
+            self.font_section_container, partial(self._build_font_section, fonts), section_key="font"
+        )
     
     def _build_theme_mode_section(self) -> ft.Container:
         """构建主题模式设置部分。
@@ -501,9 +1047,9 @@ class SettingsView(ft.Container):
         self.theme_mode_radio.value = mode
         
         # 保存到配置
-        if self.config_service.set_config_value("theme_mode", mode):
-            # 通过 _saved_page 获取页面引用(因为 self._page 可能在布局重建后失效)
-            page = getattr(self, '_saved_page', self._page)
+        if self.config_service.set_config_value("theme_mode", mode, background=True):
+            # 通过 active_page 获取页面引用(因为 self._page 可能在布局重建后失效)
+            page = self.active_page
             # 立即应用主题模式
             if page:
                 if mode == "system":
@@ -553,6 +1099,9 @@ class SettingsView(ft.Container):
         "0", "1", "2", "3", "4", "5", "6", "7", "8", "9",
     ]
     
+    # 主键集合，用于 O(1) 校验用户输入
+    _AVAILABLE_KEYS_SET = frozenset(AVAILABLE_KEYS)
+    
     # Windows 虚拟键码映射
     VK_CODES = {
         "F1": 0x70, "F2": 0x71, "F3": 0x72, "F4": 0x73, "F5": 0x74, "F6": 0x75,
@@ -566,18 +1115,19 @@ class SettingsView(ft.Container):
         "5": 0x35, "6": 0x36, "7": 0x37, "8": 0x38, "9": 0x39,
     }
     
+    # 快捷键默认配置（只读，避免每次构建时重复分配）
+    _OCR_HOTKEY_DEFAULT = MappingProxyType({"ctrl": True, "shift": True, "alt": False, "key": "Q"})
+    _RECORD_HOTKEY_DEFAULT = MappingProxyType({"ctrl": True, "shift": True, "alt": False, "key": "C"})
+    _HOTKEY_DEFAULTS = MappingProxyType({"ocr": _OCR_HOTKEY_DEFAULT, "screen_record": _RECORD_HOTKEY_DEFAULT})
+    
     def _get_hotkey_display(self, config: dict) -> str:
         """获取快捷键显示文本（macOS 使用符号）。"""
-        is_mac = sys.platform == 'darwin'
-        parts = []
-        if config.get("ctrl"):
-            parts.append("⌃" if is_mac else "Ctrl")
-        if config.get("alt"):
-            parts.append("⌥" if is_mac else "Alt")
-        if config.get("shift"):
-            parts.append("⇧" if is_mac else "Shift")
-        parts.append(config.get("key", ""))
-        return "+".join(parts) if parts else "未设置"
+        return _format_hotkey(
+            bool(config.get("ctrl")),
+            bool(config.get("alt")),
+            bool(config.get("shift")),
+            config.get("key", "") or "",
+        )
     
     def _build_hotkey_section(self) -> ft.Container:
         """构建快捷功能设置部分。"""
@@ -589,8 +1139,8 @@ class SettingsView(ft.Container):
         )
         
         # 检查平台支持（Windows + macOS）
-        is_hotkey_supported = sys.platform in ('win32', 'darwin')
-        is_mac = sys.platform == 'darwin'
+        is_hotkey_supported = _IS_HOTKEY_SUPPORTED
+        is_mac = _IS_MACOS
         # 兼容旧变量名：整个方法中大量使用 is_windows
         is_windows = is_hotkey_supported
         # macOS 修饰键标签
@@ -607,177 +1157,40 @@ class SettingsView(ft.Container):
             color=ft.Colors.ON_SURFACE_VARIANT,
         )
         
-        # 加载已保存的快捷键配置
-        ocr_hotkey = self.config_service.get_config_value("ocr_hotkey", {
-            "ctrl": True, "shift": True, "alt": False, "key": "Q"
-        })
-        ocr_hotkey_enabled = self.config_service.get_config_value("ocr_hotkey_enabled", True)
-        
-        screen_record_hotkey = self.config_service.get_config_value("screen_record_hotkey", {
-            "ctrl": True, "shift": True, "alt": False, "key": "C"
+        # 批量加载已保存的快捷键配置
+        cfg = self.config_service.get_many({
+            "ocr_hotkey": self._OCR_HOTKEY_DEFAULT,
+            "ocr_hotkey_enabled": True,
+            "screen_record_hotkey": self._RECORD_HOTKEY_DEFAULT,
+            "screen_record_hotkey_enabled": True,
+            "preload_ocr_model": False,  # 预加载 OCR 模型开关
         })
-        screen_record_hotkey_enabled = self.config_service.get_config_value("screen_record_hotkey_enabled", True)
-        
-        # 预加载 OCR 模型开关
-        preload_ocr = self.config_service.get_config_value("preload_ocr_model", False)
-        
-        # OCR 快捷键开关
-        self.ocr_hotkey_switch = ft.Switch(
-            value=ocr_hotkey_enabled and is_windows,
-            on_change=lambda e: self._on_hotkey_enabled_change("ocr", e),
-            disabled=not is_windows,
-        )
-        
-        # OCR 快捷键配置
-        self.ocr_ctrl_cb = ft.Checkbox(label=_ctrl_label, value=ocr_hotkey.get("ctrl", True), 
-                                        on_change=lambda e: self._on_hotkey_change("ocr"), 
-                                        disabled=not is_windows or not ocr_hotkey_enabled)
-        self.ocr_alt_cb = ft.Checkbox(label=_alt_label, value=ocr_hotkey.get("alt", False),
-                                       on_change=lambda e: self._on_hotkey_change("ocr"), 
-                                       disabled=not is_windows or not ocr_hotkey_enabled)
-        self.ocr_shift_cb = ft.Checkbox(label=_shift_label, value=ocr_hotkey.get("shift", True),
-                                         on_change=lambda e: self._on_hotkey_change("ocr"), 
-                                         disabled=not is_windows or not ocr_hotkey_enabled)
-        self.ocr_key_dropdown = ft.Dropdown(
-            value=ocr_hotkey.get("key", "Q"),
-            options=[ft.dropdown.Option(k) for k in self.AVAILABLE_KEYS],
-            on_select=lambda e: self._on_hotkey_change("ocr"),
-            width=80,
-            dense=True,
-            disabled=not is_windows or not ocr_hotkey_enabled,
-        )
+        ocr_hotkey_enabled = cfg["ocr_hotkey_enabled"]
+        self._last_applied_hotkey_signature = self._hotkey_signature(cfg)
         
         # 预加载开关
         self.preload_ocr_switch = ft.Checkbox(
             label="预加载模型",
-            value=preload_ocr,
+            value=cfg["preload_ocr_model"],
             on_change=self._on_preload_ocr_change,
             disabled=not is_windows or not ocr_hotkey_enabled,
         )
         
+        modifier_labels = (_ctrl_label, _alt_label, _shift_label)
+        
         # OCR 功能卡片
-        ocr_hotkey_row = ft.Container(
-            content=ft.Column(
-                controls=[
-                    ft.Row(
-                        controls=[
-                            # 固定宽度的开关容器，确保对齐
-                            ft.Container(
-                                content=self.ocr_hotkey_switch,
-                                width=60,
-                                alignment=ft.Alignment.CENTER_LEFT,
-                            ),
-                            ft.Icon(ft.Icons.TEXT_FIELDS, size=20, color=ft.Colors.PRIMARY),
-                            ft.Text("OCR 截图识别", size=14, weight=ft.FontWeight.W_500),
-                            ft.Container(expand=True),
-                            ft.Text(
-                                f"{self._get_hotkey_display(ocr_hotkey)}",
-                                size=12,
-                                weight=ft.FontWeight.W_500,
-                                color=ft.Colors.PRIMARY if ocr_hotkey_enabled else ft.Colors.ON_SURFACE_VARIANT,
-                            ),
-                        ],
-                        spacing=8,
-                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                    ft.Row(
-                        controls=[
-                            ft.Container(width=60),  # 与开关对齐
-                            self.ocr_ctrl_cb,
-                            self.ocr_alt_cb,
-                            self.ocr_shift_cb,
-                            ft.Text("+", size=12),
-                            self.ocr_key_dropdown,
-                            ft.Container(width=30),
-                            self.preload_ocr_switch,
-                        ],
-                        spacing=6,
-                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                        visible=ocr_hotkey_enabled,
-                    ),
-                ],
-                spacing=8,
-            ),
-            padding=ft.Padding.all(12),
-            bgcolor=ft.Colors.with_opacity(0.03, ft.Colors.ON_SURFACE),
-            border_radius=8,
-        )
-        self.ocr_hotkey_label = ocr_hotkey_row.content.controls[0].controls[-1]
-        self.ocr_config_row = ocr_hotkey_row.content.controls[1]
-        
-        # 录屏快捷键开关
-        self.record_hotkey_switch = ft.Switch(
-            value=screen_record_hotkey_enabled and is_windows,
-            on_change=lambda e: self._on_hotkey_enabled_change("screen_record", e),
-            disabled=not is_windows,
-        )
-        
-        # 录屏快捷键配置
-        self.record_ctrl_cb = ft.Checkbox(label=_ctrl_label, value=screen_record_hotkey.get("ctrl", True),
-                                           on_change=lambda e: self._on_hotkey_change("screen_record"), 
-                                           disabled=not is_windows or not screen_record_hotkey_enabled)
-        self.record_alt_cb = ft.Checkbox(label=_alt_label, value=screen_record_hotkey.get("alt", False),
-                                          on_change=lambda e: self._on_hotkey_change("screen_record"), 
-                                          disabled=not is_windows or not screen_record_hotkey_enabled)
-        self.record_shift_cb = ft.Checkbox(label=_shift_label, value=screen_record_hotkey.get("shift", True),
-                                            on_change=lambda e: self._on_hotkey_change("screen_record"), 
-                                            disabled=not is_windows or not screen_record_hotkey_enabled)
-        self.record_key_dropdown = ft.Dropdown(
-            value=screen_record_hotkey.get("key", "C"),
-            options=[ft.dropdown.Option(k) for k in self.AVAILABLE_KEYS],
-            on_select=lambda e: self._on_hotkey_change("screen_record"),
-            width=80,
-            dense=True,
-            disabled=not is_windows or not screen_record_hotkey_enabled,
+        ocr_hotkey_row = self._build_hotkey_block(
+            "ocr", ft.Icons.TEXT_FIELDS, "OCR 截图识别",
+            cfg["ocr_hotkey"], ocr_hotkey_enabled, is_windows, modifier_labels,
+            extra_controls=[ft.Container(width=30), self.preload_ocr_switch],
+            linked_controls=[self.preload_ocr_switch],
         )
         
         # 录屏功能卡片
-        record_hotkey_row = ft.Container(
-            content=ft.Column(
-                controls=[
-                    ft.Row(
-                        controls=[
-                            # 固定宽度的开关容器，确保对齐
-                            ft.Container(
-                                content=self.record_hotkey_switch,
-                                width=60,
-                                alignment=ft.Alignment.CENTER_LEFT,
-                            ),
-                            ft.Icon(ft.Icons.VIDEOCAM, size=20, color=ft.Colors.PRIMARY),
-                            ft.Text("屏幕录制", size=14, weight=ft.FontWeight.W_500),
-                            ft.Container(expand=True),
-                            ft.Text(
-                                f"{self._get_hotkey_display(screen_record_hotkey)}",
-                                size=12,
-                                weight=ft.FontWeight.W_500,
-                                color=ft.Colors.PRIMARY if screen_record_hotkey_enabled else ft.Colors.ON_SURFACE_VARIANT,
-                            ),
-                        ],
-                        spacing=8,
-                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                    ft.Row(
-                        controls=[
-                            ft.Container(width=60),  # 与开关对齐
-                            self.record_ctrl_cb,
-                            self.record_alt_cb,
-                            self.record_shift_cb,
-                            ft.Text("+", size=12),
-                            self.record_key_dropdown,
-                        ],
-                        spacing=6,
-                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                        visible=screen_record_hotkey_enabled,
-                    ),
-                ],
-                spacing=8,
-            ),
-            padding=ft.Padding.all(12),
-            bgcolor=ft.Colors.with_opacity(0.03, ft.Colors.ON_SURFACE),
-            border_radius=8,
+        record_hotkey_row = self._build_hotkey_block(
+            "screen_record", ft.Icons.VIDEOCAM, "屏幕录制",
+            cfg["screen_record_hotkey"], cfg["screen_record_hotkey_enabled"], is_windows, modifier_labels,
         )
-        self.record_hotkey_label = record_hotkey_row.content.controls[0].controls[-1]
-        self.record_config_row = record_hotkey_row.content.controls[1]
         
         # 提示信息
         hint_row = ft.Row(
@@ -815,42 +1228,262 @@ class SettingsView(ft.Container):
             border_radius=BORDER_RADIUS_MEDIUM,
         )
     
+    def _build_hotkey_block(
+        self,
+        hotkey_type: str,
+        icon: str,
+        title: str,
+        hotkey: dict,
+        enabled: bool,
+        supported: bool,
+        modifier_labels: tuple,
+        extra_controls: Optional[List[ft.Control]] = None,
+        linked_controls: Optional[List[ft.Control]] = None,
+    ) -> ft.Container:
+        """构建单个快捷功能卡片，并登记到 self._hotkey_blocks。
+        
+        Args:
+            hotkey_type: 快捷键类型，"ocr" 或 "screen_record"
+            icon: 卡片图标
+            title: 功能名称
+            hotkey: 已保存的快捷键配置
+            enabled: 功能是否启用
+            supported: 当前平台是否支持全局快捷键
+            modifier_labels: Ctrl/Alt/Shift 修饰键标签
+            extra_controls: 追加在配置行末尾的控件
+            linked_controls: 额外需要随功能开关联动禁用的控件
+        
+        Returns:
+            功能卡片容器
+        """
+        ctrl_label, alt_label, shift_label = modifier_labels
+        config_disabled = not supported or not enabled
+        
+        # 功能开关
+        switch = ft.Switch(
+            value=enabled and supported,
+            on_change=lambda e: self._on_hotkey_enabled_change(hotkey_type, e),
+            disabled=not supported,
+        )
+        
+        # 快捷键配置
+        ctrl_cb = ft.Checkbox(label=ctrl_label, value=hotkey.get("ctrl", True),
+                              data=hotkey_type, on_change=self._on_hotkey_modifier_change,
+                              disabled=config_disabled)
+        alt_cb = ft.Checkbox(label=alt_label, value=hotkey.get("alt", False),
+                             data=hotkey_type, on_change=self._on_hotkey_modifier_change,
+                             disabled=config_disabled)
+        shift_cb = ft.Checkbox(label=shift_label, value=hotkey.get("shift", True),
+                               data=hotkey_type, on_change=self._on_hotkey_modifier_change,
+                               disabled=config_disabled)
+        key_field = self._build_hotkey_key_field(
+            hotkey.get("key", self._HOTKEY_DEFAULTS[hotkey_type]["key"]),
+            hotkey_type,
+            disabled=config_disabled,
+        )
+        
+        label = ft.Text(
+            self._get_hotkey_display(hotkey),
+            size=12,
+            weight=ft.FontWeight.W_500,
+            color=ft.Colors.PRIMARY if enabled else ft.Colors.ON_SURFACE_VARIANT,
+        )
+        config_row = ft.Row(
+            controls=[
+                ft.Container(width=60),  # 与开关对齐
+                ctrl_cb,
+                alt_cb,
+                shift_cb,
+                ft.Text("+", size=12),
+                key_field,
+                *(extra_controls or []),
+            ],
+            spacing=6,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            visible=enabled,
+        )
+        
+        self._hotkey_blocks[hotkey_type] = HotkeyWidgets(
+            switch=switch,
+            ctrl_cb=ctrl_cb,
+            alt_cb=alt_cb,
+            shift_cb=shift_cb,
+            key_field=key_field,
+            label=label,
+            config_row=config_row,
+            controls=[ctrl_cb, alt_cb, shift_cb, key_field, *(linked_controls or [])],
+        )
+        
+        return ft.Container(
+            content=ft.Column(
+                controls=[
+                    ft.Row(
+                        controls=[
+                            # 固定宽度的开关容器，确保对齐
+                            ft.Container(
+                                content=switch,
+                                width=60,
+                                alignment=ft.Alignment.CENTER_LEFT,
+                            ),
+                            ft.Icon(icon, size=20, color=ft.Colors.PRIMARY),
+                            ft.Text(title, size=14, weight=ft.FontWeight.W_500),
+                            ft.Container(expand=True),
+                            label,
+                        ],
+                        spacing=8,
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                    config_row,
+                ],
+                spacing=8,
+            ),
+            padding=ft.Padding.all(12),
+            bgcolor=ft.Colors.with_opacity(0.03, ft.Colors.ON_SURFACE),
+            border_radius=8,
+        )
+    
+    def _build_hotkey_key_field(self, key: str, hotkey_type: str, disabled: bool) -> ft.TextField:
+        """构建快捷键主键输入框（替代包含 48 个选项的下拉框）。
+        
+        Args:
+            key: 当前主键
+            hotkey_type: 快捷键类型，"ocr" 或 "screen_record"
+            disabled: 是否禁用
+        
+        Returns:
+            主键输入框
+        """
+        return ft.TextField(
+            value=key,
+            data=key,  # 记录最近一次有效的主键，输入无效时回退
+            width=80,
+            dense=True,
+            suffix=ft.Icon(ft.Icons.EDIT, size=14),
+            tooltip="F1-F12、A-Z 或 0-9，回车确认",
+            on_submit=lambda e: self._validate_and_set_key(e.control.value, hotkey_type),
+            on_blur=lambda e: self._validate_and_set_key(e.control.value, hotkey_type),
+            disabled=disabled,
+        )
+    
+    def _validate_and_set_key(self, value: Optional[str], hotkey_type: str) -> None:
+        """校验输入的主键，有效则保存快捷键，无效则回退到上一次的值。
+        
+        Args:
+            value: 输入的主键
+            hotkey_type: 快捷键类型，"ocr" 或 "screen_record"
+        """
+        field = self._get_hotkey_widgets(hotkey_type).key_field
+        key = (value or "").strip().upper()
+        
+        if key not in self._AVAILABLE_KEYS_SET:
+            field.value = field.data
+            try:
+                field.update()
+            except Exception:
+                pass
+            if key:
+                self._show_snackbar(f"不支持的按键: {key}，可用 F1-F12、A-Z、0-9", ft.Colors.ORANGE)
+            return
+        
+        field.value = key
+        if key == field.data:
+            try:
+                field.update()
+            except Exception:
+                pass
+            return
+        
+        field.data = key
+        self._on_hotkey_change(hotkey_type)
+    
+    def _get_hotkey_widgets(self, hotkey_type: str) -> HotkeyWidgets:
+        """获取指定快捷功能的控件集合。
+        
+        Args:
+            hotkey_type: 快捷键类型，"ocr" 或 "screen_record"
+        """
+        return self._hotkey_blocks[hotkey_type]
+    
+    def _on_hotkey_modifier_change(self, e: ft.ControlEvent) -> None:
+        """修饰键复选框变化（所有复选框共用，快捷键类型存放在 control.data 中）。"""
+        self._on_hotkey_change(e.control.data)
+    
     def _on_hotkey_change(self, hotkey_type: str) -> None:
         """处理快捷键变化。"""
-        if hotkey_type == "ocr":
-            config = {
-                "ctrl": self.ocr_ctrl_cb.value,
-                "alt": self.ocr_alt_cb.value,
-                "shift": self.ocr_shift_cb.value,
-                "key": self.ocr_key_dropdown.value,
-            }
-            self.config_service.set_config_value("ocr_hotkey", config)
-            if hasattr(self, 'ocr_hotkey_label'):
-                self.ocr_hotkey_label.value = self._get_hotkey_display(config)
-        elif hotkey_type == "screen_record":
-            config = {
-                "ctrl": self.record_ctrl_cb.value,
-                "alt": self.record_alt_cb.value,
-                "shift": self.record_shift_cb.value,
-                "key": self.record_key_dropdown.value,
-            }
-            self.config_service.set_config_value("screen_record_hotkey", config)
-            if hasattr(self, 'record_hotkey_label'):
-                self.record_hotkey_label.value = self._get_hotkey_display(config)
+        hk = self._get_hotkey_widgets(hotkey_type)
+        config = {
+            "ctrl": hk.ctrl_cb.value,
+            "alt": hk.alt_cb.value,
+            "shift": hk.shift_cb.value,
+            "key": hk.key_field.value,
+        }
+        hk.label.value = self._get_hotkey_display(config)
         
-        self.config_service.save_config()
+        # 写盘与重启热键服务合并到短暂停顿后统一执行
+        self._pending_config_flush[f"{hotkey_type}_hotkey"] = config
+        self._schedule_config_flush()
         
-        # 重启全局热键服务以应用新配置
-        self._restart_global_hotkey_service()
+        self._update_controls(hk.label, hk.key_field)
+    
+    # 快捷键等开关类配置合并写入的等待窗口（秒）
+    _CONFIG_FLUSH_DELAY = 0.05
+    
+    def _schedule_config_flush(self) -> None:
+        """（重新）安排待写入配置的延迟写入，连续修改只触发一次保存和一次服务重启。"""
+        if self._config_flush_task:
+            self._config_flush_task.cancel()
         
-        try:
-            self._page.update()
-        except Exception:
-            pass
+        async def flush_later():
+            await asyncio.sleep(self._CONFIG_FLUSH_DELAY)
+            self._config_flush_task = None
+            self._flush_config_changes()
+        
+        page = self.active_page
+        if page:
+            self._config_flush_task = page.run_task(flush_later)
+        else:
+            self._flush_config_changes()
+    
+    def _flush_config_changes(self) -> None:
+        """保存所有待写入的配置，涉及快捷键时重启全局热键服务。"""
+        if not self._pending_config_flush:
+            return
+        pending, self._pending_config_flush = self._pending_config_flush, {}
+        self.config_service.set_many(pending, background=True)
+        
+        # 重启全局热键服务以应用新配置
+        if any(key.endswith(("_hotkey", "_hotkey_enabled")) for key in pending):
+            self._restart_global_hotkey_service()
+    
+    def _hotkey_signature(self, cfg) -> tuple:
+        """根据快捷键相关配置计算签名，用于判断热键服务是否需要重启。"""
+        def hotkey_tuple(hotkey) -> tuple:
+            return (
+                bool(hotkey.get("ctrl")),
+                bool(hotkey.get("alt")),
+                bool(hotkey.get("shift")),
+                hotkey.get("key"),
+            )
+        return (
+            bool(cfg["ocr_hotkey_enabled"]),
+            bool(cfg["screen_record_hotkey_enabled"]),
+            hotkey_tuple(cfg["ocr_hotkey"]),
+            hotkey_tuple(cfg["screen_record_hotkey"]),
+        )
     
     def _restart_global_hotkey_service(self) -> None:
-        """重启全局热键服务。"""
+        """重启全局热键服务（生效配置未变化时跳过）。"""
         try:
+            cfg = self.config_service.get_many({
+                "ocr_hotkey": self._OCR_HOTKEY_DEFAULT,
+                "ocr_hotkey_enabled": True,
+                "screen_record_hotkey": self._RECORD_HOTKEY_DEFAULT,
+                "screen_record_hotkey_enabled": True,
+            })
+            signature = self._hotkey_signature(cfg)
+            if signature == self._last_applied_hotkey_signature:
+                return
+            
             # 尝试从 main_view 获取全局热键服务
             if self._page and self._page.controls:
                 main_view = self._page.controls[0]
@@ -858,15 +1491,13 @@ class SettingsView(ft.Container):
                     service = main_view.global_hotkey_service
                     if service:
                         # 检查是否有任一功能启用
-                        ocr_enabled = self.config_service.get_config_value("ocr_hotkey_enabled", True)
-                        record_enabled = self.config_service.get_config_value("screen_record_hotkey_enabled", True)
-                        
-                        if ocr_enabled or record_enabled:
+                        if cfg["ocr_hotkey_enabled"] or cfg["screen_record_hotkey_enabled"]:
                             service.restart()
                             logger.info("全局热键服务已重启")
                         else:
                             service.stop()
                             logger.info("全局热键服务已停止")
+                        self._last_applied_hotkey_signature = signature
         except Exception as ex:
             logger.warning(f"重启全局热键服务失败: {ex}")
     
@@ -878,86 +1509,93 @@ class SettingsView(ft.Container):
             e: 事件对象
         """
         enabled = e.control.value
-        config_key = f"{func_type}_hotkey_enabled"
-        self.config_service.set_config_value(config_key, enabled)
-        self.config_service.save_config()
-        
-        if func_type == "ocr":
-            # 更新 OCR 相关控件状态
-            if hasattr(self, 'ocr_ctrl_cb'):
-                self.ocr_ctrl_cb.disabled = not enabled
-                self.ocr_alt_cb.disabled = not enabled
-                self.ocr_shift_cb.disabled = not enabled
-                self.ocr_key_dropdown.disabled = not enabled
-            if hasattr(self, 'preload_ocr_switch'):
-                self.preload_ocr_switch.disabled = not enabled
-            if hasattr(self, 'ocr_config_row'):
-                self.ocr_config_row.visible = enabled
-            if hasattr(self, 'ocr_hotkey_label'):
-                self.ocr_hotkey_label.color = ft.Colors.PRIMARY if enabled else ft.Colors.ON_SURFACE_VARIANT
-        elif func_type == "screen_record":
-            # 更新录屏相关控件状态
-            if hasattr(self, 'record_ctrl_cb'):
-                self.record_ctrl_cb.disabled = not enabled
-                self.record_alt_cb.disabled = not enabled
-                self.record_shift_cb.disabled = not enabled
-                self.record_key_dropdown.disabled = not enabled
-            if hasattr(self, 'record_config_row'):
-                self.record_config_row.visible = enabled
-            if hasattr(self, 'record_hotkey_label'):
-                self.record_hotkey_label.color = ft.Colors.PRIMARY if enabled else ft.Colors.ON_SURFACE_VARIANT
-        
-        # 重启热键服务
-        self._restart_global_hotkey_service()
+        self._pending_config_flush[f"{func_type}_hotkey_enabled"] = enabled
         
-        try:
-            self._page.update()
-        except Exception:
-            pass
+        # 更新对应功能的控件状态
+        hk = self._get_hotkey_widgets(func_type)
+        for control in hk.controls:
+            control.disabled = not enabled
+        hk.config_row.visible = enabled
+        hk.label.color = ft.Colors.PRIMARY if enabled else ft.Colors.ON_SURFACE_VARIANT
+        
+        # 延迟合并保存并重启热键服务
+        self._schedule_config_flush()
+        
+        # 配置行包含了所有联动控件，只需局部刷新配置行与显示文本
+        self._update_controls(hk.config_row, hk.label)
     
     def _on_preload_ocr_change(self, e) -> None:
         """处理预加载 OCR 模型开关变化。"""
         preload = e.control.value
-        self.config_service.set_config_value("preload_ocr_model", preload)
-        self.config_service.save_config()
+        self.config_service.set_config_value("preload_ocr_model", preload, background=True)
         
         if preload:
             # 立即预加载 OCR 模型
             self._preload_ocr_model()
     
     def _preload_ocr_model(self) -> None:
-        """预加载 OCR 模型。"""
-        import threading
+        """预加载 OCR 模型（同一时间只运行一个预加载，模型与 GPU 设置未变时直接复用已加载的模型）。"""
+        model_key = self.config_service.get_config_value("ocr_model_key", DEFAULT_OCR_MODEL_KEY)
+        use_gpu = self.config_service.get_config_value("gpu_acceleration", True)
+        service_key = (model_key, use_gpu)
         
-        def load():
+        if self._ocr_service is not None and self._ocr_service_key == service_key:
+            self._attach_ocr_service(self._ocr_service)
+            return
+        if self._ocr_preload_inflight:
+            return
+        
+        page = self.active_page
+        if not page:
+            return
+        self._ocr_preload_inflight = True
+        
+        async def preload():
             try:
-                from services import OCRService
-                from constants import DEFAULT_OCR_MODEL_KEY
-                
-                ocr_service = OCRService(self.config_service)
-                model_key = self.config_service.get_config_value("ocr_model_key", DEFAULT_OCR_MODEL_KEY)
-                use_gpu = self.config_service.get_config_value("gpu_acceleration", True)
-                
-                success, message = ocr_service.load_model(
-                    model_key,
-                    use_gpu=use_gpu,
-                    progress_callback=lambda p, m: None
-                )
-                
-                if success:
-                    # 保存到全局热键服务
-                    if self._page and self._page.controls:
-                        main_view = self._page.controls[0]
-                        if hasattr(main_view, 'global_hotkey_service'):
-                            main_view.global_hotkey_service._ocr_service = ocr_service
-                    logger.info("OCR 模型已预加载")
-                else:
-                    logger.warning(f"OCR 模型预加载失败: {message}")
-            except Exception as ex:
-                logger.error(f"预加载 OCR 模型失败: {ex}")
+                ocr_service = await asyncio.to_thread(self._load_ocr_service, model_key, use_gpu)
+                if ocr_service is not None:
+                    self._ocr_service = ocr_service
+                    self._ocr_service_key = service_key
+                    self._attach_ocr_service(ocr_service)
+            finally:
+                self._ocr_preload_inflight = False
+        
+        page.run_task(preload)
+    
+    def _load_ocr_service(self, model_key: str, use_gpu: bool):
+        """加载 OCR 模型（在后台线程中执行）。
+        
+        Args:
+            model_key: OCR 模型键
+            use_gpu: 是否使用 GPU 加速
         
-        thread = threading.Thread(target=load, daemon=True)
-        thread.start()
+        Returns:
+            加载成功的 OCRService，失败时返回 None
+        """
+        try:
+            from services import OCRService
+            
+            ocr_service = OCRService(self.config_service)
+            success, message = ocr_service.load_model(
+                model_key,
+                use_gpu=use_gpu,
+                progress_callback=lambda p, m: None
+            )
+            
+            if success:
+                logger.info("OCR 模型已预加载")
+                return ocr_service
+            logger.warning(f"OCR 模型预加载失败: {message}")
+        except Exception as ex:
+            logger.error(f"预加载 OCR 模型失败: {ex}")
+        return None
+    
+    def _attach_ocr_service(self, ocr_service) -> None:
+        """将已加载的 OCR 服务交给全局热键服务。"""
+        if self._page and self._page.controls:
+            service = getattr(self._page.controls[0], 'global_hotkey_service', None)
+            if service:
+                service._ocr_service = ocr_service
     
     def _build_data_dir_section(self) -> ft.Container:
         """构建数据目录设置部分。
@@ -1158,24 +1796,65 @@ class SettingsView(ft.Container):
         )
     
     def _on_add_sequence_change(self, e: ft.ControlEvent) -> None:
-        """文件已存在时添加序号选项变更。"""
-        self.config_service.set_config_value("output_add_sequence", e.control.value)
+        """文件已存在时添加序号选项变更（连续切换合并为一次写盘）。"""
+        self._pending_config_flush["output_add_sequence"] = e.control.value
+        self._schedule_config_flush()
+    
+    # GPU 设备选项缓存：[(key, 显示文本), ...]，检测结果在进程内基本不变
+    _gpu_options_cache: Optional[List[tuple]] = None
     
-    def _get_gpu_device_options(self) -> list:
+    def _get_gpu_device_options(self, refresh: bool = False) -> list:
         """获取可用的GPU设备选项列表。
         
+        设备检测（可能调用 nvidia-smi）结果在类级别缓存，重建设置页时直接复用。
+        
+        Args:
+            refresh: 是否忽略缓存重新检测设备
+        
+        Returns:
+            GPU设备选项列表
+        """
+        cls = type(self)
+        if refresh:
+            _cached_cuda_devices.cache_clear()
+        if refresh or cls._gpu_options_cache is None:
+            cls._gpu_options_cache = self._detect_gpu_device_options()
+        return [ft.dropdown.Option(key, text) for key, text in cls._gpu_options_cache]
+    
+    @staticmethod
+    def _get_gpu_device_select_state() -> tuple:
+        """根据 Provider 模式和 CUDA 设备可用性确定设备下拉框状态。
+        
+        Returns:
+            (是否禁用设备选择, 下拉框提示文本)
+        """
+        primary_provider = _cached_primary_provider()
+        is_directml = primary_provider == "DirectML"
+        is_cuda = primary_provider == "CUDA"
+        cuda_available = bool(_cached_cuda_devices()) if is_cuda else False
+        
+        if is_directml:
+            return True, "DirectML 模式不支持设备选择"
+        if is_cuda and not cuda_available:
+            return True, "未检测到 NVIDIA GPU"
+        return False, "在多GPU系统中选择一个设备"
+    
+    @staticmethod
+    def _detect_gpu_device_options() -> List[tuple]:
+        """检测可用的GPU设备。
+        
         根据当前的加速方式（CUDA/DirectML/CoreML）返回对应的设备列表：
         - CUDA: 只显示 NVIDIA GPU（因为 CUDA 只能看到 NVIDIA 设备）
         - DirectML: 显示所有 GPU，但设备选择不生效
         - 其他: 显示所有检测到的 GPU
         
         Returns:
-            GPU设备选项列表
+            (选项 key, 显示文本) 列表
         """
-        from utils import get_available_compute_devices, get_primary_provider
+        from utils import get_available_compute_devices
         
         gpu_options = []
-        primary_provider = get_primary_provider()
+        primary_provider = _cached_primary_provider()
         
         try:
             # 获取计算设备信息（硬件 + ONNX Runtime Provider）
@@ -1184,22 +1863,18 @@ class SettingsView(ft.Container):
             
             # CUDA 模式：使用 nvidia-smi 获取准确的 CUDA 设备列表
             if primary_provider == "CUDA":
-                from utils import get_cuda_devices
-                cuda_gpus = get_cuda_devices()
+                cuda_gpus = _cached_cuda_devices()
                 
                 if cuda_gpus:
                     for gpu in cuda_gpus:
                         cuda_idx = gpu.get("index", 0)
                         name = gpu.get("name", "Unknown GPU")
-                        display_text = f"🎮 CUDA {cuda_idx}: {name}"
-                        gpu_options.append(ft.dropdown.Option(str(cuda_idx), display_text))
+                        gpu_options.append((str(cuda_idx), f"🎮 CUDA {cuda_idx}: {name}"))
                     return gpu_options
                 else:
                     # 没有检测到 NVIDIA GPU，但用户使用的是 CUDA 版本
                     # 显示提示选项，程序会自动回退到 CPU
-                    return [
-                        ft.dropdown.Option("0", "⚠️ 未检测到 NVIDIA GPU (将使用 CPU)"),
-                    ]
+                    return [("0", "⚠️ 未检测到 NVIDIA GPU (将使用 CPU)")]
             
             # 其他模式：显示所有 GPU
             for gpu in gpus:
@@ -1214,7 +1889,7 @@ class SettingsView(ft.Container):
                 else:
                     display_text = f"🎮 GPU {index}: {name} (CPU 回退)"
                 
-                gpu_options.append(ft.dropdown.Option(str(index), display_text))
+                gpu_options.append((str(index), display_text))
             
             if gpu_options:
                 return gpu_options
@@ -1223,9 +1898,15 @@ class SettingsView(ft.Container):
             logger.warning(f"获取 GPU 设备列表失败: {e}")
         
         # 后备选项（如果检测失败）
-        return [
-            ft.dropdown.Option("0", "🎮 GPU 0 (默认)"),
-        ]
+        return [("0", "🎮 GPU 0 (默认)")]
+    
+    # 背景图片适应模式选项：(key, 显示文本)
+    _BG_FIT_OPTIONS = (
+        ("cover", "覆盖 - 填满窗口(可能裁剪)"),
+        ("contain", "适应 - 完整显示(可能留白)"),
+        ("fill", "拉伸 - 填满窗口(可能变形)"),
+        ("none", "原始尺寸 - 不缩放"),
+    )
     
     def _build_appearance_section(self) -> ft.Container:
         """构建外观设置部分（透明度和背景图片）。
@@ -1239,11 +1920,24 @@ class SettingsView(ft.Container):
             weight=ft.FontWeight.W_600,
         )
         
-        # 获取当前配置
-        current_opacity = self.config_service.get_config_value("window_opacity", 1.0)
-        current_bg_image = self.config_service.get_config_value("background_image", None)
-        current_bg_fit = self.config_service.get_config_value("background_image_fit", "cover")
-        
+        # 批量获取当前配置
+        cfg = self.config_service.get_many({
+            "window_opacity": 1.0,
+            "background_image": None,
+            "background_image_fit": "cover",
+            "wallpaper_auto_switch": False,
+            "wallpaper_switch_interval": 30,
+            "bg_titlebar_transparent": True,
+            "bg_titlebar_opacity": 0.55,
+            "bg_navbar_transparent": True,
+            "bg_navbar_opacity": 0.25,
+            "bg_content_transparent": True,
+            "bg_content_opacity": 0.10,
+        })
+        current_opacity = cfg["window_opacity"]
+        current_bg_image = cfg["background_image"]
+        current_bg_fit = cfg["background_image_fit"]
+        
         # 不透明度滑块
         self.opacity_value_text = ft.Text(
             f"{int(current_opacity * 100)}%",
@@ -1259,6 +1953,7 @@ class SettingsView(ft.Container):
             divisions=14,
             # label 不使用,因为格式化不够灵活,使用右侧文本显示
             on_change=self._on_opacity_change,
+            on_change_end=self._on_opacity_change_end,
         )
         
         opacity_row = ft.Row(
@@ -1319,12 +2014,7 @@ class SettingsView(ft.Container):
         self.bg_fit_dropdown = ft.Dropdown(
             width=280,
             value=current_bg_fit,
-            options=[
-                ft.dropdown.Option("cover", "覆盖 - 填满窗口(可能裁剪)"),
-                ft.dropdown.Option("contain", "适应 - 完整显示(可能留白)"),
-                ft.dropdown.Option("fill", "拉伸 - 填满窗口(可能变形)"),
-                ft.dropdown.Option("none", "原始尺寸 - 不缩放"),
-            ],
+            options=[ft.dropdown.Option(key, text) for key, text in self._BG_FIT_OPTIONS],
             dense=True,
             on_select=self._on_bg_fit_change,
         )
@@ -1353,7 +2043,7 @@ class SettingsView(ft.Container):
         )
         
         self.switch_interval_text = ft.Text(
-            f"{self.config_service.get_config_value('wallpaper_switch_interval', 30)} 分钟",
+            f"{cfg['wallpaper_switch_interval']} 分钟",
             size=12,
         )
         
@@ -1414,7 +2104,7 @@ class SettingsView(ft.Container):
                     controls=[
                         ft.Switch(
                             label="自动切换",
-                            value=self.config_service.get_config_value("wallpaper_auto_switch", False),
+                            value=cfg["wallpaper_auto_switch"],
                             on_change=self._on_auto_switch_change,
                         ),
                         self.switch_interval_text,
@@ -1425,9 +2115,10 @@ class SettingsView(ft.Container):
                     min=5,
                     max=120,
                     divisions=23,
-                    value=self.config_service.get_config_value("wallpaper_switch_interval", 30),
+                    value=cfg["wallpaper_switch_interval"],
                     label="{value}分钟",
-                    on_change=self._on_switch_interval_change,
+                    on_change=self._on_switch_interval_dragging,
+                    on_change_end=self._on_switch_interval_change,
                 ),
                 ft.Text(
                     "启用自动切换后，壁纸会按设定的时间间隔自动轮换（5-120分钟）",
@@ -1443,46 +2134,46 @@ class SettingsView(ft.Container):
 
         self._bg_titlebar_switch = ft.Switch(
             label="标题栏透明",
-            value=self.config_service.get_config_value("bg_titlebar_transparent", True),
+            value=cfg["bg_titlebar_transparent"],
             on_change=self._on_bg_titlebar_switch,
         )
         self._bg_titlebar_slider = ft.Slider(
             min=0.1, max=0.9, divisions=16,
-            value=self.config_service.get_config_value("bg_titlebar_opacity", 0.55),
+            value=cfg["bg_titlebar_opacity"],
             on_change=self._on_bg_titlebar_opacity,
         )
         self._bg_titlebar_label = ft.Text(
-            f"{int(self.config_service.get_config_value('bg_titlebar_opacity', 0.55) * 100)}%",
+            f"{int(cfg['bg_titlebar_opacity'] * 100)}%",
             size=12, width=40, text_align=ft.TextAlign.END,
         )
 
         self._bg_navbar_switch = ft.Switch(
             label="导航栏透明",
-            value=self.config_service.get_config_value("bg_navbar_transparent", True),
+            value=cfg["bg_navbar_transparent"],
             on_change=self._on_bg_navbar_switch,
         )
         self._bg_navbar_slider = ft.Slider(
             min=0.1, max=0.9, divisions=16,
-            value=self.config_service.get_config_value("bg_navbar_opacity", 0.25),
+            value=cfg["bg_navbar_opacity"],
             on_change=self._on_bg_navbar_opacity,
         )
         self._bg_navbar_label = ft.Text(
-            f"{int(self.config_service.get_config_value('bg_navbar_opacity', 0.25) * 100)}%",
+            f"{int(cfg['bg_navbar_opacity'] * 100)}%",
             size=12, width=40, text_align=ft.TextAlign.END,
         )
 
         self._bg_content_switch = ft.Switch(
             label="内容区透明",
-            value=self.config_service.get_config_value("bg_content_transparent", True),
+            value=cfg["bg_content_transparent"],
             on_change=self._on_bg_content_switch,
         )
         self._bg_content_slider = ft.Slider(
             min=0.1, max=0.9, divisions=16,
-            value=self.config_service.get_config_value("bg_content_opacity", 0.10),
+            value=cfg["bg_content_opacity"],
             on_change=self._on_bg_content_opacity,
         )
         self._bg_content_label = ft.Text(
-            f"{int(self.config_service.get_config_value('bg_content_opacity', 0.10) * 100)}%",
+            f"{int(cfg['bg_content_opacity'] * 100)}%",
             size=12, width=40, text_align=ft.TextAlign.END,
         )
 
@@ -1538,94 +2229,149 @@ class SettingsView(ft.Container):
             border_radius=BORDER_RADIUS_MEDIUM,
         )
     
+    # 滑块预览节流间隔（约 30 fps）
+    _SLIDER_THROTTLE = 1 / 30
+    
+    def _throttled(self, name: str, apply) -> None:
+        """节流执行滑块预览：窗口期外立即执行，窗口期内只保留最新一次并在窗口结束时执行。
+        
+        Args:
+            name: 节流通道名称
+            apply: 无参回调，应捕获最新的滑块值
+        """
+        state = self._throttle_state.setdefault(name, [0.0, None])
+        if state[1] is not None:
+            # 已有尾随执行在等待，只替换为最新回调
+            state[1] = apply
+            return
+        
+        now = time.monotonic()
+        elapsed = now - state[0]
+        if elapsed >= self._SLIDER_THROTTLE:
+            state[0] = now
+            apply()
+            return
+        
+        page = self.active_page
+        if not page:
+            return
+        state[1] = apply
+        
+        async def trailing():
+            await asyncio.sleep(self._SLIDER_THROTTLE - elapsed)
+            fn, state[1] = state[1], None
+            state[0] = time.monotonic()
+            if fn:
+                fn()
+        
+        page.run_task(trailing)
+    
     def _on_opacity_change(self, e: ft.ControlEvent) -> None:
-        """透明度改变事件。"""
+        """透明度拖动事件：节流预览，不写配置。"""
         value = e.control.value
         self.opacity_value_text.value = f"{int(value * 100)}%"
-        
-        # 保存配置
-        self.config_service.set_config_value("window_opacity", value)
-        
+        self._throttled("window_opacity", lambda: self._apply_window_opacity(value))
+    
+    def _on_opacity_change_end(self, e: ft.ControlEvent) -> None:
+        """透明度拖动结束事件：应用最终值并保存配置。"""
+        value = e.control.value
+        self.config_service.set_config_value("window_opacity", value, background=True)
+        self._apply_window_opacity(value)
+    
+    def _apply_window_opacity(self, value: float) -> None:
+        """将窗口不透明度应用到窗口及各区域。"""
         # 使用保存的页面引用
-        page = getattr(self, '_saved_page', self._page)
+        page = self.active_page
         if not page:
             return
         
         # 立即应用透明度 - 使用 window.opacity
         page.window.opacity = value
+        self._last_applied_opacity = value
+        
+        changed: List[ft.Control] = [page.window, self.opacity_value_text]
         
         # 同时更新各区域透明度
-        if hasattr(page, '_main_view'):
-            mv = page._main_view
+        mv = self._main_view
+        if mv is not None:
             has_bg = bool(self.config_service.get_config_value("background_image", None))
             if has_bg:
                 mv._apply_bg_opacity_from_config()
+                changed += [self._title_bar, self._nav_container, mv.content_bg]
             else:
-                if hasattr(mv, 'navigation_container'):
-                    mv.navigation_container.bgcolor = ft.Colors.with_opacity(1.0, ft.Colors.SURFACE)
-                if hasattr(mv, 'title_bar'):
-                    mv.title_bar.bgcolor = ft.Colors.with_opacity(0.95 * value, mv.title_bar.theme_color)
+                if self._nav_container is not None:
+                    self._nav_container.bgcolor = _with_opacity(1.0, ft.Colors.SURFACE)
+                    changed.append(self._nav_container)
+                if self._title_bar is not None:
+                    self._title_bar.bgcolor = _with_opacity(0.95 * value, self._title_bar.theme_color)
+                    changed.append(self._title_bar)
         
         # 同时更新 FAB 的透明度
-        if hasattr(page, '_main_view_instance') and hasattr(page._main_view_instance, 'fab_search') and page._main_view_instance.fab_search:
-            fab_opacity = 0.9 * value
-            page._main_view_instance.fab_search.bgcolor = ft.Colors.with_opacity(
-                fab_opacity,
-                ft.Colors.PRIMARY
-            )
+        if self._fab is not None:
+            self._fab.bgcolor = _with_opacity(0.9 * value, ft.Colors.PRIMARY)
+            changed.append(self._fab)
         
-        page.update()
+        self._update_controls(*changed)
     
     # ── 背景各区域透明度事件 ──
 
-    def _refresh_bg_opacity(self) -> None:
-        """读取配置并刷新各区域透明度。"""
-        page = getattr(self, '_saved_page', self._page)
-        if page and hasattr(page, '_main_view'):
-            page._main_view._apply_bg_opacity_from_config()
-            page.update()
+    def _refresh_bg_opacity(self, *changed: ft.Control) -> None:
+        """读取配置并刷新各区域透明度（拖动时节流）。
+        
+        Args:
+            *changed: 设置页中需要一并刷新的控件（滑块/百分比文本）
+        """
+        mv = self._main_view
+        if mv is not None:
+            def apply():
+                mv._apply_bg_opacity_from_config()
+                self._update_controls(self._title_bar, self._nav_container, mv.content_bg, *changed)
+            self._throttled("bg_opacity", apply)
 
     def _on_bg_titlebar_switch(self, e: ft.ControlEvent) -> None:
         on = e.control.value
-        self.config_service.set_config_value("bg_titlebar_transparent", on)
+        self.config_service.set_config_value("bg_titlebar_transparent", on, background=True)
         self._bg_titlebar_slider.disabled = not on
-        self._refresh_bg_opacity()
+        self._refresh_bg_opacity(self._bg_titlebar_slider)
 
     def _on_bg_titlebar_opacity(self, e: ft.ControlEvent) -> None:
         v = e.control.value
         self._bg_titlebar_label.value = f"{int(v * 100)}%"
-        self.config_service.set_config_value("bg_titlebar_opacity", v)
-        self._refresh_bg_opacity()
+        self.config_service.set_config_value("bg_titlebar_opacity", v, background=True)
+        self._refresh_bg_opacity(self._bg_titlebar_label)
 
     def _on_bg_navbar_switch(self, e: ft.ControlEvent) -> None:
         on = e.control.value
-        self.config_service.set_config_value("bg_navbar_transparent", on)
+        self.config_service.set_config_value("bg_navbar_transparent", on, background=True)
         self._bg_navbar_slider.disabled = not on
-        self._refresh_bg_opacity()
+        self._refresh_bg_opacity(self._bg_navbar_slider)
 
     def _on_bg_navbar_opacity(self, e: ft.ControlEvent) -> None:
         v = e.control.value
         self._bg_navbar_label.value = f"{int(v * 100)}%"
-        self.config_service.set_config_value("bg_navbar_opacity", v)
-        self._refresh_bg_opacity()
+        self.config_service.set_config_value("bg_navbar_opacity", v, background=True)
+        self._refresh_bg_opacity(self._bg_navbar_label)
 
     def _on_bg_content_switch(self, e: ft.ControlEvent) -> None:
         on = e.control.value
-        self.config_service.set_config_value("bg_content_transparent", on)
+        self.config_service.set_config_value("bg_content_transparent", on, background=True)
         self._bg_content_slider.disabled = not on
-        self._refresh_bg_opacity()
+        self._refresh_bg_opacity(self._bg_content_slider)
 
     def _on_bg_content_opacity(self, e: ft.ControlEvent) -> None:
         v = e.control.value
         self._bg_content_label.value = f"{int(v * 100)}%"
-        self.config_service.set_config_value("bg_content_opacity", v)
-        self._refresh_bg_opacity()
+        self.config_service.set_config_value("bg_content_opacity", v, background=True)
+        self._refresh_bg_opacity(self._bg_content_label)
 
+    # 背景图片可选的文件扩展名
+    _BG_IMAGE_EXTENSIONS = ("png", "jpg", "jpeg", "webp", "bmp")
+    
     async def _on_pick_bg_image(self, e: ft.ControlEvent) -> None:
-        """选择背景图片。"""
+        """选择背景图片（使用 MainView 挂载的共享 FilePicker）。"""
         result = await pick_files(
             self._page,
-            allowed_extensions=["png", "jpg", "jpeg", "webp", "bmp"],
+            allowed_extensions=list(self._BG_IMAGE_EXTENSIONS),
             dialog_title="选择背景图片"
         )
         if result and len(result) > 0:
@@ -1635,13 +2381,9 @@ class SettingsView(ft.Container):
             # 保存配置
             self.config_service.set_config_value("background_image", image_path)
             
-            # 立即应用背景图片
+            # 立即应用背景图片（内部已整页刷新，背景未变化时只需刷新路径文本）
             self._apply_background_image(image_path, self.bg_fit_dropdown.value)
-            
-            # 更新页面
-            page = getattr(self, '_saved_page', self._page)
-            if page:
-                page.update()
+            self._update_controls(self.bg_image_text)
     
     def _on_clear_bg_image(self, e: ft.ControlEvent) -> None:
         """清除背景图片事件。"""
@@ -1650,20 +2392,16 @@ class SettingsView(ft.Container):
         # 保存配置
         self.config_service.set_config_value("background_image", None)
         
-        # 清除背景图片
+        # 清除背景图片（内部已整页刷新，背景未变化时只需刷新路径文本）
         self._apply_background_image(None, None)
-        
-        # 更新页面
-        page = getattr(self, '_saved_page', self._page)
-        if page:
-            page.update()
+        self._update_controls(self.bg_image_text)
     
     def _on_bg_fit_change(self, e: ft.ControlEvent) -> None:
         """背景图片适应模式改变事件。"""
         fit_mode = e.control.value
         
         # 保存配置
-        self.config_service.set_config_value("background_image_fit", fit_mode)
+        self.config_service.set_config_value("background_image_fit", fit_mode, background=True)
         
         # 重新应用背景图片
         bg_image = self.config_service.get_config_value("background_image", None)
@@ -1672,33 +2410,43 @@ class SettingsView(ft.Container):
     
     def _apply_background_image(self, image_path: Optional[str], fit_mode: Optional[str]) -> None:
         """应用背景图片。"""
-        # 通过 _saved_page 获取页面引用(因为 self._page 可能在布局重建后失效)
-        page = getattr(self, '_saved_page', self._page)
+        # 通过 active_page 获取页面引用(因为 self._page 可能在布局重建后失效)
+        page = self.active_page
         
         if not page:
             return
-            
+        
+        current_opacity = self.config_service.get_config_value("window_opacity", 1.0)
+        background_changed = (image_path, fit_mode) != self._last_background
+        opacity_changed = current_opacity != self._last_applied_opacity
+        if not background_changed and not opacity_changed:
+            return
+        
         # 应用背景图片
-        if hasattr(page, '_main_view') and hasattr(page._main_view, 'apply_background'):
-            page._main_view.apply_background(image_path, fit_mode)
+        if background_changed:
+            if self._main_view is not None:
+                self._main_view.apply_background(image_path, fit_mode, defer_update=True)
+            self._last_background = (image_path, fit_mode)
             
-        # 显示/隐藏透明度控制区域
-        if hasattr(self, '_bg_opacity_section'):
-            self._bg_opacity_section.visible = bool(image_path)
+            # 显示/隐藏透明度控制区域
+            if hasattr(self, '_bg_opacity_section'):
+                self._bg_opacity_section.visible = bool(image_path)
 
-        page.window.opacity = self.config_service.get_config_value("window_opacity", 1.0)
+        if opacity_changed:
+            page.window.opacity = current_opacity
+            self._last_applied_opacity = current_opacity
 
-        # 重新应用 FAB 透明度
-        current_opacity = self.config_service.get_config_value("window_opacity", 1.0)
-        if hasattr(page, '_main_view_instance') and hasattr(page._main_view_instance, 'fab_search') and page._main_view_instance.fab_search:
-            page._main_view_instance.fab_search.bgcolor = ft.Colors.with_opacity(
-                0.9 * current_opacity, ft.Colors.PRIMARY
-            )
+            # 重新应用 FAB 透明度
+            if self._fab is not None:
+                self._fab.bgcolor = _with_opacity(0.9 * current_opacity, ft.Colors.PRIMARY)
 
+        # 背景、透明度与 FAB 的修改合并为一次刷新
         page.update()
 
-    def _fetch_bing_wallpaper(self, n: int = 8) -> Optional[List[Dict]]:
-        """使用 httpx 从必应壁纸 API 获取最近 n 张壁纸的信息。
+    _BING_BASE_URL = "https://www.bing.com"
+    
+    async def _fetch_bing_wallpaper_async(self, n: int = 8) -> Optional[List[Dict]]:
+        """异步从必应壁纸 API 获取最近 n 张壁纸的信息。
 
         Args:
             n: 获取最近 n 张壁纸（默认8）
@@ -1707,47 +2455,46 @@ class SettingsView(ft.Container):
             壁纸信息列表，每项包含 url、title、copyright 等字段，失败时返回 None
         """
         try:
-            api = f"https://www.bing.com/HPImageArchive.aspx?format=js&n={n}&mkt=zh-CN"
-            resp = httpx.get(api, timeout=10.0)
+            api = f"{self._BING_BASE_URL}/HPImageArchive.aspx?format=js&n={n}&mkt=zh-CN"
+            resp = await _get_async_http_client().get(api)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             images = data.get("images", [])
             if not images:
                 return None
             
-            # 处理图片URL，确保是完整的URL
-            wallpapers = []
-            for img in images:
-                url = img.get("url", "")
-                if url:
-                    # 如果是相对路径，拼接主域名
-                    if not url.startswith("http"):
-                        url = "https://www.bing.com" + url
-                    wallpapers.append({
-                        "url": url,
-                        "title": img.get("title", ""),
-                        "copyright": img.get("copyright", ""),
-                        "startdate": img.get("startdate", ""),
-                    })
+            # 处理图片URL，相对路径拼接主域名，绝对路径保持不变
+            wallpapers = [
+                {
+                    "url": urljoin(self._BING_BASE_URL, url),
+                    "title": img.get("title", ""),
+                    "copyright": img.get("copyright", ""),
+                    "startdate": img.get("startdate", ""),
+                }
+                for img in images
+                if (url := img.get("url"))
+            ]
             
             return wallpapers if wallpapers else None
         except Exception:
             return None
 
-    def _on_random_wallpaper(self, e: ft.ControlEvent) -> None:
-        """事件处理：从必应获取随机壁纸并应用。"""
+    async def _on_random_wallpaper(self, e: ft.ControlEvent) -> None:
+        """事件处理：从必应获取随机壁纸并应用（异步请求，不阻塞界面）。"""
         # 显示提示
         self._show_snackbar("正在从必应获取壁纸...", ft.Colors.BLUE)
 
-        # 直接同步请求（请求较快），若担心阻塞可改为后台线程
-        wallpapers = self._fetch_bing_wallpaper()
+        wallpapers = await self._fetch_bing_wallpaper_async()
         if wallpapers:
             # 保存壁纸列表
             self.bing_wallpapers = wallpapers
+            self._wallpaper_url_index = {wp["url"]: i for i, wp in enumerate(wallpapers)}
             self.current_wallpaper_index = 0
+            await _run_io(self._save_wallpaper_cache, wallpapers)
             
-            # 应用第一张壁纸
+            # 应用第一张壁纸，并在后台预取其余壁纸
             self._apply_wallpaper(0)
+            self._schedule_wallpaper_cache(*wallpapers[1:])
             
             # 更新UI
             self._update_wallpaper_info_ui()
@@ -1774,22 +2521,126 @@ class SettingsView(ft.Container):
         wallpaper = self.bing_wallpapers[index]
         url = wallpaper["url"]
         
+        # 已缓存到本地则直接使用本地文件，否则先用URL显示并在后台缓存
+        local_path = wallpaper.get("local_path")
+        if local_path:
+            try:
+                # 刷新修改时间，供缓存按最近使用淘汰
+                os.utime(local_path)
+            except OSError:
+                local_path = None
+        if not local_path:
+            self._schedule_wallpaper_cache(wallpaper)
+        
         # 更新UI文本（背景图片显示友好的标题）
         try:
             self.bg_image_text.value = f"必应壁纸: {wallpaper['title']}"
             # 使用 page.update() 而不是控件的 update()
-            page = getattr(self, '_saved_page', self._page)
+            page = self.active_page
             if page:
                 page.update()
         except Exception:
             pass
         
-        # 保存配置
+        # 保存配置（仍保存URL，用于启动时识别必应壁纸）
         self.config_service.set_config_value("background_image", url)
         self.current_wallpaper_index = index
         
         # 立即应用
-        self._apply_background_image(url, self.bg_fit_dropdown.value)
+        self._apply_background_image(local_path or url, self.bg_fit_dropdown.value)
+    
+    def _get_wallpaper_cache_dir(self) -> Path:
+        """获取必应壁纸本地缓存目录。"""
+        cache_dir: Path = self.config_service.get_data_dir() / "cache" / "bing_wallpapers"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir
+    
+    def _download_wallpaper_image(self, wallpaper: Dict) -> Optional[str]:
+        """流式下载壁纸图片到本地缓存，避免整张图片在内存中重复缓冲。
+        
+        Args:
+            wallpaper: 壁纸信息字典，成功后写入 local_path 字段
+        
+        Returns:
+            本地缓存文件路径，失败时返回 None
+        """
+        local_path = wallpaper.get("local_path")
+        if local_path and os.path.exists(local_path):
+            return local_path
+        
+        url = wallpaper.get("url")
+        if not url:
+            return None
+        
+        try:
+            file_name = hashlib.md5(url.encode("utf-8")).hexdigest() + ".jpg"
+            cache_path = self._get_wallpaper_cache_dir() / file_name
+            if not cache_path.exists():
+                tmp_path = cache_path.with_suffix(".part")
+                with _get_http_client().stream("GET", url, timeout=30.0) as resp:
+                    resp.raise_for_status()
+                    with open(tmp_path, "wb") as f:
+                        for chunk in resp.iter_bytes(chunk_size=65536):
+                            f.write(chunk)
+                os.replace(tmp_path, cache_path)
+            
+            wallpaper["local_path"] = str(cache_path)
+            return wallpaper["local_path"]
+        except Exception as e:
+            logger.warning(f"缓存必应壁纸失败: {e}")
+            return None
+    
+    # 壁纸图片磁盘缓存上限（字节），超出后按最近使用时间淘汰
+    _WALLPAPER_CACHE_MAX_BYTES = 128 * 1024 * 1024
+    
+    def _trim_wallpaper_cache(self) -> None:
+        """淘汰最久未使用的壁纸缓存文件，使缓存目录不超过容量上限。"""
+        try:
+            files = [p for p in self._get_wallpaper_cache_dir().glob("*.jpg")]
+            stats = [(p, p.stat()) for p in files]
+            total = sum(st.st_size for _, st in stats)
+            if total <= self._WALLPAPER_CACHE_MAX_BYTES:
+                return
+            # 当前列表中的壁纸不淘汰
+            in_use = {wp.get("local_path") for wp in self.bing_wallpapers}
+            for path, st in sorted(stats, key=lambda item: item[1].st_mtime):
+                if total <= self._WALLPAPER_CACHE_MAX_BYTES:
+                    break
+                if str(path) in in_use:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= st.st_size
+        except Exception as e:
+            logger.warning(f"清理壁纸缓存失败: {e}")
+    
+    def _schedule_wallpaper_cache(self, *wallpapers: Dict) -> None:
+        """在后台并发缓存（预取）壁纸图片，下次切换时直接使用本地文件。
+        
+        各图片在独立线程中同时下载，共用 _HTTP_CLIENT 的连接池；
+        已缓存或正在下载的壁纸会被跳过。
+        """
+        page = self.active_page
+        if not page:
+            return
+        
+        pending = [
+            wp for wp in wallpapers
+            if wp.get("url") and wp["url"] not in self._wallpaper_downloads
+        ]
+        if not pending:
+            return
+        self._wallpaper_downloads.update(wp["url"] for wp in pending)
+        
+        async def _cache():
+            try:
+                await asyncio.gather(
+                    *(asyncio.to_thread(self._download_wallpaper_image, wp) for wp in pending)
+                )
+                await asyncio.to_thread(self._trim_wallpaper_cache)
+            finally:
+                self._wallpaper_downloads.difference_update(wp["url"] for wp in pending)
+        
+        page.run_task(_cache)
     
     def _next_wallpaper(self, e: Optional[ft.ControlEvent] = None) -> None:
         """切换到下一张壁纸。"""
@@ -1812,29 +2663,34 @@ class SettingsView(ft.Container):
         self._update_wallpaper_info_ui()
     
     def _update_wallpaper_info_ui(self) -> None:
-        """更新壁纸信息UI。"""
+        """更新壁纸信息UI。
+        
+        只修改内容有变化的文本控件；设置页不在当前路由时仅更新控件值，
+        不向客户端发送刷新，切回设置页时随页面刷新一并显示。
+        """
         if not self.bing_wallpapers:
             return
         
         try:
             wallpaper = self.bing_wallpapers[self.current_wallpaper_index]
+            updates = (
+                # 壁纸计数
+                ('wallpaper_count_text', f"{self.current_wallpaper_index + 1} / {len(self.bing_wallpapers)}"),
+                # 壁纸信息
+                ('wallpaper_info_text', f"{wallpaper['title']}\n{wallpaper['copyright']}"),
+                # 背景图片文本（显示友好的标题而不是URL）
+                ('bg_image_text', f"必应壁纸: {wallpaper['title']}"),
+            )
             
-            # 更新壁纸计数显示
-            if hasattr(self, 'wallpaper_count_text'):
-                self.wallpaper_count_text.value = f"{self.current_wallpaper_index + 1} / {len(self.bing_wallpapers)}"
-            
-            # 更新壁纸信息
-            if hasattr(self, 'wallpaper_info_text'):
-                self.wallpaper_info_text.value = f"{wallpaper['title']}\n{wallpaper['copyright']}"
-            
-            # 更新背景图片文本显示（显示友好的标题而不是URL）
-            if hasattr(self, 'bg_image_text'):
-                self.bg_image_text.value = f"必应壁纸: {wallpaper['title']}"
+            changed: List[ft.Control] = []
+            for attr, value in updates:
+                control = getattr(self, attr, None)
+                if control is not None and control.value != value:
+                    control.value = value
+                    changed.append(control)
             
-            # 使用 page.update() 统一更新，避免在后台线程中直接调用控件的 update()
-            page = getattr(self, '_saved_page', self._page)
-            if page:
-                page.update()
+            if changed and self._is_settings_route_active():
+                self._update_controls(*changed)
         except Exception as e:
             # 如果更新失败，至少确保不显示"加载中"
             logger.error(f"更新壁纸UI信息失败: {e}")
@@ -1842,12 +2698,7 @@ class SettingsView(ft.Container):
                 # 如果更新失败，显示通用的"必应壁纸"
                 if "加载中" in self.bg_image_text.value or self.bg_image_text.value.startswith("http"):
                     self.bg_image_text.value = "必应壁纸"
-                    try:
-                        page = getattr(self, '_saved_page', self._page)
-                        if page:
-                            page.update()
-                    except Exception:
-                        pass
+                    self._update_controls(self.bg_image_text)
     
     def _on_download_wallpaper(self, e: Optional[ft.ControlEvent] = None) -> None:
         """下载当前壁纸到浏览器。"""
@@ -1856,7 +2707,6 @@ class SettingsView(ft.Container):
             return
         
         try:
-            import webbrowser
             wallpaper = self.bing_wallpapers[self.current_wallpaper_index]
             url = wallpaper["url"]
             
@@ -1869,7 +2719,7 @@ class SettingsView(ft.Container):
     def _on_auto_switch_change(self, e: ft.ControlEvent) -> None:
         """自动切换开关改变事件。"""
         enabled = e.control.value
-        self.config_service.set_config_value("wallpaper_auto_switch", enabled)
+        self.config_service.set_config_value("wallpaper_auto_switch", enabled, background=True)
         
         if enabled:
             # 启动自动切换
@@ -1881,57 +2731,51 @@ class SettingsView(ft.Container):
             self._stop_auto_switch()
             self._show_snackbar("已关闭自动切换壁纸", ft.Colors.ORANGE)
     
+    def _on_switch_interval_dragging(self, e: ft.ControlEvent) -> None:
+        """切换间隔拖动事件：仅更新显示文本。"""
+        self.switch_interval_text.value = f"{int(e.control.value)} 分钟"
+        try:
+            self.switch_interval_text.update()
+        except Exception:
+            pass
+    
     def _on_switch_interval_change(self, e: ft.ControlEvent) -> None:
-        """切换间隔改变事件。"""
+        """切换间隔拖动结束事件：保存配置并重启定时器。"""
         interval = int(e.control.value)
-        self.config_service.set_config_value("wallpaper_switch_interval", interval)
+        self.config_service.set_config_value("wallpaper_switch_interval", interval, background=True)
         
         # 如果自动切换已启用，重新启动定时器
         if self.config_service.get_config_value("wallpaper_auto_switch", False):
             self._start_auto_switch(interval)
         
         # 更新显示
-        if hasattr(self, 'switch_interval_text'):
-            self.switch_interval_text.value = f"{interval} 分钟"
-            try:
-                self._page.update()
-            except Exception:
-                pass
+        self._on_switch_interval_dragging(e)
     
     def _start_auto_switch(self, interval_minutes: int) -> None:
-        """启动自动切换定时器。
+        """启动自动切换任务。
         
         Args:
             interval_minutes: 切换间隔（分钟）
         """
-        # 先停止现有定时器
+        # 先停止现有任务
         self._stop_auto_switch()
         
-        # 使用代数计数器来安全地取消旧的异步任务
-        self._auto_switch_generation = getattr(self, '_auto_switch_generation', 0) + 1
-        current_gen = self._auto_switch_generation
-        
-        async def switch_task():
-            import asyncio
-            await asyncio.sleep(interval_minutes * 60)
-            # 仅当代数未变（未被 stop 或新 start 取消）时才执行
-            if getattr(self, '_auto_switch_generation', -1) == current_gen:
+        async def switch_loop():
+            # 单个常驻循环任务，停止或重新启动时通过取消句柄结束
+            while True:
+                await asyncio.sleep(interval_minutes * 60)
                 if self.bing_wallpapers:
                     self._next_wallpaper()
-                # 递归调用，继续下一次定时
-                self._start_auto_switch(interval_minutes)
         
-        page = getattr(self, '_saved_page', self._page)
+        page = self.active_page
         if page:
-            page.run_task(switch_task)
+            self.auto_switch_task = page.run_task(switch_loop)
     
     def _stop_auto_switch(self) -> None:
-        """停止自动切换定时器。"""
-        # 递增代数计数器，使所有正在等待的异步定时任务失效
-        self._auto_switch_generation = getattr(self, '_auto_switch_generation', 0) + 1
-        if self.auto_switch_timer:
-            self.auto_switch_timer.cancel()
-            self.auto_switch_timer = None
+        """停止自动切换任务。"""
+        if self.auto_switch_task:
+            self.auto_switch_task.cancel()
+            self.auto_switch_task = None
     
     def _build_interface_section(self) -> ft.Container:
         """构建界面设置部分。
@@ -1939,6 +2783,10 @@ class SettingsView(ft.Container):
         Returns:
             界面设置容器
         """
+        # 已构建过则直接复用，开关状态由各事件处理器原地修改
+        if self._interface_section is not None:
+            return self._interface_section
+        
         section_title = ft.Text(
             "界面设置",
             size=20,
@@ -1946,10 +2794,16 @@ class SettingsView(ft.Container):
         )
         
         # 获取当前配置
-        show_recommendations = self.config_service.get_config_value("show_recommendations_page", True)
-        save_logs = self.config_service.get_config_value("save_logs", False)
-        show_weather = self.config_service.get_config_value("show_weather", True)
-        minimize_to_tray = self.config_service.get_config_value("minimize_to_tray", False)
+        cfg = self.config_service.get_many({
+            "show_recommendations_page": True,
+            "save_logs": False,
+            "show_weather": True,
+            "minimize_to_tray": False,
+        })
+        show_recommendations = cfg["show_recommendations_page"]
+        save_logs = cfg["save_logs"]
+        show_weather = cfg["show_weather"]
+        minimize_to_tray = cfg["minimize_to_tray"]
         
         # 推荐工具页面开关
         self.recommendations_switch = ft.Switch(
@@ -2021,69 +2875,61 @@ class SettingsView(ft.Container):
             color=ft.Colors.ORANGE,
         )
         
-        return ft.Container(
+        # 开关与说明文字成组（间距 SMALL），各组之间用分隔线隔开（间距 MEDIUM）
+        groups = (
+            (self.recommendations_switch, recommendations_info_text),
+            (self.save_logs_switch, logs_info_text),
+            (self.show_weather_switch, weather_info_text),
+            (self.minimize_to_tray_switch, tray_info_text),
+            (self.auto_start_switch, auto_start_info),
+        )
+        controls: List[ft.Control] = [section_title]
+        for i, group in enumerate(groups):
+            if i:
+                controls.append(ft.Divider())
+            controls.append(ft.Column(controls=list(group), spacing=PADDING_SMALL))
+        
+        self._interface_section = ft.Container(
             content=ft.Column(
-                controls=[
-                    section_title,
-                    ft.Container(height=PADDING_MEDIUM),
-                    self.recommendations_switch,
-                    ft.Container(height=PADDING_SMALL),
-                    recommendations_info_text,
-                    ft.Container(height=PADDING_MEDIUM),
-                    ft.Divider(),
-                    ft.Container(height=PADDING_MEDIUM),
-                    self.save_logs_switch,
-                    ft.Container(height=PADDING_SMALL),
-                    logs_info_text,
-                    ft.Container(height=PADDING_MEDIUM),
-                    ft.Divider(),
-                    ft.Container(height=PADDING_MEDIUM),
-                    self.show_weather_switch,
-                    ft.Container(height=PADDING_SMALL),
-                    weather_info_text,
-                    ft.Container(height=PADDING_MEDIUM),
-                    ft.Divider(),
-                    ft.Container(height=PADDING_MEDIUM),
-                    self.minimize_to_tray_switch,
-                    ft.Container(height=PADDING_SMALL),
-                    tray_info_text,
-                    ft.Container(height=PADDING_MEDIUM),
-                    ft.Divider(),
-                    ft.Container(height=PADDING_MEDIUM),
-                    self.auto_start_switch,
-                    ft.Container(height=PADDING_SMALL),
-                    auto_start_info,
-                ],
-                spacing=0,
+                controls=controls,
+                spacing=PADDING_MEDIUM,
             ),
             padding=PADDING_LARGE,
             border=ft.Border.all(1, ft.Colors.OUTLINE_VARIANT),
             border_radius=BORDER_RADIUS_MEDIUM,
         )
+        return self._interface_section
+    
+    def _revert_switch(self, switch: ft.Switch, value: bool) -> None:
+        """将开关回滚为指定值，仅局部刷新该开关。
+        
+        Args:
+            switch: 需要回滚的开关控件
+            value: 回滚后的值
+        """
+        switch.value = value
+        self._update_controls(switch)
     
     def _on_recommendations_switch_change(self, e: ft.ControlEvent) -> None:
         """推荐工具页面开关改变事件。"""
         enabled = e.control.value
-        if self.config_service.set_config_value("show_recommendations_page", enabled):
+        if self.config_service.set_config_value("show_recommendations_page", enabled, background=True):
             # 立即更新推荐工具页面显示状态
-            if hasattr(self._page, '_main_view'):
-                self._page._main_view.update_recommendations_visibility(enabled)
+            if self._main_view is not None:
+                self._main_view.update_recommendations_visibility(enabled)
             
-            status = "已显示" if enabled else "已隐藏"
-            self._show_snackbar(f"推荐工具页面{status}", ft.Colors.GREEN)
+            self._show_snackbar(_MSG_RECOMMENDATIONS[enabled], _COLOR_SUCCESS)
         else:
+            self._revert_switch(e.control, not enabled)
             self._show_snackbar("设置更新失败", ft.Colors.RED)
     
     def _on_save_logs_switch_change(self, e: ft.ControlEvent) -> None:
         """日志保存开关改变事件。"""
-        from utils import logger
-        
         enabled = e.control.value
-        if self.config_service.set_config_value("save_logs", enabled):
+        if self.config_service.set_config_value("save_logs", enabled, background=True):
             # 立即启用或禁用文件日志
             if enabled:
                 logger.enable_file_logging()
-                import os
                 if os.name == 'nt':
                     log_path = os.path.join(os.environ.get("APPDATA", ""), "MTools", "logs")
                 else:
@@ -2093,37 +2939,42 @@ class SettingsView(ft.Container):
                 logger.disable_file_logging()
                 self._show_snackbar("日志保存已禁用", ft.Colors.GREEN)
         else:
+            self._revert_switch(e.control, not enabled)
             self._show_snackbar("设置更新失败", ft.Colors.RED)
     
     def _on_show_weather_switch_change(self, e: ft.ControlEvent) -> None:
         """天气显示开关改变事件。"""
         enabled = e.control.value
-        if self.config_service.set_config_value("show_weather", enabled):
+        if self.config_service.set_config_value("show_weather", enabled, background=True):
             # 立即更新天气显示状态
-            if hasattr(self._page, '_main_view') and hasattr(self._page._main_view, 'title_bar'):
-                self._page._main_view.title_bar.set_weather_visibility(enabled)
+            if self._title_bar is not None:
+                self._title_bar.set_weather_visibility(enabled)
             
-            status = "已显示" if enabled else "已隐藏"
-            self._show_snackbar(f"天气信息{status}", ft.Colors.GREEN)
+            self._show_snackbar(_MSG_SHOW_WEATHER[enabled], _COLOR_SUCCESS)
         else:
+            self._revert_switch(e.control, not enabled)
             self._show_snackbar("设置更新失败", ft.Colors.RED)
     
     def _on_minimize_to_tray_switch_change(self, e: ft.ControlEvent) -> None:
         """最小化到托盘开关改变事件。"""
         enabled = e.control.value
-        if self.config_service.set_config_value("minimize_to_tray", enabled):
+        if self.config_service.set_config_value("minimize_to_tray", enabled, background=True):
             # 立即更新托盘功能状态
-            if hasattr(self._page, '_main_view') and hasattr(self._page._main_view, 'title_bar'):
-                self._page._main_view.title_bar.set_minimize_to_tray(enabled)
+            if self._title_bar is not None:
+                self._title_bar.set_minimize_to_tray(enabled)
             
-            status = "已启用" if enabled else "已禁用"
-            self._show_snackbar(f"最小化到系统托盘{status}", ft.Colors.GREEN)
+            self._show_snackbar(_MSG_MINIMIZE_TO_TRAY[enabled], _COLOR_SUCCESS)
         else:
+            self._revert_switch(e.control, not enabled)
             self._show_snackbar("设置更新失败", ft.Colors.RED)
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def _is_compiled() -> bool:
-        """检查是否为编译后的版本（支持 Nuitka 和 flet build）。"""
+        """检查是否为编译后的版本（支持 Nuitka 和 flet build）。
+
+        运行期间结果不会变化，首次计算后缓存。
+        """
         if getattr(sys, 'frozen', False):
             return True
         if os.environ.get("FLET_ASSETS_DIR") or os.environ.get("FLET_APP_CONSOLE"):
@@ -2138,8 +2989,7 @@ class SettingsView(ft.Container):
     def _on_auto_start_switch_change(self, e: ft.ControlEvent) -> None:
         """开机自启动开关改变事件（功能暂时禁用）。"""
         self._show_snackbar("此功能暂时不可用，将在后续版本中修复", ft.Colors.ORANGE)
-        e.control.value = False
-        self._page.update()
+        self._revert_switch(e.control, False)
         return
 
         # --- 以下代码暂时禁用 ---
@@ -2147,26 +2997,21 @@ class SettingsView(ft.Container):
 
         if not self._is_compiled():
             self._show_snackbar("此功能仅在编译后的版本中可用", ft.Colors.ORANGE)
-            e.control.value = False
-            self._page.update()
+            self._revert_switch(e.control, False)
             return
 
         success = self._set_auto_start(enabled)
         
         if success:
             self.config_service.set_config_value("auto_start", enabled)
-            status = "已启用" if enabled else "已禁用"
-            self._show_snackbar(f"开机自启动{status}", ft.Colors.GREEN)
+            self._show_snackbar(_MSG_AUTO_START[enabled], _COLOR_SUCCESS)
         else:
             self._show_snackbar("设置开机自启动失败，请检查权限", ft.Colors.RED)
-            e.control.value = not enabled
-            self._page.update()
+            self._revert_switch(e.control, not enabled)
     
     @staticmethod
     def _get_app_exe_path() -> str | None:
         """获取应用主程序 exe 路径（支持 Nuitka 和 flet build）。"""
-        from pathlib import Path
-
         # Nuitka: sys.argv[0] 就是 exe
         if getattr(sys, 'frozen', False):
             p = Path(sys.argv[0])
@@ -2199,12 +3044,10 @@ class SettingsView(ft.Container):
         Returns:
             是否成功
         """
-        if sys.platform != 'win32':
+        if winreg is None:
             return False
 
         try:
-            import winreg
-
             app_name = "MTools"
             key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
@@ -2237,6 +3080,11 @@ class SettingsView(ft.Container):
             logger.error(f"设置开机自启动失败: {e}")
             return False
     
+    # GPU 内存限制滑块范围：512MB ~ 24GB，每 512MB 一个刻度
+    _GPU_MEMORY_MIN = 512
+    _GPU_MEMORY_MAX = 24576
+    _GPU_MEMORY_DIVISIONS = (_GPU_MEMORY_MAX - _GPU_MEMORY_MIN) // 512
+    
     def _build_gpu_acceleration_section(self) -> ft.Container:
         """构建GPU加速设置部分，包括高级参数配置。"""
 
@@ -2247,15 +3095,19 @@ class SettingsView(ft.Container):
             weight=ft.FontWeight.W_600,
         )
 
-        import platform as _platform
-        _is_macos = _platform.system() == "Darwin"
-        gpu_enabled = self.config_service.get_config_value("gpu_acceleration", not _is_macos)
-        gpu_memory_limit = self.config_service.get_config_value("gpu_memory_limit", 8192)
-        gpu_device_id = self.config_service.get_config_value("gpu_device_id", 0)
-        enable_memory_arena = self.config_service.get_config_value("gpu_enable_memory_arena", False)
+        cfg = self.config_service.get_many({
+            "gpu_acceleration": not _IS_MACOS,
+            "gpu_memory_limit": 8192,
+            "gpu_device_id": 0,
+            "gpu_enable_memory_arena": False,
+        })
+        gpu_enabled = cfg["gpu_acceleration"]
+        gpu_memory_limit = cfg["gpu_memory_limit"]
+        gpu_device_id = cfg["gpu_device_id"]
+        enable_memory_arena = cfg["gpu_enable_memory_arena"]
 
         # GPU开关（macOS 上禁用）
-        if _is_macos:
+        if _IS_MACOS:
             gpu_enabled = False
             self.gpu_acceleration_switch = ft.Switch(
                 label="启用GPU加速",
@@ -2277,8 +3129,7 @@ class SettingsView(ft.Container):
 
             # 检测ONNX Runtime的GPU支持（用于AI功能：智能抠图、人声分离）
             try:
-                import onnxruntime as ort
-                available_providers = ort.get_available_providers()
+                available_providers = _cached_ort_providers()
                 
                 gpu_providers = []
                 if 'CUDAExecutionProvider' in available_providers:
@@ -2309,7 +3160,7 @@ class SettingsView(ft.Container):
                 )
 
         # macOS 不显示高级参数，直接返回简化版
-        if _is_macos:
+        if _IS_MACOS:
             return ft.Container(
                 content=ft.Column(
                     controls=[
@@ -2343,9 +3194,9 @@ class SettingsView(ft.Container):
         )
 
         self.gpu_memory_slider = ft.Slider(
-            min=512,
-            max=24576,  # 24GB
-            divisions=47,  # (24576-512)/512 ≈ 47，每512MB一个刻度
+            min=self._GPU_MEMORY_MIN,
+            max=self._GPU_MEMORY_MAX,
+            divisions=self._GPU_MEMORY_DIVISIONS,
             value=gpu_memory_limit,
             label=None,
             on_change=self._on_gpu_memory_dragging,
@@ -2360,24 +3211,19 @@ class SettingsView(ft.Container):
             color=ft.Colors.ON_SURFACE_VARIANT,
         )
 
-        # 动态检测GPU设备数量
+        # GPU设备选项（检测结果已缓存，点击刷新按钮时重新检测）
         gpu_device_options = self._get_gpu_device_options()
 
         # 检查 Provider 模式和 CUDA 设备可用性
-        from utils import get_primary_provider, get_cuda_devices
-        primary_provider = get_primary_provider()
+        primary_provider = _cached_primary_provider()
         is_directml = primary_provider == "DirectML"
         is_cuda = primary_provider == "CUDA"
-        cuda_available = bool(get_cuda_devices()) if is_cuda else False
-        
-        # 确定是否禁用 GPU 设备选择
-        disable_gpu_select = is_directml or (is_cuda and not cuda_available)
+        cuda_available = bool(_cached_cuda_devices()) if is_cuda else False
+        disable_gpu_select, gpu_select_hint = self._get_gpu_device_select_state()
         
         self.gpu_device_dropdown = ft.Dropdown(
             label="GPU设备",
-            hint_text="在多GPU系统中选择一个设备" if not disable_gpu_select else (
-                "DirectML 模式不支持设备选择" if is_directml else "未检测到 NVIDIA GPU"
-            ),
+            hint_text=gpu_select_hint,
             value=str(gpu_device_id) if cuda_available or not is_cuda else "0",
             options=gpu_device_options,
             on_select=self._on_gpu_device_change,
@@ -2385,6 +3231,22 @@ class SettingsView(ft.Container):
             disabled=disable_gpu_select,
         )
         
+        self.gpu_device_refresh_button = ft.IconButton(
+            icon=ft.Icons.REFRESH,
+            tooltip="重新检测GPU设备",
+            on_click=self._on_refresh_gpu_devices,
+            disabled=is_directml,
+        )
+        
+        gpu_device_row = ft.Row(
+            controls=[
+                self.gpu_device_dropdown,
+                self.gpu_device_refresh_button,
+            ],
+            spacing=PADDING_SMALL,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+        
         # GPU 设备选择提示
         if is_directml:
             hint_text = (
@@ -2419,7 +3281,7 @@ class SettingsView(ft.Container):
                 memory_label_row,
                 self.gpu_memory_slider,
                 self.gpu_memory_hint,
-                self.gpu_device_dropdown,
+                gpu_device_row,
                 self.gpu_device_hint,
                 self.memory_arena_switch,
             ],
@@ -2560,20 +3422,23 @@ class SettingsView(ft.Container):
             content=ft.Column(
                 controls=[
                     section_title,
-                    ft.Container(height=PADDING_MEDIUM),
-                    ft.Text("执行模式", size=14, weight=ft.FontWeight.W_500),
-                    ft.Container(height=PADDING_SMALL),
-                    self.execution_mode_radio,
-                    ft.Container(height=PADDING_MEDIUM),
-                    threads_label_row,
-                    self.cpu_threads_slider,
-                    threads_hint,
-                    ft.Container(height=PADDING_MEDIUM),
-                    self.model_cache_switch,
-                    ft.Container(height=PADDING_MEDIUM // 2),
-                    info_text,
+                    ft.Column(
+                        controls=[
+                            ft.Text("执行模式", size=14, weight=ft.FontWeight.W_500),
+                            self.execution_mode_radio,
+                        ],
+                        spacing=PADDING_SMALL,
+                    ),
+                    ft.Column(
+                        controls=[threads_label_row, self.cpu_threads_slider, threads_hint],
+                        spacing=0,
+                    ),
+                    ft.Column(
+                        controls=[self.model_cache_switch, info_text],
+                        spacing=PADDING_MEDIUM // 2,
+                    ),
                 ],
-                spacing=0,
+                spacing=PADDING_MEDIUM,
             ),
             padding=PADDING_LARGE,
             border=ft.Border.all(1, ft.Colors.OUTLINE_VARIANT),
@@ -2587,25 +3452,26 @@ class SettingsView(ft.Container):
             e: 控件事件对象
         """
         enabled = e.control.value
-        if self.config_service.set_config_value("gpu_acceleration", enabled):
-            status = "已启用" if enabled else "已禁用"
-            self._show_snackbar(f"GPU加速{status}，需重新加载模型生效", ft.Colors.GREEN)
+        if self.config_service.set_config_value("gpu_acceleration", enabled, background=True):
+            self._show_snackbar(_MSG_GPU_ACCELERATION[enabled], _COLOR_SUCCESS)
             self._update_gpu_controls_state(enabled)
         else:
             self._show_snackbar("GPU加速设置更新失败", ft.Colors.RED)
     
     def _on_gpu_memory_dragging(self, e: ft.ControlEvent) -> None:
-        """GPU内存限制拖动中事件处理（实时更新文本显示）。
+        """GPU内存限制拖动中事件处理（按帧节流更新文本显示）。
         
         Args:
             e: 控件事件对象
         """
-        memory_limit = int(e.control.value)
-        self.gpu_memory_value_text.value = f"{memory_limit} MB"
-        try:
-            self.gpu_memory_value_text.update()
-        except Exception:
-            pass
+        text = f"{int(e.control.value)} MB"
+        if text == self.gpu_memory_value_text.value:
+            return  # 显示值未变化，无需刷新
+        self.gpu_memory_value_text.value = text
+        self._throttled(
+            "gpu_memory",
+            lambda: self._update_controls(self.gpu_memory_value_text),
+        )
 
     def _on_gpu_memory_change(self, e: ft.ControlEvent) -> None:
         """GPU内存限制拖动结束事件处理（保存配置并提示）。
@@ -2615,7 +3481,7 @@ class SettingsView(ft.Container):
         """
         memory_limit = int(e.control.value)
         self.gpu_memory_value_text.value = f"{memory_limit} MB"
-        if self.config_service.set_config_value("gpu_memory_limit", memory_limit):
+        if self.config_service.set_config_value("gpu_memory_limit", memory_limit, background=True):
             self._show_snackbar(f"GPU内存限制已设置为 {memory_limit} MB，需重新加载模型生效", ft.Colors.GREEN)
         else:
             self._show_snackbar("GPU内存限制设置更新失败", ft.Colors.RED)
@@ -2627,11 +3493,50 @@ class SettingsView(ft.Container):
             e: 控件事件对象
         """
         device_id = int(e.control.value)
-        if self.config_service.set_config_value("gpu_device_id", device_id):
+        if self.config_service.set_config_value("gpu_device_id", device_id, background=True):
             self._show_snackbar(f"GPU设备已设置为 GPU {device_id}，需重新加载模型生效", ft.Colors.GREEN)
         else:
             self._show_snackbar("GPU设备设置更新失败", ft.Colors.RED)
     
+    async def _on_refresh_gpu_devices(self, e: ft.ControlEvent) -> None:
+        """重新检测GPU设备并原地更新设备下拉框。
+        
+        Args:
+            e: 控件事件对象
+        """
+        button = e.control
+        button.disabled = True
+        self._update_controls(button)
+        try:
+            options = await asyncio.to_thread(self._get_gpu_device_options, True)
+        except Exception as ex:
+            logger.warning(f"重新检测GPU设备失败: {ex}")
+            self._show_snackbar("GPU设备检测失败", ft.Colors.RED)
+            return
+        finally:
+            button.disabled = False
+            self._update_controls(button)
+        
+        dropdown = self.gpu_device_dropdown
+        dropdown.options = options
+        
+        # 设备可用性可能已变化（如 CUDA 设备消失），按构建时的规则重新计算禁用状态
+        disable_gpu_select, dropdown.hint_text = self._get_gpu_device_select_state()
+        dropdown.disabled = disable_gpu_select or not self.gpu_acceleration_switch.value
+        
+        message = f"已重新检测GPU设备，共 {len(options)} 项"
+        color = ft.Colors.GREEN
+        if options and dropdown.value not in {opt.key for opt in options}:
+            # 原设备已不存在：切换到第一个设备并同步写入配置，避免界面与配置不一致
+            dropdown.value = options[0].key
+            if self.config_service.set_config_value("gpu_device_id", int(dropdown.value)):
+                message += f"，原设备不可用，已切换为 GPU {dropdown.value}"
+            else:
+                message += "，原设备不可用且设备设置保存失败"
+                color = ft.Colors.RED
+        self._update_controls(dropdown)
+        self._show_snackbar(message, color)
+    
     def _on_memory_arena_change(self, e: ft.ControlEvent) -> None:
         """内存池优化开关改变事件处理。
         
@@ -2639,9 +3544,8 @@ class SettingsView(ft.Container):
             e: 控件事件对象
         """
         enabled = e.control.value
-        if self.config_service.set_config_value("gpu_enable_memory_arena", enabled):
-            status = "已启用" if enabled else "已禁用"
-            self._show_snackbar(f"内存池优化{status}，需重新加载模型生效", ft.Colors.GREEN)
+        if self.config_service.set_config_value("gpu_enable_memory_arena", enabled, background=True):
+            self._show_snackbar(_MSG_MEMORY_ARENA[enabled], _COLOR_SUCCESS)
         else:
             self._show_snackbar("内存池优化设置更新失败", ft.Colors.RED)
     
@@ -2652,12 +3556,9 @@ class SettingsView(ft.Container):
             e: 控件事件对象
         """
         threads = int(e.control.value)
-        if self.config_service.set_config_value("onnx_cpu_threads", threads):
+        if self.config_service.set_config_value("onnx_cpu_threads", threads, background=True):
             self.cpu_threads_value_text.value = f"{threads if threads > 0 else '自动'}"
-            try:
-                self._page.update()
-            except Exception:
-                pass
+            self._update_controls(self.cpu_threads_value_text)
             
             display_text = f"自动检测" if threads == 0 else f"{threads} 个线程"
             self._show_snackbar(f"CPU推理线程数已设置为 {display_text}", ft.Colors.GREEN)
@@ -2671,7 +3572,7 @@ class SettingsView(ft.Container):
             e: 控件事件对象
         """
         mode = e.control.value
-        if self.config_service.set_config_value("onnx_execution_mode", mode):
+        if self.config_service.set_config_value("onnx_execution_mode", mode, background=True):
             mode_text = "顺序执行" if mode == "sequential" else "并行执行"
             self._show_snackbar(f"执行模式已设置为 {mode_text}", ft.Colors.GREEN)
         else:
@@ -2684,10 +3585,8 @@ class SettingsView(ft.Container):
             e: 控件事件对象
         """
         enabled = e.control.value
-        if self.config_service.set_config_value("onnx_enable_model_cache", enabled):
-            status = "已启用" if enabled else "已禁用"
-            hint = "（首次加载会较慢，后续启动更快）" if enabled else ""
-            self._show_snackbar(f"模型缓存优化{status}{hint}", ft.Colors.GREEN)
+        if self.config_service.set_config_value("onnx_enable_model_cache", enabled, background=True):
+            self._show_snackbar(_MSG_MODEL_CACHE[enabled], _COLOR_SUCCESS)
         else:
             self._show_snackbar("模型缓存设置更新失败", ft.Colors.RED)
 
@@ -2702,10 +3601,12 @@ class SettingsView(ft.Container):
         self.gpu_memory_value_text.opacity = 1.0 if enabled else 0.6
         self.gpu_advanced_title.opacity = 1.0 if enabled else 0.6
 
-        try:
-            self._page.update()
-        except Exception:
-            pass
+        # 只刷新受影响的控件（滑块、下拉框、开关都在 gpu_advanced_container 内）
+        self._update_controls(
+            self.gpu_advanced_container,
+            self.gpu_memory_value_text,
+            self.gpu_advanced_title,
+        )
     
     def _build_theme_color_section(self) -> ft.Container:
         """构建主题色设置部分。
@@ -2713,6 +3614,10 @@ class SettingsView(ft.Container):
         Returns:
             主题色设置容器
         """
+        # 已构建过则直接复用，选中状态由点击事件原地切换
+        if self._theme_color_section is not None:
+            return self._theme_color_section
+        
         # 分区标题
         section_title: ft.Text = ft.Text(
             "主题颜色",
@@ -2720,30 +3625,12 @@ class SettingsView(ft.Container):
             weight=ft.FontWeight.W_600,
         )
         
-        # 预定义的主题色
-        theme_colors = [
-            ("#667EEA", "蓝紫色", "默认"),
-            ("#6366F1", "靛蓝色", "科技感"),
-            ("#8B5CF6", "紫色", "优雅"),
-            ("#EC4899", "粉红色", "活力"),
-            ("#F43F5E", "玫瑰红", "激情"),
-            ("#D2D5E1", "浅灰蓝", "柔和"),
-            ("#F97316", "橙色", "温暖"),
-            ("#F59E0B", "琥珀色", "明亮"),
-            ("#10B981", "绿色", "清新"),
-            ("#14B8A6", "青色", "自然"),
-            ("#06B6D4", "天蓝色", "清爽"),
-            ("#0EA5E9", "天空蓝", "开阔"),
-            ("#6B7280", "灰色", "稳重"),
-            ("#1F2937", "深灰", "专业"),
-            ("#000000", "黑色", "经典"),
-        ]
-        
         # 获取当前主题色
         current_theme_color = self.config_service.get_config_value("theme_color", "#667EEA")
         
         # 创建主题色卡片
         self.theme_color_cards: list = []
+        self._selected_theme_card: Optional[ft.Container] = None  # 当前选中的预设卡片
         
         theme_cards_row: ft.Row = ft.Row(
             controls=[],
@@ -2752,8 +3639,10 @@ class SettingsView(ft.Container):
             run_spacing=PADDING_MEDIUM,
         )
         
-        for color, name, desc in theme_colors:
+        for color, name, desc in _THEME_CARD_COLORS:
             card = self._create_theme_color_card(color, name, desc, color == current_theme_color)
+            if color == current_theme_color:
+                self._selected_theme_card = card
             self.theme_color_cards.append(card)
             theme_cards_row.controls.append(card)
         
@@ -2770,21 +3659,22 @@ class SettingsView(ft.Container):
         )
         
         # 组装主题色设置部分
-        return ft.Container(
+        self._theme_color_section = ft.Container(
             content=ft.Column(
                 controls=[
                     section_title,
-                    ft.Container(height=PADDING_MEDIUM),
-                    theme_cards_row,
-                    ft.Container(height=PADDING_MEDIUM // 2),
-                    info_text,
+                    ft.Column(
+                        controls=[theme_cards_row, info_text],
+                        spacing=PADDING_MEDIUM // 2,
+                    ),
                 ],
-                spacing=0,
+                spacing=PADDING_MEDIUM,
             ),
             padding=PADDING_LARGE,
             border=ft.Border.all(1, ft.Colors.OUTLINE_VARIANT),
             border_radius=BORDER_RADIUS_MEDIUM,
         )
+        return self._theme_color_section
     
     def _create_theme_color_card(self, color: str, name: str, desc: str, is_selected: bool) -> ft.Container:
         """创建主题色选择卡片。
@@ -2798,46 +3688,40 @@ class SettingsView(ft.Container):
         Returns:
             主题色卡片容器
         """
+        style = self._card_style_for(color)
+        
         # 颜色圆圈
         color_circle = ft.Container(
             width=40,
             height=40,
             border_radius=20,
             bgcolor=color,
-            border=ft.Border.all(3, ft.Colors.WHITE) if is_selected else ft.Border.all(1, ft.Colors.OUTLINE),
-            shadow=ft.BoxShadow(
-                spread_radius=0,
-                blur_radius=8,
-                color=ft.Colors.with_opacity(0.3, color),
-                offset=ft.Offset(0, 2),
-            ) if is_selected else None,
+            border=style.circle_border[is_selected],
+            shadow=style.shadow if is_selected else None,
         )
         
-        # 选中标记
+        name_text = ft.Text(
+            name,
+            weight=ft.FontWeight.W_600 if is_selected else ft.FontWeight.NORMAL,
+            **_CARD_NAME_TEXT_KWARGS,
+        )
+        
+        # 选中标记：固定 16px 高度的槽位，只切换图标可见性
         check_icon = ft.Icon(
             ft.Icons.CHECK_CIRCLE,
             size=16,
             color=color,
-        ) if is_selected else None
+            visible=is_selected,
+        )
         
         card = ft.Container(
             content=ft.Column(
                 controls=[
                     color_circle,
                     ft.Container(height=4),
-                    ft.Text(
-                        name,
-                        size=12,
-                        weight=ft.FontWeight.W_600 if is_selected else ft.FontWeight.NORMAL,
-                        text_align=ft.TextAlign.CENTER,
-                    ),
-                    ft.Text(
-                        desc,
-                        size=10,
-                        color=ft.Colors.ON_SURFACE_VARIANT,
-                        text_align=ft.TextAlign.CENTER,
-                    ),
-                    check_icon if check_icon else ft.Container(height=16),
+                    name_text,
+                    ft.Text(desc, **_CARD_DESC_TEXT_KWARGS),
+                    ft.Container(content=check_icon, height=16),
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=2,
@@ -2846,17 +3730,15 @@ class SettingsView(ft.Container):
             height=110,
             padding=PADDING_MEDIUM // 2,
             border_radius=BORDER_RADIUS_MEDIUM,
-            bgcolor=ft.Colors.with_opacity(0.05, color) if is_selected else None,
-            border=ft.Border.all(
-                2 if is_selected else 1,
-                color if is_selected else ft.Colors.OUTLINE
-            ),
+            bgcolor=style.bgcolor if is_selected else None,
+            border=style.card_border[is_selected],
             data=color,  # 存储颜色值
             on_click=self._on_theme_color_click,
             ink=True,
             animate=ft.Animation(200, ft.AnimationCurve.EASE_OUT),
         )
         
+        self._theme_card_widgets[color] = ThemeCardWidgets(card, color_circle, name_text, check_icon)
         return card
     
     def _create_custom_color_card(self, current_theme_color: str) -> ft.Container:
@@ -2876,18 +3758,8 @@ class SettingsView(ft.Container):
                         size=32,
                     ),
                     ft.Container(height=4),
-                    ft.Text(
-                        "自定义",
-                        size=12,
-                        weight=ft.FontWeight.W_600,
-                        text_align=ft.TextAlign.CENTER,
-                    ),
-                    ft.Text(
-                        "点击选择",
-                        size=10,
-                        color=ft.Colors.ON_SURFACE_VARIANT,
-                        text_align=ft.TextAlign.CENTER,
-                    ),
+                    ft.Text("自定义", weight=ft.FontWeight.W_600, **_CARD_NAME_TEXT_KWARGS),
+                    ft.Text("点击选择", **_CARD_DESC_TEXT_KWARGS),
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=4,
@@ -2913,8 +3785,7 @@ class SettingsView(ft.Container):
         Returns:
             RGB元组 (r, g, b)
         """
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb_cached(hex_color)
     
     def _rgb_to_hex(self, r: int, g: int, b: int) -> str:
         """将RGB值转换为十六进制颜色。
@@ -2927,17 +3798,47 @@ class SettingsView(ft.Container):
         Returns:
             十六进制颜色值（如#667EEA）
         """
-        return f"#{r:02x}{g:02x}{b:02x}".upper()
+        return f"#{(r << 16) | (g << 8) | b:06X}"
     
     def _open_color_picker(self, e: ft.ControlEvent) -> None:
-        """打开调色盘对话框。
+        """打开调色盘对话框（首次打开时构建，之后复用并重置为当前主题色）。
         
         Args:
             e: 控件事件对象
         """
-        # 当前主题色
         current_color_hex = self.config_service.get_config_value("theme_color", "#667EEA")
+        if self.color_picker_dialog is None:
+            self._build_color_picker_dialog(current_color_hex)
+        else:
+            self._reset_color_picker(current_color_hex)
+        
+        page = self.active_page
+        if page:
+            page.show_dialog(self.color_picker_dialog)
+    
+    def _reset_color_picker(self, hex_color: str) -> None:
+        """将已构建的调色盘对话框重置为指定颜色。
+        
+        Args:
+            hex_color: 十六进制颜色值
+        """
+        r, g, b = self._hex_to_rgb(hex_color)
+        self._picker_r_slider.value = r
+        self._picker_g_slider.value = g
+        self._picker_b_slider.value = b
+        self._picker_preview_box.bgcolor = hex_color
+        self._picker_rgb_text.value = f"RGB({r}, {g}, {b})"
+        self._picker_color_input.value = hex_color
+        self._last_preview_rgb = (r, g, b)
+    
+    def _build_color_picker_dialog(self, current_color_hex: str) -> None:
+        """构建调色盘对话框并保存到 self.color_picker_dialog。
+        
+        Args:
+            current_color_hex: 当前主题色
+        """
         current_color_rgb = self._hex_to_rgb(current_color_hex)
+        self._last_preview_rgb = current_color_rgb
         
         # 颜色预览框
         preview_box = ft.Container(
@@ -2970,14 +3871,7 @@ class SettingsView(ft.Container):
             divisions=255,
             value=current_color_rgb[0],
             label="{value}",
-            on_change=lambda e: self._update_color_preview_in_dialog(
-                int(r_slider.value),
-                int(g_slider.value),
-                int(b_slider.value),
-                preview_box,
-                rgb_text,
-                color_input
-            ),
+            on_change=self._on_rgb_slider_change,
         )
         
         g_slider = ft.Slider(
@@ -2986,14 +3880,7 @@ class SettingsView(ft.Container):
             divisions=255,
             value=current_color_rgb[1],
             label="{value}",
-            on_change=lambda e: self._update_color_preview_in_dialog(
-                int(r_slider.value),
-                int(g_slider.value),
-                int(b_slider.value),
-                preview_box,
-                rgb_text,
-                color_input
-            ),
+            on_change=self._on_rgb_slider_change,
         )
         
         b_slider = ft.Slider(
@@ -3002,62 +3889,22 @@ class SettingsView(ft.Container):
             divisions=255,
             value=current_color_rgb[2],
             label="{value}",
-            on_change=lambda e: self._update_color_preview_in_dialog(
-                int(r_slider.value),
-                int(g_slider.value),
-                int(b_slider.value),
-                preview_box,
-                rgb_text,
-                color_input
-            ),
-        )
-        
-        # 常用颜色预设
-        preset_colors = [
-            ("#667EEA", "蓝紫色", "默认"),
-            ("#6366F1", "靛蓝色", "科技感"),
-            ("#8B5CF6", "紫色", "优雅"),
-            ("#EC4899", "粉红色", "活力"),
-            ("#F43F5E", "玫瑰红", "激情"),
-            ("#EF4444", "红色", "热烈"),
-            ("#F97316", "橙色", "温暖"),
-            ("#F59E0B", "琥珀色", "明亮"),
-            ("#10B981", "绿色", "清新"),
-            ("#14B8A6", "青色", "自然"),
-            ("#06B6D4", "天蓝色", "清爽"),
-            ("#0EA5E9", "天空蓝", "开阔"),
-            ("#6B7280", "灰色", "稳重"),
-            ("#1F2937", "深灰", "专业"),
-            ("#000000", "黑色", "经典"),
-            ("#FFFFFF", "白色", "纯净"),
-        ]
-        
-        preset_buttons = []
-        for hex_color, name, desc in preset_colors:
-            rgb = self._hex_to_rgb(hex_color)
-            preset_buttons.append(
-                ft.Container(
-                    content=ft.Column(
-                        controls=[
-                            ft.Container(
-                                width=50,
-                                height=50,
-                                bgcolor=hex_color,
-                                border_radius=8,
-                                border=ft.Border.all(2, ft.Colors.OUTLINE),
-                                ink=True,
-                                on_click=lambda e, c=hex_color, r=rgb[0], g=rgb[1], b=rgb[2]: self._apply_preset_color(
-                                    c, r, g, b, r_slider, g_slider, b_slider, preview_box, rgb_text, color_input
-                                ),
-                            ),
-                            ft.Text(name, size=10, text_align=ft.TextAlign.CENTER),
-                        ],
-                        spacing=4,
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                    padding=4,
-                )
-            )
+            on_change=self._on_rgb_slider_change,
+        )
+        
+        # 保存对话框控件引用，供滑块事件与节流刷新使用
+        self._picker_preview_box = preview_box
+        self._picker_rgb_text = rgb_text
+        self._picker_color_input = color_input
+        self._picker_r_slider = r_slider
+        self._picker_g_slider = g_slider
+        self._picker_b_slider = b_slider
+        
+        # 常用颜色预设
+        preset_buttons = [
+            self._make_preset_button(hex_color, name)
+            for hex_color, name, *_ in _PRESET_COLORS_WITH_RGB
+        ]
         
         # 颜色输入框变化事件
         def on_color_input_change(e: ft.ControlEvent):
@@ -3066,8 +3913,7 @@ class SettingsView(ft.Container):
                 color_value = "#" + color_value
             
             # 验证颜色格式并更新
-            import re
-            if re.match(r'^#[0-9A-Fa-f]{6}$', color_value):
+            if _is_hex_color(color_value):
                 rgb = self._hex_to_rgb(color_value)
                 r_slider.value = rgb[0]
                 g_slider.value = rgb[1]
@@ -3149,7 +3995,7 @@ class SettingsView(ft.Container):
                 color_value = color_input.value.strip()
                 if color_value:
                     self._apply_custom_color(color_value)
-            page = getattr(self, '_saved_page', self._page)
+            page = self.active_page
             if page:
                 page.pop_dialog()
         
@@ -3163,10 +4009,6 @@ class SettingsView(ft.Container):
             ],
             actions_alignment=ft.MainAxisAlignment.END,
         )
-        
-        page = getattr(self, '_saved_page', self._page)
-        if page:
-            page.show_dialog(self.color_picker_dialog)
     
     def _update_color_preview_in_dialog(
         self,
@@ -3187,14 +4029,91 @@ class SettingsView(ft.Container):
             rgb_text: RGB文本控件
             color_input: 颜色输入框
         """
+        if (r, g, b) == self._last_preview_rgb:
+            return  # 颜色未变化（如程序赋值触发的重复事件），无需刷新
+        self._last_preview_rgb = (r, g, b)
+        
         hex_color = self._rgb_to_hex(r, g, b)
         preview_box.bgcolor = hex_color
         rgb_text.value = f"RGB({r}, {g}, {b})"
         color_input.value = hex_color
-        try:
-            self._page.update()
-        except Exception:
-            pass
+        # 拖动时按帧节流，只刷新对话框内的相关控件
+        self._throttled("color_preview", self._flush_color_preview)
+    
+    def _flush_color_preview(self) -> None:
+        """局部刷新调色盘对话框的预览框、文本、输入框与滑块。"""
+        self._update_controls(
+            self._picker_preview_box,
+            self._picker_rgb_text,
+            self._picker_color_input,
+            self._picker_r_slider,
+            self._picker_g_slider,
+            self._picker_b_slider,
+        )
+    
+    def _on_rgb_slider_change(self, e: ft.ControlEvent) -> None:
+        """调色盘 RGB 滑块拖动事件（三个滑块共用）。
+        
+        Args:
+            e: 控件事件对象
+        """
+        self._update_color_preview_in_dialog(
+            int(self._picker_r_slider.value),
+            int(self._picker_g_slider.value),
+            int(self._picker_b_slider.value),
+            self._picker_preview_box,
+            self._picker_rgb_text,
+            self._picker_color_input,
+        )
+    
+    def _make_preset_button(self, hex_color: str, name: str) -> ft.Container:
+        """创建调色盘中的常用颜色按钮。
+        
+        Args:
+            hex_color: 十六进制颜色值
+            name: 颜色名称
+        
+        Returns:
+            常用颜色按钮容器
+        """
+        return ft.Container(
+            content=ft.Column(
+                controls=[
+                    ft.Container(
+                        width=50,
+                        height=50,
+                        bgcolor=hex_color,
+                        border_radius=8,
+                        border=ft.Border.all(2, ft.Colors.OUTLINE),
+                        ink=True,
+                        data=hex_color,
+                        on_click=self._on_preset_color_click,
+                    ),
+                    ft.Text(name, **_PRESET_NAME_TEXT_KWARGS),
+                ],
+                spacing=4,
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+            padding=4,
+        )
+    
+    def _on_preset_color_click(self, e: ft.ControlEvent) -> None:
+        """调色盘常用颜色点击事件（所有预设共用，颜色值取自 control.data）。
+        
+        Args:
+            e: 控件事件对象
+        """
+        hex_color = e.control.data
+        r, g, b = _hex_to_rgb_cached(hex_color)
+        self._apply_preset_color(
+            hex_color, r, g, b,
+            self._picker_r_slider,
+            self._picker_g_slider,
+            self._picker_b_slider,
+            self._picker_preview_box,
+            self._picker_rgb_text,
+            self._picker_color_input,
+        )
     
     def _apply_preset_color(
         self,
@@ -3240,15 +4159,14 @@ class SettingsView(ft.Container):
             color_value = "#" + color_value
         
         # 验证颜色格式
-        import re
-        if not re.match(r'^#[0-9A-Fa-f]{6}$', color_value):
+        if not _is_hex_color(color_value):
             self._show_snackbar("颜色格式错误，请使用#RRGGBB格式（如#667EEA）", ft.Colors.RED)
             return
         
         # 保存并应用颜色
-        if self.config_service.set_config_value("theme_color", color_value.upper()):
-            # 通过 _saved_page 获取页面引用(因为 self._page 可能在布局重建后失效)
-            page = getattr(self, '_saved_page', self._page)
+        if self.config_service.set_config_value("theme_color", color_value.upper(), background=True):
+            # 通过 active_page 获取页面引用(因为 self._page 可能在布局重建后失效)
+            page = self.active_page
             # 立即更新页面主题色
             if page and page.theme:
                 page.theme.color_scheme_seed = color_value
@@ -3258,27 +4176,12 @@ class SettingsView(ft.Container):
             # 更新标题栏颜色
             self._update_title_bar_color(color_value)
             
-            # 更新所有预定义颜色卡片为未选中状态
-            for card in self.theme_color_cards:
-                if card.data != "custom":
-                    card.border = ft.Border.all(1, ft.Colors.OUTLINE)
-                    card.bgcolor = None
-                    
-                    if card.content and isinstance(card.content, ft.Column):
-                        color_circle = card.content.controls[0]
-                        if isinstance(color_circle, ft.Container):
-                            color_circle.border = ft.Border.all(1, ft.Colors.OUTLINE)
-                            color_circle.shadow = None
-                        
-                        name_text = card.content.controls[2]
-                        if isinstance(name_text, ft.Text):
-                            name_text.weight = ft.FontWeight.NORMAL
-                        
-                        if len(card.content.controls) > 4:
-                            card.content.controls[4] = ft.Container(height=16)
-                    
-            # 更新整个页面（无需逐个卡片 update，page.update 会统一刷新）
-            page = getattr(self, '_saved_page', self._page)
+            # 取消原预设卡片的选中状态（只修改这一张卡片）
+            if self._selected_theme_card is not None:
+                self._set_theme_card_selected(self._selected_theme_card, False)
+                self._selected_theme_card = None
+            
+            # 主题色种子属于页面属性，需要页面级刷新（卡片只改动了一张）
             if page:
                 page.update()
             self._show_snackbar(f"自定义主题色已应用: {color_value}", ft.Colors.GREEN)
@@ -3298,9 +4201,9 @@ class SettingsView(ft.Container):
             return  # 已选中，无需更新
         
         # 保存主题色设置
-        if self.config_service.set_config_value("theme_color", clicked_color):
-            # 通过 _saved_page 获取页面引用(因为 self._page 可能在布局重建后失效)
-            page = getattr(self, '_saved_page', self._page)
+        if self.config_service.set_config_value("theme_color", clicked_color, background=True):
+            # 通过 active_page 获取页面引用(因为 self._page 可能在布局重建后失效)
+            page = self.active_page
             # 立即更新页面主题色
             if page and page.theme:
                 page.theme.color_scheme_seed = clicked_color
@@ -3310,114 +4213,133 @@ class SettingsView(ft.Container):
             # 更新标题栏颜色（如果标题栏存在）
             self._update_title_bar_color(clicked_color)
             
-            # 更新所有卡片的样式
-            for card in self.theme_color_cards:
-                # 跳过自定义颜色卡片（它的结构不同）
-                if card.data == "custom":
-                    continue
-                
-                is_selected = card.data == clicked_color
-                color = card.data
-                
-                # 更新边框和背景
-                card.border = ft.Border.all(
-                    2 if is_selected else 1,
-                    color if is_selected else ft.Colors.OUTLINE
-                )
-                card.bgcolor = ft.Colors.with_opacity(0.05, color) if is_selected else None
-                
-                # 更新内容
-                if card.content and isinstance(card.content, ft.Column):
-                    # 更新颜色圆圈
-                    color_circle = card.content.controls[0]
-                    if isinstance(color_circle, ft.Container):
-                        color_circle.border = ft.Border.all(3, ft.Colors.WHITE) if is_selected else ft.Border.all(1, ft.Colors.OUTLINE)
-                        color_circle.shadow = ft.BoxShadow(
-                            spread_radius=0,
-                            blur_radius=8,
-                            color=ft.Colors.with_opacity(0.3, color),
-                            offset=ft.Offset(0, 2),
-                        ) if is_selected else None
-                    
-                    # 更新名称文字粗细
-                    name_text = card.content.controls[2]
-                    if isinstance(name_text, ft.Text):
-                        name_text.weight = ft.FontWeight.W_600 if is_selected else ft.FontWeight.NORMAL
-                    
-                    # 更新选中标记（只有预定义颜色卡片有这个元素）
-                    if len(card.content.controls) > 4:
-                        if is_selected:
-                            card.content.controls[4] = ft.Icon(
-                                ft.Icons.CHECK_CIRCLE,
-                                size=16,
-                                color=color,
-                            )
-                        else:
-                            card.content.controls[4] = ft.Container(height=16)
-                
-            # 更新整个页面（无需逐个卡片 update，page.update 会统一刷新）
-            page = getattr(self, '_saved_page', self._page)
+            # 只切换新旧两张卡片的选中样式
+            widgets = self._theme_card_widgets.get(clicked_color)
+            new_card = widgets.card if widgets is not None else None
+            if self._selected_theme_card is not None and self._selected_theme_card is not new_card:
+                self._set_theme_card_selected(self._selected_theme_card, False)
+            if new_card is not None:
+                self._set_theme_card_selected(new_card, True)
+            self._selected_theme_card = new_card
+            
+            # 主题色种子属于页面属性，需要页面级刷新（卡片只改动了新旧两张）
             if page:
                 page.update()
             self._show_snackbar("主题色已更新", ft.Colors.GREEN)
         else:
             self._show_snackbar("主题色更新失败", ft.Colors.RED)
     
+    def _card_style_for(self, color: str) -> ThemeCardStyle:
+        """获取（并缓存）指定颜色卡片的边框、阴影与背景色。
+        
+        每种颜色只对应一张卡片，样式对象只在该卡片上复用，不会被多个控件同时引用。
+        
+        Args:
+            color: 卡片颜色值
+        
+        Returns:
+            卡片样式
+        """
+        style = self._card_style_cache.get(color)
+        if style is None:
+            style = self._card_style_cache[color] = ThemeCardStyle(
+                card_border=(ft.Border.all(1, ft.Colors.OUTLINE), ft.Border.all(2, color)),
+                circle_border=(ft.Border.all(1, ft.Colors.OUTLINE), ft.Border.all(3, ft.Colors.WHITE)),
+                shadow=ft.BoxShadow(
+                    spread_radius=0,
+                    blur_radius=8,
+                    color=_with_opacity(0.3, color),
+                    offset=ft.Offset(0, 2),
+                ),
+                bgcolor=_with_opacity(0.05, color),
+            )
+        return style
+    
+    def _set_theme_card_selected(self, card: ft.Container, is_selected: bool) -> None:
+        """切换预设主题色卡片的选中样式。
+        
+        Args:
+            card: 预设主题色卡片（由 _create_theme_color_card 创建）
+            is_selected: 是否选中
+        """
+        widgets = self._theme_card_widgets[card.data]
+        style = self._card_style_for(card.data)
+        
+        # 更新边框和背景
+        card.border = style.card_border[is_selected]
+        card.bgcolor = style.bgcolor if is_selected else None
+        
+        # 更新颜色圆圈
+        widgets.color_circle.border = style.circle_border[is_selected]
+        widgets.color_circle.shadow = style.shadow if is_selected else None
+        
+        # 更新名称文字粗细
+        widgets.name_text.weight = ft.FontWeight.W_600 if is_selected else ft.FontWeight.NORMAL
+        
+        # 更新选中标记
+        widgets.check_icon.visible = is_selected
+    
     def _update_title_bar_color(self, color: str) -> None:
         """更新标题栏颜色。
         
         Args:
             color: 新的主题色
         """
-        # 通过 _saved_page 获取页面引用
-        page = getattr(self, '_saved_page', self._page)
-        
         # 尝试找到标题栏组件并更新颜色
         try:
-            # 通过 MainView 访问标题栏
-            if page and hasattr(page, '_main_view') and hasattr(page._main_view, 'title_bar'):
-                page._main_view.title_bar.update_theme_color(color)
+            if self._title_bar is not None:
+                self._title_bar.update_theme_color(color)
         except Exception:
             pass  # 如果更新失败也不影响其他功能
     
-    def _build_font_section(self) -> ft.Container:
+    def _load_system_fonts(self, fonts: tuple, current_font: Optional[str]) -> None:
+        """加载系统字体列表到 ``self.system_fonts``。
+        
+        Args:
+            fonts: 调用方已等待完成的 ``prefetch_system_fonts()`` 结果
+            current_font: 当前配置的字体，不在列表中时会插入到第二位
+        """
+        # 一次遍历构建 键名 -> 显示名 映射，同时去除重复字体
+        self._font_map = font_map = dict(fonts)
+        self.system_fonts = list(font_map.items())
+        
+        # 确保当前字体在列表中（如果不在，添加到“系统默认”之后）
+        if current_font and current_font not in font_map:
+            # 只有当 current_font 有效时才添加
+            font_map[current_font] = current_font
+            self.system_fonts.insert(1, (current_font, current_font))
+        
+        # 预先转小写，搜索时无需每次按键重复转换
+        self._system_fonts_lower = [(key.lower(), name.lower()) for key, name in self.system_fonts]
+        # 上一次搜索的关键字及匹配项下标（继续输入时只在上次结果中筛选）
+        self._font_search_cache: tuple = ("", None)
+    
+    def _build_font_section(self, fonts: tuple) -> ft.Container:
         """构建字体设置部分。
         
+        Args:
+            fonts: 已枚举完成的系统字体 ((字体名称, 显示名称), ...)
+        
         Returns:
             字体设置容器
         """
         # 分区标题
-        section_title: ft.Text = ft.Text(
-            "字体设置",
-            size=20,
-            weight=ft.FontWeight.W_600,
-        )
-        
-        # 获取系统已安装的字体列表（保存为实例变量）
-        self.system_fonts = get_system_fonts()
+        section_title: ft.Text = ft.Text("字体设置", **_SECTION_TITLE_TEXT_KWARGS)
         
         # 获取当前字体
         current_font = self.config_service.get_config_value("font_family", "System")
         current_scale = self.config_service.get_config_value("font_scale", 1.0)
         
-        # 确保当前字体在列表中（如果不在，添加它）
-        font_keys = [font[0] for font in self.system_fonts]
-        if current_font and current_font not in font_keys:
-            # 只有当 current_font 有效时才添加
-            self.system_fonts.insert(1, (current_font, current_font))
+        # 获取系统已安装的字体列表（保存为实例变量）
+        self._load_system_fonts(fonts, current_font)
         
         # 获取当前字体的显示名称
-        current_font_display = current_font
-        for font_key, font_name in self.system_fonts:
-            if font_key == current_font:
-                current_font_display = font_name
-                break
+        current_font_display = (self._font_map.get(current_font) if current_font else None) or current_font
         
         # 当前字体显示文本
         self.current_font_text = ft.Text(
             current_font_display,
-            size=14,
-            color=ft.Colors.ON_SURFACE_VARIANT,
+            **_SUBTLE_TEXT_KWARGS,
             max_lines=1,
             overflow=ft.TextOverflow.ELLIPSIS,
         )
@@ -3452,6 +4374,9 @@ class SettingsView(ft.Container):
             on_click=self._open_font_selector_dialog,
         )
         
+        # 当前显示 / 已保存的字体大小百分比（拖动时百分比未变化则跳过刷新与保存）
+        self._font_scale_pct = self._saved_font_scale_pct = int(current_scale * 100)
+        
         # 字体大小滑块
         self.font_scale_text = ft.Text(
             f"{int(current_scale * 100)}%",
@@ -3466,6 +4391,7 @@ class SettingsView(ft.Container):
             value=current_scale * 100,
             label="{value}%",
             on_change=self._on_font_scale_change,
+            on_change_end=self._on_font_scale_change_end,
         )
         
         # 字体大小容器
@@ -3473,7 +4399,7 @@ class SettingsView(ft.Container):
             controls=[
                 ft.Row(
                     controls=[
-                        ft.Text("字体大小", size=14, weight=ft.FontWeight.W_500),
+                        ft.Text("字体大小", **_LABEL_TEXT_KWARGS),
                         self.font_scale_text,
                     ],
                     alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
@@ -3501,7 +4427,7 @@ class SettingsView(ft.Container):
         preview_container: ft.Container = ft.Container(
             content=ft.Column(
                 controls=[
-                    ft.Text("预览:", size=14, weight=ft.FontWeight.W_500),
+                    ft.Text("预览:", **_LABEL_TEXT_KWARGS),
                     self.font_preview_text,
                 ],
                 spacing=PADDING_MEDIUM // 2,
@@ -3546,12 +4472,7 @@ class SettingsView(ft.Container):
         Returns:
             关于部分容器
         """
-        section_title: ft.Text = ft.Text(
-            "关于",
-            size=20,
-            weight=ft.FontWeight.W_600,
-        )
-        import webbrowser
+        section_title: ft.Text = ft.Text("关于", **_SECTION_TITLE_TEXT_KWARGS)
         
         # 更新状态显示组件
         self.update_status_text: ft.Text = ft.Text(
@@ -3617,31 +4538,26 @@ class SettingsView(ft.Container):
                 ft.Text("MTools - 多功能工具箱", size=16, weight=ft.FontWeight.W_500),
                 ft.Row(
                     controls=[
-                        ft.Text(f"版本: {get_full_version_string()}", size=14, color=ft.Colors.ON_SURFACE_VARIANT),
+                        ft.Text(f"版本: {get_full_version_string()}", **_SUBTLE_TEXT_KWARGS),
                         self.update_progress,
                     ],
                     spacing=PADDING_SMALL,
                     vertical_alignment=ft.CrossAxisAlignment.CENTER,
                 ),
                 self.update_status_row,
-                ft.Text("By：一铭"),
-                ft.Text("QQ交流群：1029212047"),
+                *(ft.Text(line) for line in _ABOUT_STATIC_LINES),
                 ft.Container(height=PADDING_MEDIUM // 2),
-                ft.Text(
-                    APP_DESCRIPTION,
-                    size=14,
-                    color=ft.Colors.ON_SURFACE_VARIANT,
-                ),
+                ft.Text(APP_DESCRIPTION, **_SUBTLE_TEXT_KWARGS),
                 # 点击访问软件发布页，用浏览器打开
                 ft.TextButton(
                     "国内访问下载页",
-                    on_click=lambda e: webbrowser.open("https://openlist.wer.plus/MTools"),
+                    on_click=self._open_download_page_url,
                     icon=ft.Icons.LINK,
                     tooltip="国内访问下载页",
                 ),
                 ft.TextButton(
                     "Github",
-                    on_click=lambda e: webbrowser.open("https://github.com/HG-ha/MTools"),
+                    on_click=self._open_github_url,
                     icon=ft.Icons.LINK,
                     tooltip="Github",
                 ),
@@ -3663,7 +4579,7 @@ class SettingsView(ft.Container):
             icon=ft.Icons.SHORTCUT,
             on_click=self._on_create_desktop_shortcut,
             tooltip="在桌面创建应用快捷方式",
-            visible=platform.system() == "Windows" and sys.argv[0].endswith('.exe'),
+            visible=_IS_WINDOWS_EXE,
         )
         
         return ft.Container(
@@ -3691,6 +4607,26 @@ class SettingsView(ft.Container):
             border_radius=BORDER_RADIUS_MEDIUM,
         )
     
+    def _open_download_page_url(self, e: ft.ControlEvent) -> None:
+        """用浏览器打开国内下载页。"""
+        webbrowser.open(_DOWNLOAD_PAGE_URL)
+    
+    def _open_github_url(self, e: ft.ControlEvent) -> None:
+        """用浏览器打开 Github 仓库页。"""
+        webbrowser.open(_GITHUB_URL)
+    
+    def _get_update_service(self) -> UpdateService:
+        """获取更新检测服务（懒加载，复用同一实例）。"""
+        if self._update_service is None:
+            self._update_service = UpdateService()
+        return self._update_service
+    
+    def _get_auto_updater(self) -> AutoUpdater:
+        """获取自动更新器（懒加载，复用同一实例）。"""
+        if self._auto_updater is None:
+            self._auto_updater = AutoUpdater()
+        return self._auto_updater
+    
     def _on_check_update(self, e: ft.ControlEvent) -> None:
         """检查更新按钮点击事件。
         
@@ -3704,16 +4640,13 @@ class SettingsView(ft.Container):
         self.update_status_icon.visible = False
         self.update_download_button.visible = False
         
-        # 更新 UI
-        page = getattr(self, '_saved_page', self._page)
-        if page:
-            page.update()
+        # 更新 UI（仅推送检查更新相关控件）
+        self._update_controls(self.update_progress, self.check_update_button, self.update_status_row)
         
         # 在异步任务中检查更新
         async def check_update_task():
-            import asyncio
             try:
-                update_service = UpdateService()
+                update_service = self._get_update_service()
                 update_info = await asyncio.to_thread(update_service.check_update)
                 
                 # 在主线程中更新UI
@@ -3726,7 +4659,7 @@ class SettingsView(ft.Container):
                     error_message=f"检查更新出错: {str(ex)}",
                 ))
         
-        page = getattr(self, '_saved_page', self._page)
+        page = self.active_page
         if page:
             page.run_task(check_update_task)
     
@@ -3743,35 +4676,36 @@ class SettingsView(ft.Container):
         self.update_progress.visible = False
         self.check_update_button.disabled = False
         
-        # 根据状态更新UI
-        if update_info.status == UpdateStatus.UP_TO_DATE:
-            self.update_status_icon.name = ft.Icons.CHECK_CIRCLE_OUTLINE
-            self.update_status_icon.color = ft.Colors.GREEN
-            self.update_status_text.value = "已是最新版本"
-            self.update_status_text.color = ft.Colors.GREEN
-            self.update_download_button.visible = False
+        # 结果与上次相同时无需重新设置图标和文本
+        result_key = (update_info.status, update_info.latest_version, update_info.error_message)
+        if result_key != self._last_update_result_key:
+            # 根据状态更新UI
+            if update_info.status == UpdateStatus.UP_TO_DATE:
+                self.update_status_icon.name = ft.Icons.CHECK_CIRCLE_OUTLINE
+                self.update_status_icon.color = ft.Colors.GREEN
+                self.update_status_text.value = "已是最新版本"
+                self.update_status_text.color = ft.Colors.GREEN
             
-        elif update_info.status == UpdateStatus.UPDATE_AVAILABLE:
-            self.update_status_icon.name = ft.Icons.NEW_RELEASES
-            self.update_status_icon.color = ft.Colors.ORANGE
-            self.update_status_text.value = f"发现新版本: {update_info.latest_version}"
-            self.update_status_text.color = ft.Colors.ORANGE
-            self.update_download_button.visible = True
+            elif update_info.status == UpdateStatus.UPDATE_AVAILABLE:
+                self.update_status_icon.name = ft.Icons.NEW_RELEASES
+                self.update_status_icon.color = ft.Colors.ORANGE
+                self.update_status_text.value = f"发现新版本: {update_info.latest_version}"
+                self.update_status_text.color = ft.Colors.ORANGE
             
-        elif update_info.status == UpdateStatus.ERROR:
-            self.update_status_icon.name = ft.Icons.ERROR_OUTLINE
-            self.update_status_icon.color = ft.Colors.RED
-            self.update_status_text.value = update_info.error_message or "检查更新失败"
-            self.update_status_text.color = ft.Colors.RED
-            self.update_download_button.visible = False
+            elif update_info.status == UpdateStatus.ERROR:
+                self.update_status_icon.name = ft.Icons.ERROR_OUTLINE
+                self.update_status_icon.color = ft.Colors.RED
+                self.update_status_text.value = update_info.error_message or "检查更新失败"
+                self.update_status_text.color = ft.Colors.RED
+        
+        self._last_update_result_key = result_key
         
         self.update_status_icon.visible = True
         self.update_status_text.visible = True
+        self.update_download_button.visible = update_info.status == UpdateStatus.UPDATE_AVAILABLE
         
-        # 使用保存的页面引用更新 UI
-        page = getattr(self, '_saved_page', self._page)
-        if page:
-            page.update()
+        # 使用保存的页面引用更新 UI（仅推送检查更新相关控件）
+        self._update_controls(self.update_progress, self.check_update_button, self.update_status_row)
     
     def _on_open_download_page(self, e: ft.ControlEvent) -> None:
         """打开下载页面或开始自动更新。
@@ -3789,20 +4723,39 @@ class SettingsView(ft.Container):
             self._show_update_dialog(update_info)
         else:
             # 没有下载链接，打开浏览器
-            import webbrowser
             url = update_info.release_url or "https://github.com/HG-ha/MTools/releases"
             webbrowser.open(url)
     
+    def _get_release_notes_markdown(self, update_info: UpdateInfo) -> ft.Markdown:
+        """获取更新说明 Markdown 控件（按版本号缓存，重复打开对话框时复用）。
+        
+        Args:
+            update_info: 更新信息
+        
+        Returns:
+            更新说明 Markdown 控件
+        """
+        version = update_info.latest_version or ""
+        markdown = self._release_notes_cache.get(version)
+        if markdown is None:
+            # 创建更新说明文本（截断只做一次）
+            release_notes = _truncate_release_notes(update_info.release_notes or "暂无更新说明")
+            markdown = ft.Markdown(
+                value=release_notes,
+                selectable=True,
+                extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
+                on_tap_link=lambda e: webbrowser.open(e.data),
+            )
+            self._release_notes_cache[version] = markdown
+        return markdown
+    
     def _show_update_dialog(self, update_info: UpdateInfo) -> None:
         """显示更新对话框。
         
         Args:
             update_info: 更新信息
         """
-        # 创建更新说明文本
-        release_notes = update_info.release_notes or "暂无更新说明"
-        if len(release_notes) > 500:
-            release_notes = release_notes[:500] + "..."
+        release_notes_md = self._get_release_notes_markdown(update_info)
         
         # 创建进度条
         progress_bar = ft.ProgressBar(value=0, visible=False)
@@ -3842,12 +4795,7 @@ class SettingsView(ft.Container):
                     ft.Container(
                         content=ft.Column(
                             controls=[
-                                ft.Markdown(
-                                    value=release_notes,
-                                    selectable=True,
-                                    extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
-                                    on_tap_link=lambda e: webbrowser.open(e.data),
-                                ),
+                                release_notes_md,
                             ],
                             scroll=ft.ScrollMode.AUTO,
                             expand=True,
@@ -3873,7 +4821,7 @@ class SettingsView(ft.Container):
             actions_alignment=ft.MainAxisAlignment.END,
         )
         
-        page = getattr(self, '_saved_page', self._page)
+        page = self.active_page
         if page:
             page.show_dialog(dialog)
     
@@ -3905,27 +4853,43 @@ class SettingsView(ft.Container):
         progress_text.visible = True
         progress_text.value = "正在下载更新..."
         
-        page = getattr(self, '_saved_page', self._page)
-        if page:
-            page.update()
+        # 各步骤集中修改后只推送对话框内相关控件
+        dialog_controls = (auto_btn, manual_btn, progress_bar, progress_text)
+        self._update_controls(*dialog_controls)
+        
+        page = self.active_page
         
         # 在异步任务中下载和安装更新
         async def update_task():
             try:
-                import asyncio
-                updater = AutoUpdater()
+                updater = self._get_auto_updater()
+                
+                # 上次刷新进度的时间与进度（每个数据块都会回调，合并刷新避免频繁推送 UI）
+                last_ts = 0.0
+                last_progress = 0.0
                 
                 # 定义进度回调（从 download_update 的异步上下文中调用，安全更新UI）
                 def progress_callback(downloaded: int, total: int):
+                    nonlocal last_ts, last_progress
                     if total > 0:
                         progress = downloaded / total
+                        now = time.monotonic()
+                        if (
+                            downloaded < total
+                            and now - last_ts < 0.1
+                            and progress - last_progress < 0.01
+                        ):
+                            return
+                        last_ts = now
+                        last_progress = progress
+                        
                         async def _update_dl_progress():
                             progress_bar.value = progress
-                            downloaded_mb = downloaded / 1024 / 1024
-                            total_mb = total / 1024 / 1024
-                            progress_text.value = f"下载中: {downloaded_mb:.1f}MB / {total_mb:.1f}MB ({progress*100:.0f}%)"
+                            progress_text.value = _DL_PROGRESS_FMT % (
+                                downloaded / 1048576, total / 1048576, progress * 100
+                            )
                             if page:
-                                page.update()
+                                page.update(progress_bar, progress_text)
                         try:
                             if page:
                                 page.run_task(_update_dl_progress)
@@ -3938,15 +4902,13 @@ class SettingsView(ft.Container):
                 # 解压
                 progress_text.value = "正在解压更新..."
                 progress_bar.value = None  # 不确定进度
-                if page:
-                    page.update()
+                self._update_controls(progress_bar, progress_text)
                 
                 extract_dir = await asyncio.to_thread(updater.extract_update, download_path)
                 
                 # 应用更新
                 progress_text.value = "正在应用更新，应用即将重启..."
-                if page:
-                    page.update()
+                self._update_controls(progress_text)
                 
                 await asyncio.sleep(1)  # 让用户看到提示
                 
@@ -3954,8 +4916,6 @@ class SettingsView(ft.Container):
                 def exit_callback():
                     """使用标题栏的关闭方法优雅退出"""
                     try:
-                        # 获取主视图
-                        from views.main_view import MainView
                         main_view = getattr(page, 'main_view', None)
                         if main_view and hasattr(main_view, 'title_bar'):
                             # 使用标题栏的关闭方法（force=True 强制退出，不最小化到托盘）
@@ -3978,15 +4938,13 @@ class SettingsView(ft.Container):
                 auto_btn.disabled = False
                 manual_btn.disabled = False
                 progress_bar.visible = False
-                progress_text.visible = False
                 
                 # 显示错误信息
                 progress_text.value = f"更新失败: {str(ex)}"
                 progress_text.color = ft.Colors.RED
                 progress_text.visible = True
                 
-                if page:
-                    page.update()
+                self._update_controls(*dialog_controls)
         
         if page:
             page.run_task(update_task)
@@ -3998,7 +4956,6 @@ class SettingsView(ft.Container):
             update_info: 更新信息
             dialog: 对话框
         """
-        import webbrowser
         url = update_info.release_url or "https://github.com/HG-ha/MTools/releases"
         webbrowser.open(url)
         self._close_dialog(dialog)
@@ -4009,7 +4966,7 @@ class SettingsView(ft.Container):
         Args:
             dialog: 要关闭的对话框
         """
-        page = getattr(self, '_saved_page', self._page)
+        page = self.active_page
         if page:
             page.pop_dialog()
     
@@ -4132,7 +5089,7 @@ class SettingsView(ft.Container):
         """
         def on_migrate(e):
             """选择迁移数据"""
-            page = getattr(self, '_saved_page', self._page)
+            page = self.active_page
             if page:
                 page.pop_dialog()
             # 显示迁移进度对话框
@@ -4140,7 +5097,7 @@ class SettingsView(ft.Container):
         
         def on_no_migrate(e):
             """不迁移数据"""
-            page = getattr(self, '_saved_page', self._page)
+            page = self.active_page
             if page:
                 page.pop_dialog()
             # 直接更改目录
@@ -4231,7 +5188,7 @@ class SettingsView(ft.Container):
             actions_alignment=ft.MainAxisAlignment.END,
         )
         
-        page = getattr(self, '_saved_page', self._page)
+        page = self.active_page
         if page:
             page.show_dialog(dialog)
     
@@ -4262,41 +5219,43 @@ class SettingsView(ft.Container):
             actions=[],  # 迁移时不显示按钮
         )
         
-        page = getattr(self, '_saved_page', self._page)
+        page = self.active_page
         if page:
             page.show_dialog(dialog)
         
         # 在异步任务中执行迁移
         async def migrate_task():
-            import asyncio
+            # 上次刷新进度的时间（每个文件都会回调，限制在约 30 fps 以内）
+            last_ts = 0.0
             
             def progress_callback(current, total, message):
                 """进度回调 - 通过 run_task 安全地更新UI"""
+                nonlocal last_ts
+                now = time.monotonic()
+                if current < total and now - last_ts < self._SLIDER_THROTTLE:
+                    return
+                last_ts = now
+                
                 async def _update_migrate_progress():
                     progress_bar.value = current / total if total > 0 else 0
                     progress_text.value = message
-                    try:
-                        _page = getattr(self, '_saved_page', self._page)
-                        if _page:
-                            _page.update()
-                    except Exception:
-                        pass
+                    self._update_controls(progress_bar, progress_text)
                 try:
-                    _page = getattr(self, '_saved_page', self._page)
+                    _page = self.active_page
                     if _page:
                         _page.run_task(_update_migrate_progress)
                 except Exception:
                     pass
             
             # 执行迁移
-            success, message = await asyncio.to_thread(
+            success, message = await _run_io(
                 self.config_service.migrate_data,
                 old_dir, new_dir, progress_callback
             )
             
             # 关闭进度对话框
             try:
-                _page = getattr(self, '_saved_page', self._page)
+                _page = self.active_page
                 if _page:
                     _page.pop_dialog()
             except Exception:
@@ -4313,21 +5272,17 @@ class SettingsView(ft.Container):
                     self.dir_type_radio.value = "custom" if is_custom_dir else "default"
                     self.browse_button.disabled = not is_custom_dir
                     
-                    _page = getattr(self, '_saved_page', self._page)
-                    if _page:
-                        _page.update()
+                    self._update_controls(self.data_dir_text, self.dir_type_radio, self.browse_button)
                     
+                    # 进度对话框已关闭，成功提示与删除旧数据询问直接依次显示
                     self._show_snackbar(f"✓ {message}", ft.Colors.GREEN)
-                    
-                    # 询问是否删除旧数据
-                    await asyncio.sleep(0.5)  # 稍微延迟一下，让用户看到成功消息
                     self._show_delete_old_data_dialog(old_dir)
                 else:
                     self._show_snackbar("更新配置失败", ft.Colors.RED)
             else:
                 self._show_snackbar(f"✗ {message}", ft.Colors.RED)
         
-        page = getattr(self, '_saved_page', self._page)
+        page = self.active_page
         if page:
             page.run_task(migrate_task)
     
@@ -4343,32 +5298,40 @@ class SettingsView(ft.Container):
             
             # 在异步任务中执行删除
             async def delete_task():
-                import asyncio
                 try:
-                    import shutil
-                    
                     if not old_dir.exists():
                         self._show_snackbar("旧目录不存在", ft.Colors.ORANGE)
                         return
                     
                     # 删除旧数据目录中的内容，但保留配置文件
                     _config_keep = {"config.json", "config.json.bak", "config.dat"}
+                    def _remove_entry(entry: os.DirEntry) -> None:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
+                    
                     def _do_delete():
+                        # 先完整获取目录项快照，再删除，避免边遍历边删除
+                        with os.scandir(old_dir) as it:
+                            entries = [entry for entry in it if entry.name not in _config_keep]
+                        if not entries:
+                            return 0
+                        
+                        # 各顶层目录项互不相关，并行删除
                         count = 0
-                        for item in old_dir.iterdir():
-                            if item.name in _config_keep:
-                                continue
-                            try:
-                                if item.is_dir():
-                                    shutil.rmtree(item)
-                                else:
-                                    item.unlink()
-                                count += 1
-                            except Exception as e:
-                                logger.error(f"删除 {item.name} 失败: {e}")
+                        max_workers = min(8, len(entries), (os.cpu_count() or 1) * 2)
+                        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="delete-old-data") as executor:
+                            futures = {executor.submit(_remove_entry, entry): entry for entry in entries}
+                            for future in as_completed(futures):
+                                try:
+                                    future.result()
+                                    count += 1
+                                except Exception as e:
+                                    logger.error(f"删除 {futures[future].name} 失败: {e}")
                         return count
                     
-                    deleted_count = await asyncio.to_thread(_do_delete)
+                    deleted_count = await _run_io(_do_delete)
                     
                     if deleted_count > 0:
                         self._show_snackbar(f"已删除 {deleted_count} 项旧数据（保留了配置文件）", ft.Colors.GREEN)
@@ -4498,76 +5461,95 @@ class SettingsView(ft.Container):
         Args:
             e: 控件事件对象
         """
-        import subprocess
-        import platform
-        
         data_dir: Path = self.config_service.get_data_dir()
         
         try:
-            system: str = platform.system()
-            if system == "Windows":
-                subprocess.run(["explorer", str(data_dir)])
-            elif system == "Darwin":
-                subprocess.run(["open", str(data_dir)])
-            else:
-                subprocess.run(["xdg-open", str(data_dir)])
+            # 使用 Popen 立即返回，不等待文件管理器进程
+            subprocess.Popen(
+                [*_OPEN_DIR_CMD, str(data_dir)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+            )
         except Exception as ex:
             self._show_snackbar(f"打开目录失败: {ex}", ft.Colors.RED)
     
-    def _create_font_tile(self, font_key: str, font_display: str) -> ft.Container:
-        """创建字体列表项。
+    def _create_font_tile(self) -> FontTileWidgets:
+        """创建一个空的字体列表项（对话框打开时按每页数量创建，翻页时原地更新内容）。
         
-        Args:
-            font_key: 字体键名
-            font_display: 字体显示名
-            
         Returns:
-            字体列表项容器
+            字体列表项控件集合
         """
-        current_font = self.config_service.get_config_value("font_family", "System")
-        is_selected = font_key == current_font
+        name_text = ft.Text("", size=14)
+        sample_text = ft.Text(
+            "The quick brown fox jumps over the lazy dog",
+            size=13,
+            color=ft.Colors.ON_SURFACE_VARIANT,
+            no_wrap=True,
+            overflow=ft.TextOverflow.ELLIPSIS,
+        )
+        check_icon = ft.Icon(
+            ft.Icons.CHECK_CIRCLE,
+            color=ft.Colors.PRIMARY,
+            size=24,
+            visible=False,
+        )
         
-        return ft.Container(
+        tile = ft.Container(
             content=ft.Row(
                 controls=[
                     # 左侧：字体信息
                     ft.Column(
-                        controls=[
-                            ft.Text(
-                                font_display,
-                                size=14,
-                                weight=ft.FontWeight.BOLD if is_selected else ft.FontWeight.NORMAL,
-                                color=ft.Colors.PRIMARY if is_selected else ft.Colors.ON_SURFACE,
-                            ),
-                            ft.Text(
-                                "The quick brown fox jumps over the lazy dog",
-                                size=13,
-                                font_family=font_key,
-                                color=ft.Colors.ON_SURFACE_VARIANT,
-                                no_wrap=True,
-                                overflow=ft.TextOverflow.ELLIPSIS,
-                            ),
-                        ],
+                        controls=[name_text, sample_text],
                         spacing=4,
                         expand=True,
                     ),
                     # 右侧：选中标记
-                    ft.Icon(
-                        ft.Icons.CHECK_CIRCLE,
-                        color=ft.Colors.PRIMARY,
-                        size=24,
-                        visible=is_selected,
-                    ),
+                    check_icon,
                 ],
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
             ),
             padding=ft.Padding.all(12),
             ink=True,
-            on_click=lambda e, fk=font_key, fd=font_display: self._apply_font_selection(fk, fd),
-            border=ft.Border.all(1, ft.Colors.PRIMARY if is_selected else ft.Colors.TRANSPARENT),
+            on_click=self._on_font_tile_click,
             border_radius=BORDER_RADIUS_MEDIUM,
-            bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.PRIMARY) if is_selected else ft.Colors.with_opacity(0.02, ft.Colors.ON_SURFACE),
+            visible=False,
         )
+        return FontTileWidgets(tile=tile, name_text=name_text, sample_text=sample_text, check_icon=check_icon)
+    
+    def _fill_font_tile(self, widgets: FontTileWidgets, font_key: str, font_display: str, current_font: str) -> None:
+        """把字体信息写入复用的字体列表项。
+        
+        Args:
+            widgets: 字体列表项控件集合
+            font_key: 字体键名
+            font_display: 字体显示名
+            current_font: 当前使用的字体键名（由调用方每页读取一次）
+        """
+        is_selected = font_key == current_font
+        style = _FONT_TILE_STYLES[is_selected]
+        
+        widgets.name_text.value = font_display
+        widgets.name_text.weight = style["weight"]
+        widgets.name_text.color = style["color"]
+        widgets.sample_text.font_family = font_key
+        widgets.check_icon.visible = is_selected
+        
+        tile = widgets.tile
+        tile.data = (font_key, font_display)
+        tile.border = ft.Border.all(1, style["border_color"])
+        tile.bgcolor = style["bgcolor"]
+        tile.visible = True
+    
+    def _on_font_tile_click(self, e: ft.ControlEvent) -> None:
+        """字体列表项点击事件：应用该项对应的字体。
+        
+        Args:
+            e: 控件事件对象
+        """
+        if e.control.data:
+            self._apply_font_selection(*e.control.data)
 
     def _open_font_selector_dialog(self, e: ft.ControlEvent) -> None:
         """打开字体选择对话框。
@@ -4575,16 +5557,11 @@ class SettingsView(ft.Container):
         Args:
             e: 控件事件对象
         """
-        # 确保文件选择器在页面overlay中
-        if hasattr(self, 'font_file_picker') and self.font_file_picker not in self._page.overlay:
-            self._page.overlay.append(self.font_file_picker)
-            self._page.update()
-        
         # 搜索框
-        search_field = ft.TextField(
+        search_field = self._font_search_field = ft.TextField(
             hint_text="搜索字体...",
             prefix_icon=ft.Icons.SEARCH,
-            on_change=lambda e: self._filter_font_list(e.control.value),
+            on_change=self._on_font_search_change,
             expand=True,
             height=40,
             content_padding=10,
@@ -4604,14 +5581,24 @@ class SettingsView(ft.Container):
             height=40,
         )
         
+        # 刷新字体列表按钮（重新枚举系统字体）
+        refresh_fonts_btn = ft.IconButton(
+            ft.Icons.REFRESH,
+            tooltip="刷新字体列表",
+            on_click=self._on_refresh_system_fonts,
+        )
+        
         # 初始化分页相关变量
         self.filtered_fonts = self.system_fonts
         self.current_page = 0
         self.PAGE_SIZE = 15  # 每页显示15个字体
         
+        # 字体列表项（每页数量固定，翻页 / 搜索时原地更新内容，不重建控件）
+        self._font_tile_pool = [self._create_font_tile() for _ in range(self.PAGE_SIZE)]
+        
         # 字体列表列
         self.font_list_column = ft.Column(
-            controls=[],
+            controls=[widgets.tile for widgets in self._font_tile_pool],
             spacing=4,
             scroll=ft.ScrollMode.AUTO,
             expand=True,
@@ -4652,6 +5639,9 @@ class SettingsView(ft.Container):
             icon_size=20,
         )
         
+        # 字体数量
+        self._font_count_text = ft.Text(f"共 {len(self.system_fonts)} 个字体", size=12, color=ft.Colors.ON_SURFACE_VARIANT)
+        
         # 字体列表容器
         font_list_container = ft.Container(
             content=self.font_list_column,
@@ -4684,11 +5674,12 @@ class SettingsView(ft.Container):
                         controls=[
                             search_field,
                             import_btn,
+                            refresh_fonts_btn,
                         ],
                         spacing=10,
                     ),
                     ft.Container(height=10),
-                    ft.Text(f"共 {len(self.system_fonts)} 个字体", size=12, color=ft.Colors.ON_SURFACE_VARIANT),
+                    self._font_count_text,
                     ft.Container(height=5),
                     
                     # 列表区域
@@ -4752,24 +5743,30 @@ class SettingsView(ft.Container):
         self.current_page = max(0, total_pages - 1)
         self._update_font_page()
             
-    def _update_font_page(self) -> None:
-        """更新当前页的字体列表。"""
+    def _update_font_page(self, *extra_controls: ft.Control) -> None:
+        """更新当前页的字体列表。
+        
+        Args:
+            *extra_controls: 调用方已修改、需随本次一起推送的其他控件
+        """
         start_index = self.current_page * self.PAGE_SIZE
         end_index = start_index + self.PAGE_SIZE
         
         # 获取当前页的字体
         current_batch = self.filtered_fonts[start_index:end_index]
         
-        # 创建控件
-        new_tiles = [self._create_font_tile(font[0], font[1]) for font in current_batch]
-        self.font_list_column.controls = new_tiles
-        self.font_list_column.update()
+        # 原地更新复用的列表项（当前字体每页只读取一次配置），多余的列表项隐藏
+        current_font = self.config_service.get_config_value("font_family", "System")
+        for index, widgets in enumerate(self._font_tile_pool):
+            if index < len(current_batch):
+                self._fill_font_tile(widgets, *current_batch[index], current_font)
+            else:
+                widgets.tile.visible = False
         
         # 更新分页信息
         total_fonts = len(self.filtered_fonts)
         total_pages = max(1, (total_fonts + self.PAGE_SIZE - 1) // self.PAGE_SIZE)
         self._page_info_text.value = f"{self.current_page + 1} / {total_pages}"
-        self._page_info_text.update()
         
         # 更新按钮状态
         is_first = self.current_page <= 0
@@ -4780,10 +5777,62 @@ class SettingsView(ft.Container):
         self.next_page_btn.disabled = is_last
         self.last_page_btn.disabled = is_last
         
-        self.first_page_btn.update()
-        self.prev_page_btn.update()
-        self.next_page_btn.update()
-        self.last_page_btn.update()
+        # 所有修改完成后一次性推送
+        self._update_controls(
+            self.font_list_column,
+            self._page_info_text,
+            self.first_page_btn,
+            self.prev_page_btn,
+            self.next_page_btn,
+            self.last_page_btn,
+            *extra_controls,
+        )
+    
+    async def _on_refresh_system_fonts(self, e: ft.ControlEvent) -> None:
+        """重新枚举系统字体并刷新对话框中的字体列表。
+        
+        Args:
+            e: 控件事件对象
+        """
+        # 在后台线程重新枚举，等待期间不阻塞事件循环
+        fonts = await asyncio.wrap_future(prefetch_system_fonts(refresh=True))
+        current_font = self.config_service.get_config_value("font_family", "System")
+        self._load_system_fonts(fonts, current_font)
+        
+        self._font_count_text.value = f"共 {len(self.system_fonts)} 个字体"
+        
+        # 清空搜索条件，回到第一页
+        if self._font_search_task:
+            self._font_search_task.cancel()
+            self._font_search_task = None
+        self._font_search_field.value = ""
+        self.filtered_fonts = self.system_fonts
+        self.current_page = 0
+        self._update_font_page(self._font_count_text, self._font_search_field)
+    
+    # 字体搜索防抖等待时间（秒）
+    _FONT_SEARCH_DEBOUNCE = 0.15
+    
+    def _on_font_search_change(self, e: ft.ControlEvent) -> None:
+        """字体搜索输入事件：防抖，连续输入只在停顿后过滤一次。
+        
+        Args:
+            e: 控件事件对象
+        """
+        search_text = e.control.value or ""
+        if self._font_search_task:
+            self._font_search_task.cancel()
+        
+        async def filter_later():
+            await asyncio.sleep(self._FONT_SEARCH_DEBOUNCE)
+            self._font_search_task = None
+            self._filter_font_list(search_text)
+        
+        page = self.active_page
+        if page:
+            self._font_search_task = page.run_task(filter_later)
+        else:
+            self._filter_font_list(search_text)
     
     def _filter_font_list(self, search_text: str) -> None:
         """过滤字体列表。
@@ -4796,12 +5845,23 @@ class SettingsView(ft.Container):
         if not search_text:
             # 显示所有字体
             self.filtered_fonts = self.system_fonts
+            self._font_search_cache = ("", None)
         else:
+            # 新关键字包含上次关键字时（继续输入），匹配结果必然是上次结果的子集，只需在其中筛选
+            last_text, last_indices = self._font_search_cache
+            if last_indices is not None and last_text in search_text:
+                candidates = last_indices
+            else:
+                candidates = range(len(self.system_fonts))
+            
             # 根据搜索文本过滤
-            self.filtered_fonts = [
-                font for font in self.system_fonts
-                if search_text in font[0].lower() or search_text in font[1].lower()
+            fonts_lower = self._system_fonts_lower
+            indices = [
+                i for i in candidates
+                if search_text in fonts_lower[i][0] or search_text in fonts_lower[i][1]
             ]
+            self._font_search_cache = (search_text, indices)
+            self.filtered_fonts = [self.system_fonts[i] for i in indices]
         
         # 重置到第一页
         self.current_page = 0
@@ -4853,18 +5913,31 @@ class SettingsView(ft.Container):
         )
         if result and len(result) > 0:
             file_path = result[0].path
-            self._load_custom_font_file(file_path)
+            await self._load_custom_font_file(file_path)
+    
+    @staticmethod
+    def _copy_font_file(font_file: Path, custom_fonts_dir: Path) -> Path:
+        """创建自定义字体目录并复制字体文件（阻塞操作，在 I/O 线程池中执行）。
+        
+        Args:
+            font_file: 源字体文件
+            custom_fonts_dir: 自定义字体目录
+        
+        Returns:
+            复制后的字体文件路径
+        """
+        custom_fonts_dir.mkdir(parents=True, exist_ok=True)
+        dest_font_file = custom_fonts_dir / font_file.name
+        shutil.copy2(font_file, dest_font_file)
+        return dest_font_file
     
-    def _load_custom_font_file(self, file_path: str) -> None:
+    async def _load_custom_font_file(self, file_path: str) -> None:
         """加载自定义字体文件。
         
         Args:
             file_path: 字体文件路径
         """
         try:
-            from pathlib import Path
-            import shutil
-            
             font_file = Path(file_path)
             if not font_file.exists():
                 self._show_snackbar("字体文件不存在", ft.Colors.RED)
@@ -4873,15 +5946,10 @@ class SettingsView(ft.Container):
             # 获取字体文件名（不含扩展名）
             font_name = font_file.stem
             
-            # 创建自定义字体目录
-            # 将字体文件保存在数据目录下的 custom_fonts 子目录中
+            # 将字体文件复制到数据目录下的 custom_fonts 子目录中
+            # 大字体文件（如 .ttc）复制较慢，放到 I/O 线程池执行，避免阻塞界面
             data_dir = self.config_service.get_data_dir()
-            custom_fonts_dir = data_dir / "custom_fonts"
-            custom_fonts_dir.mkdir(parents=True, exist_ok=True)
-            
-            # 复制字体文件到自定义字体目录
-            dest_font_file = custom_fonts_dir / font_file.name
-            shutil.copy2(font_file, dest_font_file)
+            dest_font_file = await _run_io(self._copy_font_file, font_file, data_dir / "custom_fonts")
             
             # 保存字体文件路径到配置
             self.config_service.set_config_value("custom_font_file", str(dest_font_file))
@@ -4936,25 +6004,51 @@ class SettingsView(ft.Container):
             self._show_snackbar("字体更新失败", ft.Colors.RED)
     
     def _on_font_scale_change(self, e: ft.ControlEvent) -> None:
-        """字体大小更改事件处理。
+        """字体大小拖动事件：更新显示并节流预览，不写配置。
         
         Args:
             e: 控件事件对象
         """
         scale_percent = int(e.control.value)
-        scale = scale_percent / 100.0
+        if scale_percent == self._font_scale_pct:
+            return
+        self._font_scale_pct = scale_percent
         
         # 更新文本显示
         self.font_scale_text.value = f"字体大小: {scale_percent}%"
         self.font_scale_text.update()
         
+        self._throttled("font_scale", lambda: self._apply_font_preview_scale(scale_percent / 100.0))
+    
+    def _apply_font_preview_scale(self, scale: float) -> None:
+        """按缩放比例更新预览文本大小。
+        
+        Args:
+            scale: 字体缩放比例
+        """
+        base_size = 16
+        new_size = int(base_size * scale)
+        if self.font_preview_text.size == new_size:
+            return
+        self.font_preview_text.size = new_size
+        self.font_preview_text.update()
+    
+    def _on_font_scale_change_end(self, e: ft.ControlEvent) -> None:
+        """字体大小拖动结束事件：应用最终值并保存配置。
+        
+        Args:
+            e: 控件事件对象
+        """
+        scale_percent = int(e.control.value)
+        if scale_percent == self._saved_font_scale_pct:
+            return
+        scale = scale_percent / 100.0
+        
         # 保存字体大小设置
         if self.config_service.set_config_value("font_scale", scale):
+            self._saved_font_scale_pct = scale_percent
             # 更新预览文本大小
-            base_size = 16
-            new_size = int(base_size * scale)
-            self.font_preview_text.size = new_size
-            self.font_preview_text.update()
+            self._apply_font_preview_scale(scale)
             
             self._show_snackbar(f"字体大小已设置为 {scale_percent}%，重启应用后完全生效", ft.Colors.GREEN)
         else:
@@ -4966,8 +6060,6 @@ class SettingsView(ft.Container):
         Args:
             e: 控件事件对象
         """
-        from constants import WINDOW_WIDTH, WINDOW_HEIGHT
-        
         # 清除保存的窗口位置、大小和最大化状态
         self.config_service.set_config_value("window_left", None)
         self.config_service.set_config_value("window_top", None)
@@ -4994,8 +6086,6 @@ class SettingsView(ft.Container):
         Args:
             e: 控件事件对象
         """
-        from utils.file_utils import create_desktop_shortcut
-        
         # 调用工具函数创建快捷方式
         success, message = create_desktop_shortcut()
         
@@ -5010,27 +6100,17 @@ class SettingsView(ft.Container):
             message: 消息内容
             color: 消息颜色
         """
+        # 使用保存的页面引用作为回退（有时候 self._page 在后台线程中为 None）
+        page = self.active_page
+        if not page:
+            return
         try:
-            snackbar: ft.SnackBar = ft.SnackBar(
+            page.show_dialog(ft.SnackBar(
                 content=ft.Text(message),
                 bgcolor=color,
                 duration=2000,
-            )
-            # 使用保存的页面引用作为回退（有时候 self._page 在后台线程中为 None）
-            page = getattr(self, '_saved_page', None) or getattr(self, 'page', None)
-            if not page:
-                return
-            # 显示 snackbar
-            try:
-                page.show_dialog(snackbar)
-            except Exception:
-                # 如果 overlay 不可用或在后台线程中引发错误，则尝试安全地设置一个简单替代：
-                # 将消息打印到控制台（避免抛出未捕获异常）
-                logger.error(f"Snackbar show failed: {message}")
+            ))
         except Exception:
-            # 最后兜底，避免线程未捕获异常终止程序
-            try:
-                logger.error(f"_show_snackbar error: {message}")
-            except Exception:
-                pass
+            # 会话已关闭等情况下无法显示，只记录消息，避免抛出未捕获异常
+            logger.error(f"Snackbar show failed: {message}")
 